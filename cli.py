@@ -137,7 +137,7 @@ def sync(
         if dry_run:
             console.print("[yellow]⚠️ Modo simulação ativado - nenhum upload será realizado[/yellow]")
         
-        logger.info(f"[DEBUG] Prestes a chamar asyncio.run com mapping_names: {mappings}, all_mappings: {all_mappings}")
+        logger.debug("Prestes a chamar asyncio.run com mapping_names: %s, all_mappings: %s", mappings, all_mappings)
         
         results = asyncio.run(run_sync_command(
             mapping_names=mappings,
@@ -148,7 +148,7 @@ def sync(
             config=config
         ))
         
-        logger.info(f"[DEBUG] asyncio.run retornou com {len(results)} resultados")
+        logger.debug("asyncio.run retornou com %d resultados", len(results))
         
         # Exibir resultados
         console.print(format_sync_results(results))
@@ -0,0 +1,10 @@
+"""
+Utilitários de compatibilidade entre versões do Python.
+"""
+
+import sys
+
+
+# dataclass(slots=True) só existe a partir do Python 3.10; em versões
+# anteriores as dataclasses continuam funcionando com __dict__.
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
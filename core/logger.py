@@ -5,8 +5,10 @@ Permite ativar debug via variável de ambiente BRIDGE_DEBUG.
 
 import logging
 import os
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 
 class BridgeLogger:
@@ -112,5 +114,24 @@ class BridgeLogger:
         return self._logger and self._logger.level == logging.DEBUG
 
 
+@contextmanager
+def log_phase(log: logging.Logger, phase: str) -> Iterator[None]:
+    """
+    Registra em DEBUG uma única linha com a duração de uma etapa, no lugar
+    do par "iniciado"/"concluído". Sem custo quando DEBUG está desativado.
+    
+    Args:
+        log: Logger de destino
+        phase: Nome da etapa
+    """
+    if not log.isEnabledFor(logging.DEBUG):
+        yield
+        return
+    
+    start = time.perf_counter()
+    yield
+    log.debug("⏱️ %s: %.1f ms", phase, (time.perf_counter() - start) * 1000)
+
+
 # Instância global do logger
 logger = BridgeLogger()
\ No newline at end of file
@@ -15,6 +15,7 @@ from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, asdict
 
 from .timeutil import get_current_timestamp, timestamp_to_iso
+from .logger import log_phase
 from .paths import get_default_paths
 
 
@@ -131,46 +132,37 @@ class MappingStateStore:
     
     def _save_states(self) -> None:
         """Salva os estados no arquivo."""
-        import logging
         logger = logging.getLogger(__name__)
         
-        logger.info(f"[DEBUG] _save_states iniciado")
-        
         # Garante que o diretório pai existe
-        logger.info(f"[DEBUG] Criando diretório pai: {self.state_file.parent}")
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
-        logger.info(f"[DEBUG] Diretório pai criado com sucesso")
         
         try:
-            logger.info(f"[DEBUG] Convertendo estados para dict...")
-            data = {name: state.to_dict() for name, state in self._states.items()}
-            logger.info(f"[DEBUG] Estados convertidos: {len(data)} itens")
-            
-            logger.info(f"[DEBUG] Abrindo arquivo para escrita: {self.state_file}")
-            with open(self.state_file, 'w', encoding='utf-8') as f:
-                logger.info(f"[DEBUG] Arquivo aberto, salvando JSON...")
-                json.dump(data, f, indent=2, ensure_ascii=False)
-                logger.info(f"[DEBUG] JSON salvo com sucesso")
+            with log_phase(logger, "_save_states"):
+                data = {name: state.to_dict() for name, state in self._states.items()}
+                with open(self.state_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
         
         except Exception as e:
-            logger.error(f"[DEBUG] Erro ao salvar estados: {e}")
+            logger.error("Erro ao salvar estados: %s", e)
             print(f"Erro ao salvar estados: {e}")
-        
-        logger.info(f"[DEBUG] _save_states concluído")
     
-    def _get_state_unsafe(self, mapping_name: str) -> MappingState:
+    def _get_state_unsafe(self, mapping_name: str, save_new: bool = True) -> MappingState:
         """
         Obtém o estado de um mapeamento sem adquirir lock (uso interno).
         
         Args:
             mapping_name: Nome do mapeamento
+            save_new: Se deve salvar imediatamente um estado recém-criado
+                (False quando o chamador já vai salvar em seguida)
             
         Returns:
             MappingState: Estado do mapeamento
         """
         if mapping_name not in self._states:
             self._states[mapping_name] = MappingState(mapping_name=mapping_name)
-            self._save_states()
+            if save_new:
+                self._save_states()
         
         return self._states[mapping_name]
     
@@ -206,22 +198,29 @@ class MappingStateStore:
         Args:
             mapping_name: Nome do mapeamento
         """
-        import logging
-        logger = logging.getLogger(__name__)
-        
-        logger.info(f"[DEBUG] MappingStateStore.start_sync iniciado para: {mapping_name}")
-        logger.info(f"[DEBUG] Tentando adquirir lock...")
-        
         with self._lock:
-            logger.info(f"[DEBUG] Lock adquirido, chamando _get_state_unsafe...")
-            state = self._get_state_unsafe(mapping_name)
-            logger.info(f"[DEBUG] _get_state_unsafe retornou, chamando state.start_sync...")
+            state = self._get_state_unsafe(mapping_name, save_new=False)
             state.start_sync()
-            logger.info(f"[DEBUG] state.start_sync concluído, chamando _save_states...")
             self._save_states()
-            logger.info(f"[DEBUG] _save_states concluído")
+    
+    def finish_sync(self, mapping_name: str, records_processed: int = 0,
+                    success: bool = True, error_message: Optional[str] = None) -> None:
+        """
+        Marca o fim de uma sincronização, com uma única escrita do arquivo de estados.
         
-        logger.info(f"[DEBUG] MappingStateStore.start_sync concluído")
+        Args:
+            mapping_name: Nome do mapeamento
+            records_processed: Número de registros processados (usado em caso de sucesso)
+            success: Se a sincronização foi bem-sucedida
+            error_message: Mensagem de erro (usada em caso de falha)
+        """
+        with self._lock:
+            state = self._get_state_unsafe(mapping_name, save_new=False)
+            if success:
+                state.update_sync_success(records_processed)
+            else:
+                state.update_sync_error(error_message)
+            self._save_states()
     
     def finish_sync_success(self, mapping_name: str, records_processed: int) -> None:
         """
@@ -231,10 +230,7 @@ class MappingStateStore:
             mapping_name: Nome do mapeamento
             records_processed: Número de registros processados
         """
-        with self._lock:
-            state = self._get_state_unsafe(mapping_name)
-            state.update_sync_success(records_processed)
-            self._save_states()
+        self.finish_sync(mapping_name, records_processed, success=True)
     
     def finish_sync_error(self, mapping_name: str, error_message: str) -> None:
         """
@@ -244,10 +240,7 @@ class MappingStateStore:
             mapping_name: Nome do mapeamento
             error_message: Mensagem de erro
         """
-        with self._lock:
-            state = self._get_state_unsafe(mapping_name)
-            state.update_sync_error(error_message)
-            self._save_states()
+        self.finish_sync(mapping_name, success=False, error_message=error_message)
     
     def get_all_states(self) -> Dict[str, MappingState]:
         """
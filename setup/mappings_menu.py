@@ -7,7 +7,7 @@ from datetime import datetime
 
 from core.logger import logger
 from core.paths import get_bridge_config_dir
-from core.datasources_store import DataSourcesStore
+from core.datasources_store import datasources_store
 from core.secrets_store import secrets_store
 from core.http import http_client
 from core.database_connector import create_database_connector
@@ -51,8 +51,7 @@ def run_mappings_menu() -> None:
 def _select_datasource() -> Optional[Dict[str, Any]]:
     """Seleciona uma fonte de dados"""
     try:
-        store = DataSourcesStore()
-        datasources = store.list_datasources()
+        datasources = datasources_store.list_datasources()
         
         if not datasources:
             show_error_message("Nenhuma fonte de dados encontrada. Configure uma fonte primeiro.")
@@ -0,0 +1,264 @@
+"""
+Pool de conexões para os extratores de banco de dados.
+
+Mantém conexões ociosas por fonte (driver, host, porta, banco, usuário) para que
+extrações seguidas reaproveitem a conexão em vez de pagar TCP + autenticação a
+cada execução. Conexões ociosas há muito tempo são fechadas por uma thread de
+limpeza, e todos os pools são fechados ao encerrar o processo.
+"""
+
+import atexit
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Hashable, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# Padrões de dimensionamento
+DEFAULT_POOL_MAX = 25
+DEFAULT_IDLE_TIMEOUT = 300.0
+DEFAULT_ACQUIRE_TIMEOUT = 30.0
+# Conexões ociosas há mais tempo que isso são validadas antes de reutilizar
+VALIDATE_AFTER_SECONDS = 30.0
+# Intervalo da thread de limpeza de conexões ociosas
+REAPER_INTERVAL_SECONDS = 60.0
+
+
+def _close_quietly(connection: Any) -> None:
+    """Fecha uma conexão ignorando erros (ex.: conexão já derrubada pelo servidor)."""
+    try:
+        connection.close()
+    except Exception as e:
+        logger.debug("Erro ao fechar conexão do pool: %s", e)
+
+
+class ConnectionPool:
+    """Pool de conexões thread-safe baseado em fila (LIFO) com limite de tamanho."""
+
+    def __init__(self, factory: Callable[[], Any],
+                 max_size: int = DEFAULT_POOL_MAX,
+                 idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+                 validate: Optional[Callable[[Any], bool]] = None):
+        """
+        Inicializa o pool.
+
+        Args:
+            factory: Função que abre uma nova conexão
+            max_size: Número máximo de conexões abertas (ociosas + emprestadas)
+            idle_timeout: Segundos até uma conexão ociosa ser fechada
+            validate: Função que verifica se uma conexão ociosa ainda está viva
+        """
+        self._factory = factory
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._validate = validate
+        self._idle: Deque[Tuple[Any, float]] = deque()
+        self._size = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def acquire(self, timeout: float = DEFAULT_ACQUIRE_TIMEOUT) -> Any:
+        """
+        Obtém uma conexão ociosa ou abre uma nova se houver espaço no pool.
+
+        Args:
+            timeout: Tempo máximo de espera por uma conexão livre
+
+        Returns:
+            Conexão pronta para uso
+
+        Raises:
+            TimeoutError: Se nenhuma conexão ficar livre a tempo
+            RuntimeError: Se o pool já foi fechado
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            connection = None
+            released_at = 0.0
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Pool de conexões fechado")
+                    if self._idle:
+                        connection, released_at = self._idle.pop()
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(f"Nenhuma conexão livre no pool após {timeout}s")
+                    self._cond.wait(remaining)
+
+            if connection is None:
+                try:
+                    return self._factory()
+                except BaseException:
+                    self._forget()
+                    raise
+
+            if (self._validate is not None
+                    and time.monotonic() - released_at > VALIDATE_AFTER_SECONDS
+                    and not self._is_alive(connection)):
+                logger.debug("🔌 Conexão ociosa inválida descartada do pool")
+                _close_quietly(connection)
+                self._forget()
+                continue
+
+            return connection
+
+    def release(self, connection: Any) -> None:
+        """
+        Devolve uma conexão ao pool, encerrando a transação pendente.
+
+        Args:
+            connection: Conexão obtida por acquire()
+        """
+        try:
+            connection.rollback()
+        except Exception as e:
+            logger.debug("Conexão descartada ao devolver ao pool: %s", e)
+            _close_quietly(connection)
+            self._forget()
+            return
+
+        with self._cond:
+            if not self._closed:
+                self._idle.append((connection, time.monotonic()))
+                self._cond.notify()
+                return
+
+        _close_quietly(connection)
+        self._forget()
+
+    def discard(self, connection: Any) -> None:
+        """
+        Fecha uma conexão emprestada sem devolvê-la ao pool (ex.: após erro fatal).
+
+        Args:
+            connection: Conexão obtida por acquire()
+        """
+        _close_quietly(connection)
+        self._forget()
+
+    def reap_idle(self) -> int:
+        """
+        Fecha conexões ociosas há mais de idle_timeout segundos.
+
+        Returns:
+            Número de conexões fechadas
+        """
+        cutoff = time.monotonic() - self.idle_timeout
+        expired = []
+        with self._cond:
+            # As mais antigas ficam à esquerda (devolução sempre à direita)
+            while self._idle and self._idle[0][1] < cutoff:
+                expired.append(self._idle.popleft()[0])
+            self._size -= len(expired)
+            if expired:
+                self._cond.notify(len(expired))
+
+        for connection in expired:
+            _close_quietly(connection)
+        return len(expired)
+
+    def close(self) -> None:
+        """Fecha as conexões ociosas; as emprestadas são fechadas ao serem devolvidas."""
+        with self._cond:
+            self._closed = True
+            idle = [connection for connection, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._cond.notify_all()
+
+        for connection in idle:
+            _close_quietly(connection)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Retorna o estado atual do pool.
+
+        Returns:
+            Dicionário com conexões abertas, ociosas e emprestadas
+        """
+        with self._cond:
+            return {
+                'size': self._size,
+                'idle': len(self._idle),
+                'in_use': self._size - len(self._idle),
+                'max_size': self.max_size,
+            }
+
+    def _is_alive(self, connection: Any) -> bool:
+        try:
+            return bool(self._validate(connection))
+        except Exception:
+            return False
+
+    def _forget(self) -> None:
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+
+
+_pools: Dict[Hashable, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+_reaper_thread: Optional[threading.Thread] = None
+_reaper_stop = threading.Event()
+
+
+def _reaper_loop() -> None:
+    """Fecha periodicamente as conexões ociosas de todos os pools."""
+    while not _reaper_stop.wait(REAPER_INTERVAL_SECONDS):
+        with _pools_lock:
+            pools = list(_pools.values())
+        for pool in pools:
+            closed = pool.reap_idle()
+            if closed:
+                logger.debug("🧹 %s conexões ociosas fechadas pelo pool", closed)
+
+
+def get_connection_pool(key: Hashable, factory: Callable[[], Any],
+                        max_size: int = DEFAULT_POOL_MAX,
+                        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+                        validate: Optional[Callable[[Any], bool]] = None) -> ConnectionPool:
+    """
+    Obtém (ou cria) o pool compartilhado de uma fonte de dados.
+
+    Args:
+        key: Identificação da fonte (driver, host, porta, banco, usuário)
+        factory: Função que abre uma nova conexão para a fonte
+        max_size: Número máximo de conexões abertas
+        idle_timeout: Segundos até uma conexão ociosa ser fechada
+        validate: Função que verifica se uma conexão ociosa ainda está viva
+
+    Returns:
+        Pool de conexões da fonte
+    """
+    global _reaper_thread
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ConnectionPool(factory, max_size=max_size,
+                                  idle_timeout=idle_timeout, validate=validate)
+            _pools[key] = pool
+        if _reaper_thread is None:
+            _reaper_thread = threading.Thread(target=_reaper_loop, name="bridge-pool-reaper", daemon=True)
+            _reaper_thread.start()
+        return pool
+
+
+def close_all_pools() -> None:
+    """Fecha todos os pools de conexão (chamado automaticamente ao sair)."""
+    _reaper_stop.set()
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_all_pools)
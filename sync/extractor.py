@@ -3,35 +3,29 @@ Módulo para extração de dados das fontes.
 Suporta diferentes tipos de fontes de dados (SQL Server, PostgreSQL, MySQL, SQLite, etc.).
 """
 
+import asyncio
+import functools
+import io
+import itertools
 import json
 import logging
 import os
+import queue
 import re
-from typing import Dict, Any, List, Iterator, Optional, Tuple
+import socket
+import threading
+from collections.abc import Mapping
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
+from typing import Dict, Any, Callable, List, Iterator, Optional, Sequence, Tuple
 from pathlib import Path
 from dataclasses import dataclass
 import time
 from abc import ABC, abstractmethod
+from datetime import date, datetime, time as dt_time
+from decimal import Decimal
 
-# Importações condicionais para drivers de banco
-try:
-    import pyodbc
-    PYODBC_AVAILABLE = True
-except ImportError:
-    PYODBC_AVAILABLE = False
-
-try:
-    import psycopg2
-    import psycopg2.extras
-    PSYCOPG2_AVAILABLE = True
-except ImportError:
-    PSYCOPG2_AVAILABLE = False
-
-try:
-    import pymysql
-    PYMYSQL_AVAILABLE = True
-except ImportError:
-    PYMYSQL_AVAILABLE = False
+# Drivers de rede (pyodbc, psycopg2, pymysql) são importados sob demanda em
+# _pyodbc()/_psycopg2()/_pymysql(): comandos que não usam um banco não pagam o import.
 
 try:
     import sqlite3
@@ -40,13 +34,233 @@ except ImportError:
     SQLITE3_AVAILABLE = False
 
 from core.timeutil import get_current_timestamp, format_duration
-from core.datasources_store import DataSourcesStore
+from core.datasources_store import datasources_store
+from core.compat import DATACLASS_SLOTS
+from sync.connection_pool import (
+    DEFAULT_IDLE_TIMEOUT,
+    DEFAULT_POOL_MAX,
+    get_connection_pool,
+)
+from sync.serialization import dumps_record
 
 
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=None)
+def _pyodbc() -> Optional[Any]:
+    """
+    Importa pyodbc na primeira utilização.
+    
+    Returns:
+        Módulo pyodbc ou None se não estiver instalado
+    """
+    try:
+        import pyodbc
+    except ImportError:
+        return None
+    # Pool de conexões do driver manager ODBC (deve ser definido antes do primeiro connect)
+    pyodbc.pooling = True
+    return pyodbc
+
+
+@functools.lru_cache(maxsize=None)
+def _psycopg2() -> Optional[Any]:
+    """
+    Importa psycopg2 (com psycopg2.extras) na primeira utilização.
+    
+    Returns:
+        Módulo psycopg2 ou None se não estiver instalado
+    """
+    try:
+        import psycopg2
+        import psycopg2.extras
+    except ImportError:
+        return None
+    return psycopg2
+
+
+@functools.lru_cache(maxsize=None)
+def _connectorx() -> Optional[Any]:
+    """
+    Importa connectorx (leitura colunar em Rust, opcional) na primeira utilização.
+    
+    Returns:
+        Módulo connectorx ou None se não estiver instalado
+    """
+    try:
+        import connectorx
+    except ImportError:
+        return None
+    return connectorx
+
+
+@functools.lru_cache(maxsize=None)
+def _pymysql() -> Optional[Any]:
+    """
+    Importa pymysql (com pymysql.cursors) na primeira utilização.
+    
+    Returns:
+        Módulo pymysql ou None se não estiver instalado
+    """
+    try:
+        import pymysql
+        import pymysql.cursors
+    except ImportError:
+        return None
+    return pymysql
+
+
+# Pool de threads compartilhado para extrações concorrentes (I/O de rede)
+EXTRACTION_MAX_WORKERS = 8
+_extraction_executor: Optional[ThreadPoolExecutor] = None
+_extraction_executor_lock = threading.Lock()
+
+# Intervalo (em lotes) entre logs de progresso da extração
+PROGRESS_LOG_EVERY_BATCHES = 50
+
+# Sequência para nomes únicos de cursores no servidor (PostgreSQL)
+_server_cursor_ids = itertools.count(1)
 
-def _resolve_source_config(mapping_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+# Marcador de fim de fluxo da thread produtora de lotes
+_BATCH_SENTINEL = object()
+
+# Portas padrão usadas no teste de alcance TCP
+_DEFAULT_PORTS = {
+    'sqlserver': 1433,
+    'postgresql': 5432,
+    'mysql': 3306,
+}
+
+# Tipos que já são serializáveis e dispensam conversão (evita hasattr por célula)
+_PASSTHROUGH_TYPES = frozenset((type(None), bool, int, float, str, Decimal))
+
+# OIDs do PostgreSQL cujos valores o psycopg2 entrega como tipos serializáveis:
+# bool, char, name, int8, int2, int4, text, oid, float4, float8, bpchar, varchar, numeric
+_PG_PASSTHROUGH_OIDS = frozenset((16, 18, 19, 20, 21, 23, 25, 26, 700, 701, 1042, 1043, 1700))
+
+# OIDs de bytea e bytea[] no PostgreSQL (sem equivalente no COPY com row_to_json)
+_PG_BYTEA_OIDS = frozenset((17, 1001))
+
+# FIELD_TYPE do MySQL cujos valores o pymysql entrega como tipos serializáveis:
+# DECIMAL, TINY, SHORT, LONG, FLOAT, DOUBLE, NULL, LONGLONG, INT24, YEAR, JSON, NEWDECIMAL
+_MYSQL_PASSTHROUGH_TYPES = frozenset((0, 1, 2, 3, 4, 5, 6, 8, 9, 13, 245, 246))
+
+
+def _datasources_file_mtime() -> Optional[int]:
+    """
+    Obtém a data de modificação do arquivo de datasources criptografado.
+    
+    Returns:
+        mtime em nanossegundos ou None se o arquivo não existir
+    """
+    try:
+        return os.stat(datasources_store.get_datasources_file_path()).st_mtime_ns
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=4)
+def _load_datasources_indexed(mtime_ns: Optional[int]) -> Dict[str, Any]:
+    """
+    Carrega as datasources criptografadas (store global) e indexa por nome.
+    
+    O cache é chaveado pelo mtime do arquivo: edições invalidam automaticamente.
+    
+    Args:
+        mtime_ns: Data de modificação do arquivo de datasources (chave de cache)
+        
+    Returns:
+        Dicionário nome -> DataSource
+    """
+    return {datasource.name: datasource for datasource in datasources_store.load()}
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class ResolvedSourceConfig(Mapping):
+    """
+    Configuração imutável de uma fonte de banco resolvida a partir do store.
+    
+    Implementa a interface de Mapping (get, [], in) para que os extratores a
+    usem como as configurações em dicionário vindas do próprio mapeamento;
+    campos opcionais vazios ficam de fora, como no dicionário equivalente.
+    """
+    type: str
+    host: str
+    port: int
+    database: str
+    username: str
+    password: str
+    driver: Optional[str] = None
+    schema: Optional[str] = None
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in _RESOLVED_CONFIG_FIELDS:
+            value = getattr(self, key)
+            if value is not None or key not in _RESOLVED_CONFIG_OPTIONAL:
+                return value
+        raise KeyError(key)
+    
+    def __iter__(self) -> Iterator[str]:
+        return (key for key in _RESOLVED_CONFIG_FIELDS
+                if key not in _RESOLVED_CONFIG_OPTIONAL or getattr(self, key) is not None)
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+_RESOLVED_CONFIG_FIELDS = ('type', 'host', 'port', 'database', 'username', 'password', 'driver', 'schema')
+_RESOLVED_CONFIG_OPTIONAL = frozenset(('driver', 'schema'))
+
+
+@functools.lru_cache(maxsize=64)
+def _resolved_source_config(connection_ref: str, mtime_ns: Optional[int]) -> Optional[ResolvedSourceConfig]:
+    """
+    Obtém a configuração resolvida de uma datasource de banco, memoizada por nome.
+    
+    Args:
+        connection_ref: Nome da datasource
+        mtime_ns: Data de modificação do arquivo de datasources (chave de cache)
+        
+    Returns:
+        Configuração da fonte ou None se a datasource não existir
+    """
+    datasource = _load_datasources_indexed(mtime_ns).get(connection_ref)
+    if datasource is None:
+        return None
+    conn = datasource.conn
+    return ResolvedSourceConfig(
+        type=datasource.type,
+        host=conn.host,
+        port=conn.port,
+        database=conn.database,
+        username=conn.user,
+        password=conn.password,
+        driver=getattr(conn, 'driver', None) or None,
+        schema=getattr(conn, 'schema', None) or None,
+    )
+
+
+def _datasource_to_source_config(datasource) -> Dict[str, Any]:
+    """
+    Converte uma datasource laravel_log na configuração usada pelo leitor de log.
+    
+    Fica em dicionário mutável: a leitura registra o novo offset na própria configuração.
+    
+    Args:
+        datasource: DataSource carregada do store
+        
+    Returns:
+        Configuração da fonte de dados
+    """
+    options = datasource.conn.options or {}
+    return {
+        'type': 'laravel_log',
+        'path': options.get('log_path'),
+        'max_memory_mb': int(options.get('max_memory_mb', 50))
+    }
+
+
+def _resolve_source_config(mapping_config: Dict[str, Any]) -> Optional[Mapping]:
     """
     Resolve a configuração da fonte de dados usando connection_ref.
     
@@ -64,43 +278,38 @@ def _resolve_source_config(mapping_config: Dict[str, Any]) -> Optional[Dict[str,
             # Se não há connection_ref, assume que a configuração já está completa
             return source
         
-        # Carrega as datasources
-        datasources_store = DataSourcesStore()
-        datasources = datasources_store.load()
-        
-        # Procura pela datasource com o nome correspondente
-        for datasource in datasources:
-            if datasource.name == connection_ref:
-                if datasource.type == 'laravel_log':
-                    options = datasource.conn.options or {}
-                    config = {
-                        'type': 'laravel_log',
-                        'path': options.get('log_path'),
-                        'max_memory_mb': int(options.get('max_memory_mb', 50))
-                    }
-                    return config
-                config = {
-                    'type': datasource.type,
-                    'host': datasource.conn.host,
-                    'port': datasource.conn.port,
-                    'database': datasource.conn.database,
-                    'username': datasource.conn.user,
-                    'password': datasource.conn.password
-                }
-                if hasattr(datasource.conn, 'driver') and datasource.conn.driver:
-                    config['driver'] = datasource.conn.driver
-                if hasattr(datasource.conn, 'schema') and datasource.conn.schema:
-                    config['schema'] = datasource.conn.schema
-                return config
+        # Procura pela datasource (cache invalidado quando o arquivo muda)
+        mtime_ns = _datasources_file_mtime()
+        datasource = _load_datasources_indexed(mtime_ns).get(connection_ref)
+        if datasource is not None:
+            if datasource.type == 'laravel_log':
+                return _datasource_to_source_config(datasource)
+            return _resolved_source_config(connection_ref, mtime_ns)
         
         # Se não encontrou a datasource, tenta carregar de arquivo não criptografado
         return _load_unencrypted_datasource(connection_ref)
         
     except Exception as e:
-        logger.error(f"Erro ao resolver configuração da fonte: {e}")
+        logger.error("Erro ao resolver configuração da fonte: %s", e)
         return None
 
 
+@functools.lru_cache(maxsize=32)
+def _read_unencrypted_datasource(datasource_file: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Lê um arquivo JSON de datasource; o cache é invalidado quando o mtime muda.
+    
+    Args:
+        datasource_file: Caminho do arquivo
+        mtime_ns: Data de modificação do arquivo (chave de cache)
+        
+    Returns:
+        Configuração da datasource
+    """
+    with open(datasource_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 def _load_unencrypted_datasource(datasource_name: str) -> Optional[Dict[str, Any]]:
     """
     Carrega uma datasource de um arquivo JSON não criptografado.
@@ -112,24 +321,36 @@ def _load_unencrypted_datasource(datasource_name: str) -> Optional[Dict[str, Any
         Configuração da datasource ou None se não encontrada
     """
     try:
-        from pathlib import Path
-        
         # Tenta carregar de arquivo JSON não criptografado
         datasources_dir = Path('.bridge/datasources')
         datasource_file = datasources_dir / f"{datasource_name}.json"
         
-        if datasource_file.exists():
-            with open(datasource_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+        try:
+            mtime_ns = datasource_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
         
-        return None
+        # Cópia rasa: a configuração pode ser alterada pelo chamador (ex.: laravel_log)
+        return dict(_read_unencrypted_datasource(str(datasource_file), mtime_ns))
         
     except Exception as e:
-        logger.error(f"Erro ao carregar datasource não criptografada: {e}")
+        logger.error("Erro ao carregar datasource não criptografada: %s", e)
         return None
 
 
-@dataclass
+def clear_source_config_cache() -> None:
+    """
+    Invalida o cache de datasources usado por _resolve_source_config.
+    
+    Os caches já são invalidados pelo mtime dos arquivos; esta função força a
+    releitura (ex.: início de cada execução de sincronização).
+    """
+    _load_datasources_indexed.cache_clear()
+    _resolved_source_config.cache_clear()
+    _read_unencrypted_datasource.cache_clear()
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ExtractionResult:
     """Resultado de uma operação de extração."""
     success: bool
@@ -137,8 +358,8 @@ class ExtractionResult:
     data: List[Dict[str, Any]] = None
     error_message: str = None
     extraction_time: float = 0.0
-    start_time: str = None
-    end_time: str = None
+    start_time: Optional[int] = None
+    end_time: Optional[int] = None
 
 
 @dataclass
@@ -150,10 +371,65 @@ class DeletionResult:
     deletion_time: float = 0.0
 
 
-def _format_order_by(order_by: Optional[str], default_column: Optional[str]) -> str:
+# Coluna auxiliar com o total de linhas (COUNT(*) OVER()), removida dos registros
+TOTAL_COLUMN = '_bridge_total'
+
+# Sufixo dos tipos de fonte lidos via ConnectorX (ex.: postgresql_cx)
+_CX_SUFFIX = '_cx'
+
+
+def _base_source_type(source_type: Optional[str]) -> str:
+    """
+    Obtém o dialeto SQL de um tipo de fonte, sem o sufixo do ConnectorX.
+    
+    Args:
+        source_type: Tipo da fonte (ex.: postgresql, postgresql_cx)
+        
+    Returns:
+        Tipo da fonte em minúsculas sem o sufixo
+    """
+    source_type = (source_type or '').lower()
+    if source_type.endswith(_CX_SUFFIX):
+        return source_type[:-len(_CX_SUFFIX)]
+    return source_type
+
+
+# Delimitadores de identificador por dialeto: (abertura, fechamento)
+_IDENTIFIER_QUOTES = {
+    'mysql': ('`', '`'),
+    'postgresql': ('"', '"'),
+    'sqlite': ('"', '"'),
+    'sqlserver': ('[', ']'),
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _quote_identifier(identifier: str, source_type: Optional[str] = None) -> str:
+    """
+    Delimita um identificador (tabela/coluna) conforme o dialeto da fonte.
+    
+    Nomes qualificados (schema.tabela) têm cada parte delimitada separadamente,
+    e o caractere de fechamento é duplicado dentro do nome.
+    
+    Args:
+        identifier: Nome da tabela ou coluna
+        source_type: Tipo da fonte (mysql, postgresql, sqlite, sqlserver); crase por padrão
+        
+    Returns:
+        Identificador delimitado (memoizado: os mesmos nomes se repetem a cada mapeamento)
+    """
+    opening, closing = _IDENTIFIER_QUOTES.get(_base_source_type(source_type), ('`', '`'))
+    return '.'.join(
+        f"{opening}{part.replace(closing, closing * 2)}{closing}"
+        for part in str(identifier).split('.')
+    )
+
+
+def _format_order_by(order_by: Optional[str], default_column: Optional[str],
+                     source_type: Optional[str] = None) -> str:
     """Retorna a cláusula ORDER BY normalizada.
     - Se order_by já inclui 'ORDER BY', não duplica
-    - Se for um nome simples de coluna, aplica crase e ASC (MySQL-safe)
+    - Se for um nome simples de coluna, delimita conforme o dialeto e aplica ASC
     - Se não houver order_by, usa coluna padrão quando fornecida
     """
     if order_by and order_by.strip():
@@ -162,89 +438,533 @@ def _format_order_by(order_by: Optional[str], default_column: Optional[str]) ->
             return ob
         # coluna simples (sem espaços ou vírgulas)
         if (' ' not in ob) and (',' not in ob):
-            return f"ORDER BY `{ob}` ASC"
+            return f"ORDER BY {_quote_identifier(ob, source_type)} ASC"
         return f"ORDER BY {ob}"
     if default_column:
-        return f"ORDER BY `{default_column}` ASC"
+        return f"ORDER BY {_quote_identifier(default_column, source_type)} ASC"
     return ""
 
 
-def build_sql_query(mapping_config: Dict[str, Any]) -> Optional[str]:
+def _placeholder(source_type: Optional[str]) -> str:
+    """
+    Retorna o marcador de parâmetro do driver da fonte.
+    
+    Args:
+        source_type: Tipo da fonte
+        
+    Returns:
+        '?' para pyodbc/sqlite3, '%s' para psycopg2/pymysql
+    """
+    return '?' if _base_source_type(source_type) in ('sqlserver', 'sqlite') else '%s'
+
+
+def _coerce_watermark(value: Any) -> Any:
+    """
+    Converte watermarks numéricos salvos como texto para int (comparação com PK inteira).
+    
+    Args:
+        value: Watermark da configuração
+        
+    Returns:
+        int para textos inteiros, senão o próprio valor
+    """
+    if isinstance(value, str) and re.fullmatch(r'-?\d+', value.strip()):
+        return int(value)
+    return value
+
+
+def _build_query(mapping_config: Dict[str, Any], source_type: Optional[str],
+                 with_total: bool, placeholder: Optional[str]) -> Optional[Tuple[str, Tuple[Any, ...]]]:
+    """
+    Monta a query do mapeamento e seus parâmetros.
+    
+    Args:
+        mapping_config: Configuração do mapeamento
+        source_type: Tipo da fonte, usado para delimitar identificadores
+        with_total: Inclui a coluna TOTAL_COLUMN com COUNT(*) OVER()
+        placeholder: Marcador de parâmetro do driver; None insere o watermark como literal
+        
+    Returns:
+        Tupla (query, parâmetros) ou None se não for possível construir
+    """
+    # Verifica se já existe uma query definida
+    if mapping_config.get('query'):
+        return mapping_config['query'], ()
+    
+    # Obtém informações do mapeamento
+    table = mapping_config.get('table')
+    transfer = mapping_config.get('transfer', {})
+    
+    if not table:
+        logger.error("Tabela não especificada no mapeamento")
+        return None
+    
+    incremental_mode = transfer.get('incremental_mode', 'full')
+    pk_column = transfer.get('pk_column')
+    timestamp_column = transfer.get('timestamp_column')
+    initial_watermark = transfer.get('initial_watermark', '0')
+    order_by = transfer.get('order_by')
+    
+    quoted_table = _quote_identifier(table, source_type)
+    select = f"SELECT {quoted_table}.*, COUNT(*) OVER() AS {TOTAL_COLUMN}" if with_total else "SELECT *"
+    params: Tuple[Any, ...] = ()
+    
+    # Constrói a query baseada no modo incremental
+    if incremental_mode == 'full':
+        # Modo completo: seleciona todos os registros
+        query = f"{select} FROM {quoted_table}"
+        if order_by:
+            query += f" {_format_order_by(order_by, None, source_type)}"
+    
+    elif incremental_mode == 'incremental_pk':
+        # Modo incremental por chave primária
+        if not pk_column:
+            logger.error("pk_column é obrigatório para incremental_mode='incremental_pk'")
+            return None
+        
+        if placeholder:
+            condition, params = placeholder, (_coerce_watermark(initial_watermark),)
+        else:
+            condition = f"{initial_watermark}"
+        query = (f"{select} FROM {quoted_table} "
+                 f"WHERE {_quote_identifier(pk_column, source_type)} > {condition}")
+        # Aplica ORDER BY normalizado, usando pk como padrão
+        query += f" {_format_order_by(order_by, pk_column, source_type)}"
+    
+    elif incremental_mode == 'incremental_timestamp':
+        # Modo incremental por timestamp
+        if not timestamp_column:
+            logger.error("timestamp_column é obrigatório para incremental_mode='incremental_timestamp'")
+            return None
+        
+        if placeholder:
+            condition, params = placeholder, (str(initial_watermark),)
+        else:
+            condition = f"'{initial_watermark}'"
+        query = (f"{select} FROM {quoted_table} "
+                 f"WHERE {_quote_identifier(timestamp_column, source_type)} > {condition}")
+        # Aplica ORDER BY normalizado, usando timestamp como padrão
+        query += f" {_format_order_by(order_by, timestamp_column, source_type)}"
+    
+    elif incremental_mode == 'custom_sql':
+        # Modo SQL customizado - deve ter query definida
+        logger.error("incremental_mode='custom_sql' requer query definida no mapeamento")
+        return None
+        
+    else:
+        logger.error("incremental_mode não suportado: %s", incremental_mode)
+        return None
+    
+    logger.debug("Query SQL construída automaticamente: %s", query)
+    return query, params
+
+
+def build_sql_query(mapping_config: Dict[str, Any], source_type: Optional[str] = None,
+                    with_total: bool = False) -> Optional[str]:
     """
     Constrói query SQL automaticamente baseada na configuração do mapeamento.
     
+    O watermark é inserido como literal; para execução prefira
+    build_sql_query_with_params.
+    
     Args:
         mapping_config: Configuração do mapeamento
+        source_type: Tipo da fonte, usado para delimitar identificadores (crase por padrão)
+        with_total: Inclui a coluna TOTAL_COLUMN com COUNT(*) OVER() em cada linha
+                    (não se aplica a queries customizadas)
         
     Returns:
         Query SQL construída ou None se não for possível construir
     """
     try:
-        # Verifica se já existe uma query definida
-        if mapping_config.get('query'):
-            return mapping_config['query']
+        built = _build_query(mapping_config, source_type, with_total, placeholder=None)
+        return built[0] if built else None
+    except Exception as e:
+        logger.error("Erro ao construir query SQL: %s", e)
+        return None
+
+
+def build_sql_query_with_params(mapping_config: Dict[str, Any], source_type: Optional[str] = None,
+                                with_total: bool = False) -> Optional[Tuple[str, Tuple[Any, ...]]]:
+    """
+    Constrói a query do mapeamento com o watermark como parâmetro do driver.
+    
+    Evita interpolar valores no SQL (injeção, aspas por dialeto) e permite ao
+    banco reaproveitar o plano quando o driver envia a query parametrizada.
+    
+    Args:
+        mapping_config: Configuração do mapeamento
+        source_type: Tipo da fonte (define delimitadores e marcador de parâmetro)
+        with_total: Inclui a coluna TOTAL_COLUMN com COUNT(*) OVER() em cada linha
         
-        # Obtém informações do mapeamento
-        table = mapping_config.get('table')
-        transfer = mapping_config.get('transfer', {})
+    Returns:
+        Tupla (query, parâmetros) ou None se não for possível construir
+    """
+    placeholder = _placeholder(source_type)
+    try:
+        return _build_query(mapping_config, source_type, with_total, placeholder)
+    except Exception as e:
+        logger.error("Erro ao construir query SQL: %s", e)
+        return None
+
+
+def _probe_tcp(host: str, port: int, timeout: float = 2) -> bool:
+    """
+    Verifica se o host aceita conexões TCP na porta, sem handshake do driver.
+    
+    Args:
+        host: Endereço do servidor
+        port: Porta do servidor
+        timeout: Tempo máximo de espera em segundos
         
-        if not table:
-            logger.error("Tabela não especificada no mapeamento")
-            return None
+    Returns:
+        True se a conexão TCP foi aberta
+    """
+    try:
+        with socket.create_connection((host, int(port)), timeout=timeout):
+            return True
+    except (OSError, ValueError):
+        return False
+
+
+def _to_json_safe(value: Any) -> Any:
+    """
+    Converte tipos especiais para valores serializáveis em JSON.
+    
+    Args:
+        value: Valor vindo do driver
         
-        incremental_mode = transfer.get('incremental_mode', 'full')
-        pk_column = transfer.get('pk_column')
-        timestamp_column = transfer.get('timestamp_column')
-        initial_watermark = transfer.get('initial_watermark', '0')
-        order_by = transfer.get('order_by')
-        
-        # Constrói a query baseada no modo incremental
-        if incremental_mode == 'full':
-            # Modo completo: seleciona todos os registros
-            query = f"SELECT * FROM `{table}`"
-            if order_by:
-                query += f" {_format_order_by(order_by, None)}"
-        
-        elif incremental_mode == 'incremental_pk':
-            # Modo incremental por chave primária
-            if not pk_column:
-                logger.error("pk_column é obrigatório para incremental_mode='incremental_pk'")
-                return None
-            
-            query = f"SELECT * FROM `{table}` WHERE `{pk_column}` > {initial_watermark}"
-            # Aplica ORDER BY normalizado, usando pk como padrão
-            query += f" {_format_order_by(order_by, pk_column)}"
-        
-        elif incremental_mode == 'incremental_timestamp':
-            # Modo incremental por timestamp
-            if not timestamp_column:
-                logger.error("timestamp_column é obrigatório para incremental_mode='incremental_timestamp'")
-                return None
-            
-            query = f"SELECT * FROM `{table}` WHERE `{timestamp_column}` > '{initial_watermark}'"
-            # Aplica ORDER BY normalizado, usando timestamp como padrão
-            query += f" {_format_order_by(order_by, timestamp_column)}"
+    Returns:
+        datetime/date/time em ISO 8601, bytes decodificados em UTF-8 ou o próprio valor
+    """
+    if hasattr(value, 'isoformat'):  # datetime
+        return value.isoformat()
+    if isinstance(value, bytes):
+        return value.decode('utf-8', errors='ignore')
+    return value
+
+
+def _rows_to_records(columns: List[str], rows: List[Any]) -> List[Dict[str, Any]]:
+    """
+    Converte linhas em sequência (tuplas, pyodbc.Row, sqlite3.Row) em dicionários.
+    
+    Args:
+        columns: Nomes das colunas na ordem do cursor
+        rows: Linhas retornadas por fetchmany
         
-        elif incremental_mode == 'custom_sql':
-            # Modo SQL customizado - deve ter query definida
-            logger.error("incremental_mode='custom_sql' requer query definida no mapeamento")
-            return None
-            
-        else:
-            logger.error(f"incremental_mode não suportado: {incremental_mode}")
-            return None
+    Returns:
+        Lista de registros com valores serializáveis
+    """
+    passthrough = _PASSTHROUGH_TYPES
+    convert = _to_json_safe
+    return [
+        {column: (value if type(value) in passthrough else convert(value))
+         for column, value in zip(columns, row)}
+        for row in rows
+    ]
+
+
+def _fix_dict_rows(rows: List[Dict[str, Any]], keys: List[str]) -> List[Dict[str, Any]]:
+    """
+    Converte, no próprio dicionário, apenas as colunas que podem ter tipos especiais.
+    
+    Args:
+        rows: Linhas em dicionário recém-criadas pelo driver (ex.: DictCursor)
+        keys: Colunas cujo tipo declarado não garante valor serializável
         
-        logger.info(f"Query SQL construída automaticamente: {query}")
-        return query
+    Returns:
+        As mesmas linhas, com valores serializáveis
+    """
+    if keys:
+        passthrough = _PASSTHROUGH_TYPES
+        convert = _to_json_safe
+        for row in rows:
+            for key in keys:
+                value = row[key]
+                if type(value) not in passthrough:
+                    row[key] = convert(value)
+    return rows
+
+
+def _isoformat_or_none(value: Any) -> Any:
+    """Converte datetime/date/time em ISO 8601, preservando None."""
+    return None if value is None else value.isoformat()
+
+
+def _decode_bytes(value: Any) -> Any:
+    """Decodifica bytes em UTF-8, preservando outros valores."""
+    return value.decode('utf-8', errors='ignore') if isinstance(value, bytes) else value
+
+
+# Conversores por tipo Python declarado no cursor (ex.: pyodbc cursor.description)
+_TYPE_CODE_CONVERTERS = {
+    datetime: _isoformat_or_none,
+    date: _isoformat_or_none,
+    dt_time: _isoformat_or_none,
+    bytes: _decode_bytes,
+    bytearray: _decode_bytes,
+}
+
+
+def _converter_for_type_code(type_code: Any) -> Optional[Any]:
+    """
+    Escolhe o conversor de uma coluna a partir do tipo declarado pelo driver.
+    
+    Args:
+        type_code: Tipo Python informado em cursor.description
         
-    except Exception as e:
-        logger.error(f"Erro ao construir query SQL: {e}")
+    Returns:
+        None se a coluna dispensa conversão, senão a função de conversão
+    """
+    if type_code in _PASSTHROUGH_TYPES:
         return None
+    # Tipos desconhecidos passam pela verificação genérica
+    return _TYPE_CODE_CONVERTERS.get(type_code, _to_json_safe)
+
+
+def _rows_to_records_with_converters(columns: List[str], rows: List[Any],
+                                     converters: List[Optional[Any]]) -> List[Dict[str, Any]]:
+    """
+    Converte linhas em dicionários aplicando conversores pré-calculados por coluna.
+    
+    Args:
+        columns: Nomes das colunas na ordem do cursor
+        rows: Linhas retornadas por fetchmany
+        converters: Conversor de cada coluna (None quando não há conversão)
+        
+    Returns:
+        Lista de registros com valores serializáveis
+    """
+    if not any(converters):
+        # Caminho rápido: dict(zip(...)) roda inteiramente em C
+        return [dict(zip(columns, row)) for row in rows]
+    
+    plan = list(zip(columns, converters))
+    return [
+        {column: (value if convert is None else convert(value))
+         for (column, convert), value in zip(plan, row)}
+        for row in rows
+    ]
+
+
+def _execute(cursor: Any, query: str, params: Optional[Sequence[Any]]) -> None:
+    """
+    Executa a query, repassando parâmetros ao driver somente quando houver.
+    
+    Sem parâmetros a query segue literal, então um '%' em query customizada
+    não é interpretado como marcador pelo psycopg2/pymysql.
+    
+    Args:
+        cursor: Cursor DB-API
+        query: Query SQL
+        params: Parâmetros da query
+    """
+    if params:
+        cursor.execute(query, params)
+    else:
+        cursor.execute(query)
+
+
+class _ProducerStopped(Exception):
+    """Sinaliza à thread produtora que o consumidor parou de ler os lotes."""
+
+
+class _PartitionAborted(Exception):
+    """Sinaliza a uma partição que outra partição falhou e a extração foi abortada."""
+
+
+def _produce_in_thread(produce: Callable[[Callable[[Any], None]], None],
+                       maxsize: int = 2) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Executa uma função produtora em outra thread e entrega seus lotes como iterador.
+    
+    A produtora recebe `emit(lote)`, que bloqueia enquanto a fila limitada estiver
+    cheia. Exceções da produtora são relançadas no consumidor; se o consumidor
+    parar antes do fim, `emit` lança _ProducerStopped para encerrar a produtora.
+    
+    Args:
+        produce: Função que chama emit para cada lote produzido
+        maxsize: Número máximo de lotes aguardando consumo
+        
+    Returns:
+        Iterador com os lotes, na ordem em que foram emitidos
+    """
+    batch_queue: "queue.Queue[Any]" = queue.Queue(maxsize=maxsize)
+    stop_event = threading.Event()
+    errors: List[BaseException] = []
+    
+    def _emit(item: Any) -> None:
+        while True:
+            if stop_event.is_set():
+                raise _ProducerStopped()
+            try:
+                batch_queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+    
+    def _producer() -> None:
+        try:
+            produce(_emit)
+        except _ProducerStopped:
+            pass
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            try:
+                _emit(_BATCH_SENTINEL)
+            except _ProducerStopped:
+                pass
+    
+    producer = threading.Thread(target=_producer, name="bridge-extract-producer", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = batch_queue.get()
+            if item is _BATCH_SENTINEL:
+                break
+            yield item
+        if errors:
+            raise errors[0]
+    finally:
+        stop_event.set()
+        producer.join()
+
+
+def _prefetch_batches(batches: Iterator[List[Dict[str, Any]]],
+                      maxsize: int = 2) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Consome um iterador de lotes em uma thread produtora (double-buffering).
+    
+    Enquanto o chamador processa o lote N, a thread já busca o lote N+1 no banco.
+    A fila limitada mantém no máximo `maxsize` lotes em memória. Se o consumidor
+    parar antes do fim, o iterador original é fechado na própria thread produtora.
+    
+    Args:
+        batches: Iterador de lotes (ex.: extractor.extract_data(...))
+        maxsize: Número máximo de lotes aguardando consumo
+        
+    Returns:
+        Iterador com os mesmos lotes, na mesma ordem
+    """
+    def _produce(emit: Callable[[Any], None]) -> None:
+        try:
+            for batch in batches:
+                emit(batch)
+        finally:
+            close = getattr(batches, 'close', None)
+            if close is not None:
+                close()
+    
+    return _produce_in_thread(_produce, maxsize)
+
+
+def _iter_fetchmany(cursor: Any, batch_size: int) -> Iterator[List[Any]]:
+    """
+    Itera sobre os lotes de linhas de um cursor até o fim do resultado.
+    
+    Args:
+        cursor: Cursor DB-API já executado
+        batch_size: Tamanho do lote
+        
+    Yields:
+        Lotes de linhas do driver
+    """
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            return
+        yield rows
+
+
+def _fetch_ahead(cursor: Any, batch_size: int, maxsize: int = 2) -> Iterator[List[Any]]:
+    """
+    Busca os lotes de um cursor em outra thread, à frente da conversão.
+    
+    Enquanto o chamador converte o lote N em dicionários, a thread já aguarda
+    o lote N+1 na rede (os drivers liberam o GIL durante o I/O). O iterador
+    deve ser fechado antes do cursor, para que a thread termine o fetch em curso.
+    
+    Args:
+        cursor: Cursor DB-API já executado
+        batch_size: Tamanho do lote
+        maxsize: Número máximo de lotes buscados aguardando conversão
+        
+    Returns:
+        Iterador com os lotes de linhas do driver
+    """
+    def _produce(emit: Callable[[Any], None]) -> None:
+        for rows in _iter_fetchmany(cursor, batch_size):
+            emit(rows)
+    
+    return _produce_in_thread(_produce, maxsize)
+
+
+# Escapes do formato texto do COPY: barra invertida e caracteres de controle
+_COPY_TEXT_ESCAPE_RE = re.compile(r'\\([\\bfnrtv])')
+_COPY_TEXT_UNESCAPES = {
+    '\\': '\\', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t', 'v': '\v',
+}
+
+
+def _copy_text_unescape(line: str) -> str:
+    """Desfaz os escapes do formato texto do COPY em uma única passada."""
+    if '\\' not in line:
+        return line
+    return _COPY_TEXT_ESCAPE_RE.sub(lambda m: _COPY_TEXT_UNESCAPES[m.group(1)], line)
+
+
+class _CopyJsonSink(io.TextIOBase):
+    """
+    Destino de `COPY (SELECT row_to_json(t) ...) TO STDOUT` em formato texto.
+    
+    Cada linha recebida é um objeto JSON escapado pelo COPY (barras invertidas e
+    caracteres de controle, ex.: quebras de linha de colunas `json` formatadas);
+    a linha é desescapada, decodificada e agrupada em lotes.
+    """
+    
+    def __init__(self, batch_size: int, emit: Callable[[Any], None]):
+        super().__init__()
+        self._batch_size = batch_size
+        self._emit = emit
+        self._pending = ''
+        self._batch: List[Dict[str, Any]] = []
+    
+    def writable(self) -> bool:
+        return True
+    
+    def write(self, data: Any) -> int:
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            data = bytes(data).decode('utf-8')
+        lines = (self._pending + data).split('\n')
+        self._pending = lines.pop()
+        for line in lines:
+            self._add_line(line)
+        return len(data)
+    
+    def _add_line(self, line: str) -> None:
+        if not line:
+            return
+        self._batch.append(json.loads(_copy_text_unescape(line), parse_float=Decimal))
+        if len(self._batch) >= self._batch_size:
+            batch, self._batch = self._batch, []
+            self._emit(batch)
+    
+    def finish(self) -> None:
+        """Processa o restante do buffer e emite o último lote."""
+        self._add_line(self._pending)
+        self._pending = ''
+        if self._batch:
+            batch, self._batch = self._batch, []
+            self._emit(batch)
 
 
 class DataExtractor(ABC):
     """Classe base para extratores de dados."""
     
+    # Se o banco suporta funções de janela (COUNT(*) OVER())
+    SUPPORTS_COUNT_OVER = False
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Inicializa o extrator.
@@ -254,6 +974,100 @@ class DataExtractor(ABC):
         """
         self.config = config
         self.connection = None
+        # Cursor no servidor (streaming) para extratores que suportam; ver transfer.streaming
+        self.streaming = False
+        # Pool de onde veio a conexão atual (None para conexões diretas)
+        self._pool = None
+    
+    def _pool_key(self, connect_args: Mapping, max_size: int, idle_timeout: float) -> Tuple:
+        """
+        Identifica a fonte para compartilhar conexões entre extratores.
+        
+        Só compartilham conexões os extratores que passariam exatamente os mesmos
+        parâmetros ao connect do driver (encoding, charset, timeouts...) e que
+        pedem o mesmo tamanho de pool.
+        
+        Args:
+            connect_args: Parâmetros repassados ao connect do driver
+            max_size: Número máximo de conexões do pool
+            idle_timeout: Segundos até uma conexão ociosa ser descartada
+            
+        Returns:
+            Tupla (tipo, parâmetros de conexão, max_size, idle_timeout)
+        """
+        return (
+            type(self).__name__,
+            tuple(sorted(connect_args.items())),
+            max_size,
+            idle_timeout,
+        )
+    
+    @staticmethod
+    def _validate_pooled_connection(connection: Any) -> bool:
+        """Verifica com SELECT 1 se uma conexão ociosa do pool ainda responde."""
+        cursor = connection.cursor()
+        try:
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+            return True
+        finally:
+            cursor.close()
+    
+    def _acquire_connection(self, factory: Callable[[], Any], connect_args: Mapping) -> Any:
+        """
+        Obtém uma conexão do pool compartilhado da fonte, ou direta se `pool_max` for 0.
+        
+        Args:
+            factory: Função que abre uma nova conexão com o driver
+            connect_args: Parâmetros que `factory` repassa ao driver (compõem a chave do pool)
+            
+        Returns:
+            Conexão com o banco
+        """
+        pool_max = int(self.config.get('pool_max', DEFAULT_POOL_MAX))
+        if pool_max <= 0:
+            self._pool = None
+            return factory()
+        
+        idle_timeout = float(self.config.get('pool_idle_timeout', DEFAULT_IDLE_TIMEOUT))
+        self._pool = get_connection_pool(
+            self._pool_key(connect_args, pool_max, idle_timeout),
+            factory,
+            max_size=pool_max,
+            idle_timeout=idle_timeout,
+            validate=self._validate_pooled_connection
+        )
+        return self._pool.acquire()
+    
+    def _release_connection(self) -> None:
+        """Devolve a conexão ao pool (ou fecha, se direta)."""
+        if not self.connection:
+            return
+        if self._pool is not None:
+            self._pool.release(self.connection)
+        else:
+            self.connection.close()
+        self.connection = None
+        self._pool = None
+    
+    def _fast_fail_unreachable(self, default_port: int) -> bool:
+        """
+        Com `fast_fail` na configuração, testa o alcance TCP antes do handshake do driver.
+        
+        Args:
+            default_port: Porta padrão do banco
+            
+        Returns:
+            True se fast_fail está ativo e o host não respondeu
+        """
+        if not self.config.get('fast_fail'):
+            return False
+        host = self.config.get('host', 'localhost')
+        port = self.config.get('port', default_port)
+        if _probe_tcp(host, port):
+            return False
+        logger.error("❌ Host %s:%s inacessível", host, port)
+        return True
     
     @abstractmethod
     def connect(self) -> bool:
@@ -281,37 +1095,146 @@ class DataExtractor(ABC):
         pass
     
     @abstractmethod
-    def extract_data(self, query: str, batch_size: int = 1000) -> Iterator[List[Dict[str, Any]]]:
+    def extract_data(self, query: str, batch_size: int = 1000,
+                     params: Optional[Sequence[Any]] = None) -> Iterator[List[Dict[str, Any]]]:
         """
         Extrai dados usando uma query.
         
         Args:
             query: Query SQL para extração
             batch_size: Tamanho do lote
+            params: Parâmetros da query (marcadores no estilo do driver)
             
         Yields:
             Lotes de registros
         """
         pass
     
-    def get_record_count(self, query: str) -> int:
+    def extract_data_json(self, query: str, batch_size: int = 1000,
+                          params: Optional[Sequence[Any]] = None) -> Iterator[List[bytes]]:
+        """
+        Extrai dados já serializados como linhas JSON (bytes), prontas para JSONL.
+        
+        Args:
+            query: Query SQL para extração
+            batch_size: Tamanho do lote
+            params: Parâmetros da query
+            
+        Yields:
+            Lotes de registros serializados
+        """
+        for batch in self.extract_data(query, batch_size, params):
+            yield [dumps_record(record) for record in batch]
+    
+    def get_record_count(self, query: str, params: Optional[Sequence[Any]] = None) -> int:  # pragma: no cover — diagnóstico
         """
         Obtém o número total de registros de uma query.
         
+        Executa a query uma segunda vez dentro de COUNT(*); não é usado na
+        extração, que conta os registros enquanto lê os lotes.
+        
         Args:
             query: Query SQL
+            params: Parâmetros da query
             
         Returns:
             Número de registros
         """
         try:
             count_query = f"SELECT COUNT(*) as total FROM ({query}) as count_subquery"
-            for batch in self.extract_data(count_query, batch_size=1):
+            for batch in self.extract_data(count_query, batch_size=1, params=params):
                 return batch[0].get('total', 0)
         except Exception as e:
-            logger.warning(f"Erro ao obter contagem: {e}")
-            return 0
+            logger.warning("Erro ao obter contagem: %s", e)
+            self._rollback_after_error()
+        return 0
     
+    def _rollback_after_error(self) -> None:
+        """
+        Desfaz a transação após uma consulta com erro. Em drivers transacionais
+        (ex.: psycopg2) o erro deixa a transação abortada e os comandos
+        seguintes na mesma conexão falhariam até o rollback.
+        """
+        rollback = getattr(self.connection, 'rollback', None)
+        if rollback is None:
+            return
+        try:
+            rollback()
+        except Exception as e:
+            logger.debug("Rollback após erro falhou: %s", e)
+
+    def get_record_count_async(self, query: str, params: Optional[Sequence[Any]] = None) -> Future:
+        """
+        Conta os registros em segundo plano, sobrepondo a contagem à extração.
+        
+        Usa um segundo extrator com a mesma configuração (e, portanto, outra
+        conexão do pool), para que a conexão desta instância siga livre para
+        ler os dados. Útil para interfaces de progresso que precisam do total.
+        
+        Args:
+            query: Query SQL
+            params: Parâmetros da query
+            
+        Returns:
+            Future com o número de registros
+        """
+        future: Future = Future()
+        
+        def _count() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                with type(self)(self.config) as counter:
+                    future.set_result(counter.get_record_count(query, params))
+            except BaseException as e:
+                future.set_exception(e)
+        
+        threading.Thread(target=_count, name="bridge-count", daemon=True).start()
+        return future
+
+    def supports_count_over(self) -> bool:
+        """
+        Indica se a contagem pode vir junto com os dados via COUNT(*) OVER().
+        
+        Returns:
+            True se o banco suporta funções de janela
+        """
+        return self.SUPPORTS_COUNT_OVER
+
+    def get_record_counts_bulk(self, queries: List[str]) -> List[int]:
+        """
+        Obtém a contagem de registros de várias queries em uma única ida ao banco.
+
+        Monta um UNION ALL de subconsultas COUNT(*) identificadas por tag e
+        reassocia o resultado a cada query. Se o banco rejeitar a consulta
+        combinada (ex.: ORDER BY em tabela derivada no SQL Server), cai para
+        uma contagem por query.
+
+        Args:
+            queries: Lista de queries SQL
+
+        Returns:
+            Número de registros de cada query, na mesma ordem
+        """
+        if not queries:
+            return []
+
+        bulk_query = " UNION ALL ".join(
+            f"SELECT 'q{i}' AS tag, (SELECT COUNT(*) FROM ({query}) AS count_subquery_{i}) AS total"
+            for i, query in enumerate(queries)
+        )
+
+        try:
+            counts: Dict[str, int] = {}
+            for batch in self.extract_data(bulk_query, batch_size=len(queries)):
+                for row in batch:
+                    counts[row['tag']] = int(row['total'] or 0)
+            return [counts.get(f"q{i}", 0) for i in range(len(queries))]
+        except Exception as e:
+            logger.warning("Contagem em lote falhou, contando query a query: %s", e)
+            self._rollback_after_error()
+            return [self.get_record_count(query) for query in queries]
+
     def __enter__(self):
         """Context manager entry."""
         self.connect()
@@ -325,13 +1248,17 @@ class DataExtractor(ABC):
 class SQLServerExtractor(DataExtractor):
     """Extrator para SQL Server."""
     
+    SUPPORTS_COUNT_OVER = True
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
-        if not PYODBC_AVAILABLE:
+        if _pyodbc() is None:
             raise ImportError("pyodbc não está disponível. Instale com: pip install pyodbc")
     
     def connect(self) -> bool:
         """Estabelece conexão com SQL Server."""
+        if self._fast_fail_unreachable(1433):
+            return False
         try:
             # Constrói a string de conexão
             driver = self.config.get('driver', '{ODBC Driver 17 for SQL Server}')
@@ -341,7 +1268,7 @@ class SQLServerExtractor(DataExtractor):
             username = self.config.get('username')
             password = self.config.get('password')
             
-            logger.debug(f"🔌 Conectando ao SQL Server: {server}:{port}/{database} como {username}")
+            logger.debug("🔌 Conectando ao SQL Server: %s:%s/%s como %s", server, port, database, username)
             
             conn_str = (
                 f"DRIVER={driver};"
@@ -352,19 +1279,31 @@ class SQLServerExtractor(DataExtractor):
                 "TrustServerCertificate=yes;"
             )
             
-            self.connection = pyodbc.connect(conn_str, timeout=5)
-            logger.info(f"✅ Conectado ao SQL Server: {server}:{port}/{database}")
+            pyodbc = _pyodbc()
+            char_encoding = self.config.get('char_encoding')
+            
+            def _open_connection():
+                connection = pyodbc.connect(conn_str, timeout=5)
+                if char_encoding:
+                    # Colunas VARCHAR/CHAR em collation legada (ex.: cp1252) decodificadas
+                    # pelo próprio driver; NVARCHAR segue em UTF-16LE (padrão do pyodbc)
+                    connection.setdecoding(pyodbc.SQL_CHAR, encoding=char_encoding)
+                return connection
+            
+            self.connection = self._acquire_connection(
+                _open_connection,
+                {'conn_str': conn_str, 'timeout': 5, 'char_encoding': char_encoding}
+            )
+            logger.info("✅ Conectado ao SQL Server: %s:%s/%s", server, port, database)
             return True
             
         except Exception as e:
-            logger.error(f"❌ Erro ao conectar SQL Server: {e}")
+            logger.error("❌ Erro ao conectar SQL Server: %s", e)
             return False
     
     def disconnect(self) -> None:
-        """Fecha conexão com SQL Server."""
-        if self.connection:
-            self.connection.close()
-            self.connection = None
+        """Devolve a conexão com SQL Server ao pool."""
+        self._release_connection()
     
     def test_connection(self) -> bool:
         """Testa conexão com SQL Server."""
@@ -379,20 +1318,48 @@ class SQLServerExtractor(DataExtractor):
             return True
             
         except Exception as e:
-            logger.error(f"Erro no teste de conexão: {e}")
+            logger.error("Erro no teste de conexão: %s", e)
             return False
     
-    def extract_data(self, query: str, batch_size: int = 1000) -> Iterator[List[Dict[str, Any]]]:
-        """Extrai dados do SQL Server."""
+    def extract_data(self, query: str, batch_size: int = 1000,
+                     params: Optional[Sequence[Any]] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Extrai dados do SQL Server."""
+        if not self.connection:
+            raise RuntimeError("Conexão não estabelecida")
+        
+        cursor = self.connection.cursor()
+        # fetchmany busca `arraysize` linhas por chamada ao driver ODBC
+        cursor.arraysize = batch_size
+        
+        try:
+            _execute(cursor, query, params)
+            
+            # Obtém nomes das colunas e o conversor de cada uma (uma vez por query)
+            columns = [column[0] for column in cursor.description]
+            converters = [_converter_for_type_code(column[1]) for column in cursor.description]
+            
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                
+                # Converte para dicionários
+                yield _rows_to_records_with_converters(columns, rows, converters)
+                
+        finally:
+            cursor.close()
+    
+    def extract_data_json(self, query: str, batch_size: int = 1000,
+                          params: Optional[Sequence[Any]] = None) -> Iterator[List[bytes]]:
+        """Extrai dados do SQL Server serializando as linhas do driver diretamente."""
         if not self.connection:
             raise RuntimeError("Conexão não estabelecida")
         
         cursor = self.connection.cursor()
+        cursor.arraysize = batch_size
         
         try:
-            cursor.execute(query)
-            
-            # Obtém nomes das colunas
+            _execute(cursor, query, params)
             columns = [column[0] for column in cursor.description]
             
             while True:
@@ -400,22 +1367,8 @@ class SQLServerExtractor(DataExtractor):
                 if not rows:
                     break
                 
-                # Converte para dicionários
-                batch = []
-                for row in rows:
-                    record = {}
-                    for i, value in enumerate(row):
-                        # Converte tipos especiais para JSON serializável
-                        if hasattr(value, 'isoformat'):  # datetime
-                            value = value.isoformat()
-                        elif isinstance(value, bytes):
-                            value = value.decode('utf-8', errors='ignore')
-                        
-                        record[columns[i]] = value
-                    
-                    batch.append(record)
-                
-                yield batch
+                # datas, bytes e Decimal são tratados pelo serializador, sem conversão por célula
+                yield [dumps_record(dict(zip(columns, row))) for row in rows]
                 
         finally:
             cursor.close()
@@ -424,13 +1377,19 @@ class SQLServerExtractor(DataExtractor):
 class PostgreSQLExtractor(DataExtractor):
     """Extrator para PostgreSQL."""
     
+    SUPPORTS_COUNT_OVER = True
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
-        if not PSYCOPG2_AVAILABLE:
+        if _psycopg2() is None:
             raise ImportError("psycopg2 não está disponível. Instale com: pip install psycopg2-binary")
+        # Extração via COPY ... TO STDOUT (apenas carga completa; ver transfer.pg_copy)
+        self.copy_mode = False
     
     def connect(self) -> bool:
         """Estabelece conexão com PostgreSQL."""
+        if self._fast_fail_unreachable(5432):
+            return False
         try:
             host = self.config.get('host', 'localhost')
             port = self.config.get('port', 5432)
@@ -438,7 +1397,7 @@ class PostgreSQLExtractor(DataExtractor):
             username = self.config.get('username')
             password = self.config.get('password')
             
-            logger.debug(f"🔌 Conectando ao PostgreSQL: {host}:{port}/{database} como {username}")
+            logger.debug("🔌 Conectando ao PostgreSQL: %s:%s/%s como %s", host, port, database, username)
             
             conn_params = {
                 'host': host,
@@ -449,69 +1408,131 @@ class PostgreSQLExtractor(DataExtractor):
                 'connect_timeout': 5
             }
             
-            self.connection = psycopg2.connect(**conn_params)
-            logger.info(f"✅ Conectado ao PostgreSQL: {host}:{port}/{database}")
+            psycopg2 = _psycopg2()
+            self.connection = self._acquire_connection(lambda: psycopg2.connect(**conn_params), conn_params)
+            logger.info("✅ Conectado ao PostgreSQL: %s:%s/%s", host, port, database)
             return True
             
         except Exception as e:
-            logger.error(f"❌ Erro ao conectar PostgreSQL: {e}")
+            logger.error("❌ Erro ao conectar PostgreSQL: %s", e)
             return False
     
     def disconnect(self) -> None:
-        """Fecha conexão com PostgreSQL."""
-        if self.connection:
-            self.connection.close()
-            self.connection = None
+        """Devolve a conexão com PostgreSQL ao pool."""
+        self._release_connection()
     
     def test_connection(self) -> bool:
-        """Testa conexão com PostgreSQL."""
+        """Testa conexão com PostgreSQL (estado do driver, sem ida ao servidor)."""
         try:
             if not self.connection:
                 return False
             
-            cursor = self.connection.cursor()
-            cursor.execute("SELECT 1")
-            cursor.fetchone()
-            cursor.close()
-            return True
+            # O handshake do connect já validou o servidor; `closed` é 0 enquanto a conexão vive
+            return self.connection.closed == 0
             
         except Exception as e:
-            logger.error(f"Erro no teste de conexão: {e}")
+            logger.error("Erro no teste de conexão: %s", e)
             return False
     
-    def extract_data(self, query: str, batch_size: int = 1000) -> Iterator[List[Dict[str, Any]]]:
+    def extract_data(self, query: str, batch_size: int = 1000,
+                     params: Optional[Sequence[Any]] = None) -> Iterator[List[Dict[str, Any]]]:
         """Extrai dados do PostgreSQL."""
         if not self.connection:
             raise RuntimeError("Conexão não estabelecida")
         
-        cursor = self.connection.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+        if self.copy_mode and self._copy_supported(query, params):
+            yield from self._extract_via_copy(query, batch_size, params)
+            return
+        
+        # Cursor nomeado (no servidor): as linhas chegam em lotes de `itersize`,
+        # sem carregar o resultado inteiro na memória do cliente
+        cursor = self.connection.cursor(name=f"bridge_cursor_{next(_server_cursor_ids)}")
+        cursor.itersize = batch_size
+        cursor.arraysize = batch_size
+        fetched = None
         
         try:
-            cursor.execute(query)
+            _execute(cursor, query, params)
             
-            while True:
-                rows = cursor.fetchmany(batch_size)
-                if not rows:
-                    break
+            columns = None
+            converters = None
+            # O próximo lote é buscado no servidor enquanto este é convertido
+            fetched = _fetch_ahead(cursor, batch_size)
+            for rows in fetched:
+                if columns is None:
+                    # Em cursores nomeados a descrição só existe após o primeiro fetch;
+                    # só colunas de tipo não trivial passam por conversão
+                    columns = [column[0] for column in cursor.description]
+                    converters = [
+                        None if column[1] in _PG_PASSTHROUGH_OIDS else _to_json_safe
+                        for column in cursor.description
+                    ]
                 
                 # Converte para lista de dicionários
-                batch = []
-                for row in rows:
-                    record = dict(row)
-                    
-                    # Converte tipos especiais
-                    for key, value in record.items():
-                        if hasattr(value, 'isoformat'):  # datetime
-                            record[key] = value.isoformat()
-                        elif isinstance(value, bytes):
-                            record[key] = value.decode('utf-8', errors='ignore')
-                    
-                    batch.append(record)
-                
-                yield batch
+                yield _rows_to_records_with_converters(columns, rows, converters)
                 
+        finally:
+            if fetched is not None:
+                fetched.close()
+            cursor.close()
+    
+    def _copy_supported(self, query: str, params: Optional[Sequence[Any]] = None) -> bool:
+        """
+        Verifica (com LIMIT 0, sem ler linhas) se a query pode ser extraída via COPY.
+        
+        O row_to_json entrega bytea como texto hexadecimal ("\\x..."), enquanto o
+        cursor decodifica os bytes em UTF-8; queries com colunas bytea seguem
+        pelo cursor para que o JSONL não dependa de `pg_copy`.
+        
+        Args:
+            query: Query SQL
+            params: Parâmetros da query
+            
+        Returns:
+            True se nenhuma coluna do resultado é bytea
+        """
+        cursor = self.connection.cursor()
+        try:
+            _execute(cursor, f"SELECT * FROM ({query}) AS copy_probe LIMIT 0", params)
+            bytea_columns = [column[0] for column in cursor.description
+                             if column[1] in _PG_BYTEA_OIDS]
         finally:
             cursor.close()
+        
+        if bytea_columns:
+            logger.info("pg_copy ignorado: colunas bytea (%s)", ", ".join(bytea_columns))
+            return False
+        return True
+    
+    def _extract_via_copy(self, query: str, batch_size: int,
+                          params: Optional[Sequence[Any]] = None) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Extrai dados com COPY ... TO STDOUT, evitando o protocolo de cursor linha a linha.
+        
+        Cada linha é serializada pelo servidor com row_to_json; datas chegam em
+        ISO 8601 e números decimais como Decimal.
+        
+        Args:
+            query: Query SQL
+            batch_size: Tamanho do lote
+            params: Parâmetros da query (o COPY não aceita parâmetros; o driver os interpola)
+            
+        Returns:
+            Iterador de lotes de registros
+        """
+        copy_sql = f"COPY (SELECT row_to_json(copy_source) FROM ({query}) AS copy_source) TO STDOUT"
+        
+        def _produce(emit: Callable[[Any], None]) -> None:
+            sink = _CopyJsonSink(batch_size, emit)
+            cursor = self.connection.cursor()
+            try:
+                sql = cursor.mogrify(copy_sql, params).decode() if params else copy_sql
+                cursor.copy_expert(sql, sink)
+                sink.finish()
+            finally:
+                cursor.close()
+        
+        yield from _produce_in_thread(_produce)
 
 
 class MySQLExtractor(DataExtractor):
@@ -519,11 +1540,15 @@ class MySQLExtractor(DataExtractor):
     
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
-        if not PYMYSQL_AVAILABLE:
+        if _pymysql() is None:
             raise ImportError("pymysql não está disponível. Instale com: pip install pymysql")
+        # Por padrão as linhas vêm sob demanda do servidor (transfer.streaming: false bufferiza)
+        self.streaming = True
     
     def connect(self) -> bool:
         """Estabelece conexão com MySQL."""
+        if self._fast_fail_unreachable(3306):
+            return False
         try:
             host = self.config.get('host', 'localhost')
             port = self.config.get('port', 3306)
@@ -531,7 +1556,7 @@ class MySQLExtractor(DataExtractor):
             username = self.config.get('username')
             password = self.config.get('password')
             
-            logger.debug(f"🔌 Conectando ao MySQL: {host}:{port}/{database} como {username}")
+            logger.debug("🔌 Conectando ao MySQL: %s:%s/%s como %s", host, port, database, username)
             
             conn_params = {
                 'host': host,
@@ -542,86 +1567,109 @@ class MySQLExtractor(DataExtractor):
                 'charset': self.config.get('charset', 'utf8mb4'),
                 'connect_timeout': self.config.get('connection_timeout', 5),
                 'read_timeout': self.config.get('read_timeout', 10),
-                'write_timeout': self.config.get('write_timeout', 10)
+                'write_timeout': self.config.get('write_timeout', 10),
+                # Cursor sem buffer: o resultado não é carregado inteiro na memória do cliente
+                'cursorclass': _pymysql().cursors.SSDictCursor,
             }
             
-            self.connection = pymysql.connect(**conn_params)
-            logger.info(f"✅ Conectado ao MySQL: {host}:{port}/{database}")
+            pymysql = _pymysql()
+            self.connection = self._acquire_connection(lambda: pymysql.connect(**conn_params), conn_params)
+            logger.info("✅ Conectado ao MySQL: %s:%s/%s", host, port, database)
             return True
             
         except Exception as e:
-            logger.error(f"❌ Erro ao conectar MySQL: {e}")
+            logger.error("❌ Erro ao conectar MySQL: %s", e)
             return False
     
     def disconnect(self) -> None:
-        """Fecha conexão com MySQL."""
-        if self.connection:
-            self.connection.close()
-            self.connection = None
+        """Devolve a conexão com MySQL ao pool."""
+        self._release_connection()
+    
+    @staticmethod
+    def _validate_pooled_connection(connection: Any) -> bool:
+        """Verifica com COM_PING (sem executar SQL) se uma conexão ociosa ainda responde."""
+        connection.ping(reconnect=False)
+        return True
     
     def test_connection(self) -> bool:
-        """Testa conexão com MySQL."""
+        """Testa conexão com MySQL via COM_PING."""
         try:
             if not self.connection:
                 return False
             
-            with self.connection.cursor() as cursor:
-                cursor.execute("SELECT 1")
-                cursor.fetchone()
-            return True
+            return self._validate_pooled_connection(self.connection)
             
         except Exception as e:
-            logger.error(f"Erro no teste de conexão: {e}")
+            logger.error("Erro no teste de conexão: %s", e)
+            return False
+    
+    def supports_count_over(self) -> bool:
+        """Funções de janela existem a partir do MySQL 8.0 e MariaDB 10.2."""
+        if not self.connection:
             return False
+        version = self.connection.get_server_info() or ''
+        match = re.match(r'(\d+)\.(\d+)', version)
+        if not match:
+            return False
+        major_minor = (int(match.group(1)), int(match.group(2)))
+        if 'mariadb' in version.lower():
+            return major_minor >= (10, 2)
+        return major_minor >= (8, 0)
     
-    def extract_data(self, query: str, batch_size: int = 1000) -> Iterator[List[Dict[str, Any]]]:
+    def extract_data(self, query: str, batch_size: int = 1000,
+                     params: Optional[Sequence[Any]] = None) -> Iterator[List[Dict[str, Any]]]:
         """Extrai dados do MySQL."""
-        logger.debug(f"🔍 Iniciando extração MySQL com query: {query}")
-        logger.debug(f"📊 Batch size configurado: {batch_size}")
+        logger.debug("🔍 Iniciando extração MySQL com query: %s", query)
+        logger.debug("📊 Batch size configurado: %s", batch_size)
         
         if not self.connection:
             logger.error("❌ Conexão MySQL não estabelecida")
             raise RuntimeError("Conexão não estabelecida")
         
         try:
-            with self.connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            # SSDictCursor traz as linhas sob demanda (memória de um lote);
+            # DictCursor bufferiza tudo no cliente, mais rápido para resultados pequenos
+            cursors = _pymysql().cursors
+            cursor_class = cursors.SSDictCursor if self.streaming else cursors.DictCursor
+            with self.connection.cursor(cursor_class) as cursor:
                 logger.debug("🔄 Executando query MySQL...")
-                cursor.execute(query)
+                _execute(cursor, query, params)
                 logger.debug("✅ Query executada com sucesso")
                 
                 batch_count = 0
                 total_records = 0
+                fix_keys = None
                 
-                while True:
-                    rows = cursor.fetchmany(batch_size)
-                    if not rows:
-                        logger.debug(f"📋 Extração concluída: {batch_count} batches, {total_records} registros totais")
-                        break
-                    
-                    batch_count += 1
-                    batch_size_actual = len(rows)
-                    total_records += batch_size_actual
-                    
-                    logger.debug(f"📦 Processando batch {batch_count}: {batch_size_actual} registros")
-                    
-                    # Converte tipos especiais
-                    batch = []
-                    for row in rows:
-                        record = {}
-                        for key, value in row.items():
-                            if hasattr(value, 'isoformat'):  # datetime
-                                value = value.isoformat()
-                            elif isinstance(value, bytes):
-                                value = value.decode('utf-8', errors='ignore')
-                            
-                            record[key] = value
-                        
-                        batch.append(record)
-                    
-                    logger.debug(f"✅ Batch {batch_count} processado e convertido")
-                    yield batch
+                # Com SSDictCursor o próximo lote vem da rede enquanto este é convertido;
+                # o DictCursor já tem tudo em memória e não ganha nada com outra thread
+                fetched = _fetch_ahead(cursor, batch_size) if self.streaming else _iter_fetchmany(cursor, batch_size)
+                try:
+                    for rows in fetched:
+                        if fix_keys is None:
+                            # Chaves do DictCursor seguem a ordem de cursor.description
+                            # (com nomes duplicados já qualificados pela tabela)
+                            fix_keys = [
+                                key for key, column in zip(rows[0], cursor.description)
+                                if column[1] not in _MYSQL_PASSTHROUGH_TYPES
+                            ]
+
+                        batch_count += 1
+                        batch_size_actual = len(rows)
+                        total_records += batch_size_actual
+
+                        logger.debug("📦 Processando batch %d: %d registros", batch_count, batch_size_actual)
+
+                        # Converte tipos especiais
+                        batch = _fix_dict_rows(rows, fix_keys)
+
+                        logger.debug("✅ Batch %d processado e convertido", batch_count)
+                        yield batch
+                finally:
+                    fetched.close()
+
+                logger.debug("📋 Extração concluída: %d batches, %d registros totais", batch_count, total_records)
         except Exception as e:
-            logger.error(f"❌ Erro durante extração MySQL: {e}")
+            logger.error("❌ Erro durante extração MySQL: %s", e)
             raise
 
 
@@ -653,16 +1701,17 @@ class SQLiteExtractor(DataExtractor):
                 logger.error("❌ Caminho do banco SQLite não especificado")
                 return False
             
-            logger.debug(f"🔌 Conectando ao SQLite: {database_path}")
+            logger.debug("🔌 Conectando ao SQLite: %s", database_path)
             
-            self.connection = sqlite3.connect(database_path)
+            # A conexão é usada pela thread produtora de lotes (_prefetch_batches)
+            self.connection = sqlite3.connect(database_path, check_same_thread=False)
             self.connection.row_factory = sqlite3.Row  # Para acessar colunas por nome
             
-            logger.info(f"✅ Conectado ao SQLite: {database_path}")
+            logger.info("✅ Conectado ao SQLite: %s", database_path)
             return True
             
         except Exception as e:
-            logger.error(f"❌ Erro ao conectar SQLite: {e}")
+            logger.error("❌ Erro ao conectar SQLite: %s", e)
             return False
     
     def disconnect(self) -> None:
@@ -684,13 +1733,18 @@ class SQLiteExtractor(DataExtractor):
             return True
             
         except Exception as e:
-            logger.error(f"Erro no teste de conexão SQLite: {e}")
+            logger.error("Erro no teste de conexão SQLite: %s", e)
             return False
     
-    def extract_data(self, query: str, batch_size: int = 1000) -> Iterator[List[Dict[str, Any]]]:
+    def supports_count_over(self) -> bool:
+        """Funções de janela existem a partir do SQLite 3.25."""
+        return sqlite3.sqlite_version_info >= (3, 25, 0)
+    
+    def extract_data(self, query: str, batch_size: int = 1000,
+                     params: Optional[Sequence[Any]] = None) -> Iterator[List[Dict[str, Any]]]:
         """Extrai dados do SQLite."""
-        logger.debug(f"🔍 Iniciando extração SQLite com query: {query}")
-        logger.debug(f"📊 Batch size configurado: {batch_size}")
+        logger.debug("🔍 Iniciando extração SQLite com query: %s", query)
+        logger.debug("📊 Batch size configurado: %s", batch_size)
         
         if not self.connection:
             logger.error("❌ Conexão SQLite não estabelecida")
@@ -699,51 +1753,148 @@ class SQLiteExtractor(DataExtractor):
         try:
             cursor = self.connection.cursor()
             logger.debug("🔄 Executando query SQLite...")
-            cursor.execute(query)
+            _execute(cursor, query, params)
             logger.debug("✅ Query executada com sucesso")
             
+            columns = [column[0] for column in cursor.description]
             batch_count = 0
             total_records = 0
             
             while True:
                 rows = cursor.fetchmany(batch_size)
                 if not rows:
-                    logger.debug(f"📋 Extração concluída: {batch_count} batches, {total_records} registros totais")
+                    logger.debug("📋 Extração concluída: %d batches, %d registros totais", batch_count, total_records)
                     break
                 
                 batch_count += 1
                 batch_size_actual = len(rows)
                 total_records += batch_size_actual
                 
-                logger.debug(f"📦 Processando batch {batch_count}: {batch_size_actual} registros")
+                logger.debug("📦 Processando batch %d: %d registros", batch_count, batch_size_actual)
                 
                 # Converte sqlite3.Row para dicionários
-                batch = []
-                for row in rows:
-                    record = {}
-                    for key in row.keys():
-                        value = row[key]
-                        
-                        # Converte tipos especiais
-                        if hasattr(value, 'isoformat'):  # datetime
-                            value = value.isoformat()
-                        elif isinstance(value, bytes):
-                            value = value.decode('utf-8', errors='ignore')
-                        
-                        record[key] = value
-                    
-                    batch.append(record)
+                batch = _rows_to_records(columns, rows)
                 
-                logger.debug(f"✅ Batch {batch_count} processado e convertido")
+                logger.debug("✅ Batch %d processado e convertido", batch_count)
                 yield batch
         except Exception as e:
-            logger.error(f"❌ Erro durante extração SQLite: {e}")
+            logger.error("❌ Erro durante extração SQLite: %s", e)
             raise
         finally:
             if cursor:
                 cursor.close()
 
 
+class ConnectorXExtractor(DataExtractor):
+    """
+    Extrator colunar via ConnectorX para SQL Server, PostgreSQL e MySQL.
+    
+    O ConnectorX lê o protocolo do banco direto para buffers Arrow em Rust, sem
+    laço Python por linha. O resultado é materializado inteiro antes de ser
+    fatiado em lotes, então é indicado para cargas grandes que cabem em memória.
+    Com partition_on/partition_num a leitura é dividida em faixas da coluna
+    numérica, cada uma em sua própria conexão.
+    """
+    
+    # Esquema da URI de conexão por dialeto
+    URI_SCHEMES = {
+        'sqlserver': 'mssql',
+        'postgresql': 'postgresql',
+        'mysql': 'mysql',
+    }
+    
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        if _connectorx() is None:
+            raise ImportError("connectorx não está disponível. Instale com: pip install connectorx pyarrow")
+        self.dialect = _base_source_type(config.get('type'))
+        if self.dialect not in self.URI_SCHEMES:
+            raise ValueError(f"ConnectorX não suporta a fonte: {config.get('type')}")
+        self.partition_on: Optional[str] = None
+        self.partition_num = 1
+    
+    def _connection_uri(self) -> str:
+        """Monta a URI de conexão no formato esperado pelo ConnectorX."""
+        from urllib.parse import quote
+        
+        username = quote(str(self.config.get('username') or self.config.get('user') or ''), safe='')
+        password = quote(str(self.config.get('password') or ''), safe='')
+        host = self.config.get('host', 'localhost')
+        port = self.config.get('port') or _DEFAULT_PORTS[self.dialect]
+        database = quote(str(self.config.get('database') or ''), safe='')
+        return f"{self.URI_SCHEMES[self.dialect]}://{username}:{password}@{host}:{port}/{database}"
+    
+    def connect(self) -> bool:
+        """Prepara a URI de conexão (o ConnectorX abre as conexões a cada leitura)."""
+        if self._fast_fail_unreachable(_DEFAULT_PORTS[self.dialect]):
+            return False
+        self.connection = self._connection_uri()
+        return True
+    
+    def disconnect(self) -> None:
+        """Descarta a URI de conexão."""
+        self.connection = None
+    
+    def test_connection(self) -> bool:
+        """Testa conexão executando uma consulta trivial."""
+        try:
+            if not self.connection:
+                return False
+            _connectorx().read_sql(self.connection, "SELECT 1", return_type='arrow')
+            return True
+        except Exception as e:
+            logger.error("Erro no teste de conexão ConnectorX: %s", e)
+            return False
+    
+    def _inline_params(self, query: str, params: Sequence[Any]) -> str:
+        """
+        Insere os parâmetros como literais (read_sql não aceita parâmetros).
+        
+        Args:
+            query: Query com marcadores no estilo do dialeto
+            params: Parâmetros na ordem dos marcadores
+            
+        Returns:
+            Query com literais SQL
+        """
+        placeholder = '?' if self.dialect == 'sqlserver' else '%s'
+        parts = query.split(placeholder)
+        if len(parts) != len(params) + 1:
+            raise ValueError("Número de parâmetros não confere com os marcadores da query")
+        literals = [
+            str(value) if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool)
+            else "'" + str(value).replace("'", "''") + "'"
+            for value in params
+        ]
+        return ''.join(part + literal for part, literal in zip(parts, literals)) + parts[-1]
+    
+    def extract_data(self, query: str, batch_size: int = 1000,
+                     params: Optional[Sequence[Any]] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Extrai dados via ConnectorX em lotes fatiados da tabela Arrow."""
+        if not self.connection:
+            raise RuntimeError("Conexão não estabelecida")
+        
+        import pyarrow.types as pa_types
+        
+        if params:
+            query = self._inline_params(query, params)
+        options: Dict[str, Any] = {}
+        if self.partition_on and self.partition_num > 1:
+            options = {'partition_on': self.partition_on, 'partition_num': self.partition_num}
+        
+        table = _connectorx().read_sql(self.connection, query, return_type='arrow', **options)
+        
+        # Só colunas de data/hora e binárias precisam de conversão
+        fix_keys = [
+            field.name for field in table.schema
+            if pa_types.is_temporal(field.type) or pa_types.is_binary(field.type)
+            or pa_types.is_large_binary(field.type) or pa_types.is_fixed_size_binary(field.type)
+        ]
+        for record_batch in table.to_batches(max_chunksize=batch_size):
+            if record_batch.num_rows:
+                yield _fix_dict_rows(record_batch.to_pylist(), fix_keys)
+
+
 class ExtractorFactory:
     """Factory para criar extratores baseados no tipo de fonte."""
     
@@ -751,9 +1902,29 @@ class ExtractorFactory:
         'sqlserver': SQLServerExtractor,
         'postgresql': PostgreSQLExtractor,
         'mysql': MySQLExtractor,
-        'sqlite': SQLiteExtractor
+        'sqlite': SQLiteExtractor,
+        'sqlserver_cx': ConnectorXExtractor,
+        'postgresql_cx': ConnectorXExtractor,
+        'mysql_cx': ConnectorXExtractor,
     }
     
+    # Mensagem de erro com os tipos disponíveis, montada uma única vez
+    _AVAILABLE_MSG = ', '.join(EXTRACTORS)
+    
+    @classmethod
+    @functools.lru_cache(maxsize=16)
+    def _get_class(cls, source_type: str) -> Optional[type]:
+        """
+        Obtém a classe do extrator para um tipo de fonte (sem diferenciar maiúsculas).
+        
+        Args:
+            source_type: Tipo da fonte como veio da configuração
+            
+        Returns:
+            Classe do extrator ou None se o tipo não for suportado
+        """
+        return cls.EXTRACTORS.get(source_type.lower())
+    
     @classmethod
     def create_extractor(cls, source_type: str, config: Dict[str, Any]) -> DataExtractor:
         """
@@ -769,13 +1940,10 @@ class ExtractorFactory:
         Raises:
             ValueError: Se o tipo de fonte não for suportado
         """
-        source_type = source_type.lower()
-        
-        if source_type not in cls.EXTRACTORS:
-            available = ', '.join(cls.EXTRACTORS.keys())
-            raise ValueError(f"Tipo de fonte não suportado: {source_type}. Disponíveis: {available}")
+        extractor_class = cls._get_class(source_type)
+        if extractor_class is None:
+            raise ValueError(f"Tipo de fonte não suportado: {source_type.lower()}. Disponíveis: {cls._AVAILABLE_MSG}")
         
-        extractor_class = cls.EXTRACTORS[source_type]
         return extractor_class(config)
     
     @classmethod
@@ -789,127 +1957,337 @@ class ExtractorFactory:
         return list(cls.EXTRACTORS.keys())
 
 
+def _pk_partition_queries(mapping_config: Dict[str, Any], source_type: str,
+                          low: int, high: int, partitions: int) -> List[Tuple[str, Tuple[Any, ...]]]:
+    """
+    Divide a faixa [low, high] da PK em consultas independentes.
+    
+    Args:
+        mapping_config: Configuração do mapeamento
+        source_type: Tipo da fonte (delimitadores e marcador de parâmetro)
+        low: Menor valor da PK a extrair
+        high: Maior valor da PK a extrair
+        partitions: Número máximo de partições
+        
+    Returns:
+        Lista de (query, parâmetros), uma por faixa não vazia
+    """
+    transfer = mapping_config.get('transfer', {})
+    table = _quote_identifier(mapping_config['table'], source_type)
+    pk = _quote_identifier(transfer['pk_column'], source_type)
+    mark = _placeholder(source_type)
+    step = -(-(high - low + 1) // partitions)  # divisão com arredondamento para cima
+    
+    queries = []
+    start = low
+    while start <= high:
+        end = min(start + step - 1, high)
+        queries.append((
+            f"SELECT * FROM {table} WHERE {pk} >= {mark} AND {pk} <= {mark} ORDER BY {pk} ASC",
+            (start, end),
+        ))
+        start = end + 1
+    return queries
+
+
+def _extract_partitioned(extractor: DataExtractor, mapping_config: Dict[str, Any],
+                         source_type: str, batch_size: int,
+                         partitions: int) -> Optional[Iterator[List[Dict[str, Any]]]]:
+    """
+    Extrai a tabela em faixas da PK, em paralelo, cada faixa com sua própria conexão.
+    
+    Uma consulta MIN/MAX define a faixa a dividir; cada partição roda em um
+    extrator próprio (conexão do pool) e os lotes passam por uma fila limitada.
+    A ordem dos lotes entre partições não é garantida.
+    
+    Args:
+        extractor: Extrator já conectado (usado para a consulta MIN/MAX e
+            desconectado antes das partições)
+        mapping_config: Configuração do mapeamento
+        source_type: Tipo da fonte
+        batch_size: Tamanho do lote
+        partitions: Número de partições
+        
+    Returns:
+        Iterador de lotes ou None se a PK não for inteira (usar a extração sequencial)
+    """
+    transfer = mapping_config.get('transfer', {})
+    table = _quote_identifier(mapping_config['table'], source_type)
+    pk = _quote_identifier(transfer['pk_column'], source_type)
+    
+    bounds_query = f"SELECT MIN({pk}) AS range_min, MAX({pk}) AS range_max FROM {table}"
+    bounds_params: Tuple[Any, ...] = ()
+    if transfer.get('incremental_mode') == 'incremental_pk':
+        bounds_query += f" WHERE {pk} > {_placeholder(source_type)}"
+        bounds_params = (_coerce_watermark(transfer.get('initial_watermark', '0')),)
+    
+    bounds_batches = extractor.extract_data(bounds_query, 1, bounds_params)
+    try:
+        bounds = next(bounds_batches, None) or [{}]
+    finally:
+        bounds_batches.close()
+    low = bounds[0].get('range_min')
+    high = bounds[0].get('range_max')
+    if low is None or high is None:
+        return iter(())
+    if not all(isinstance(value, int) and not isinstance(value, bool) for value in (low, high)):
+        logger.info("PK não inteira; extração paralela desativada")
+        return None
+    
+    # A conexão do extrator principal volta ao pool antes de as partições
+    # pedirem as suas (com todas emprestadas, uma partição esperaria em vão)
+    extractor.disconnect()
+    
+    ranges = _pk_partition_queries(mapping_config, source_type, low, high, partitions)
+    logger.info("🔀 Extração paralela em %d partições de %s (%s..%s)", len(ranges), transfer['pk_column'], low, high)
+    
+    def _produce(emit: Callable[[Any], None]) -> None:
+        failed = threading.Event()
+        
+        def _extract_range(query: str, params: Tuple[Any, ...]) -> None:
+            part = type(extractor)(extractor.config)
+            part.streaming = extractor.streaming
+            try:
+                with part:
+                    for batch in part.extract_data(query, batch_size, params):
+                        if failed.is_set():
+                            raise _PartitionAborted()
+                        emit(batch)
+            except _PartitionAborted:
+                raise
+            except BaseException:
+                failed.set()
+                raise
+        
+        with ThreadPoolExecutor(max_workers=len(ranges), thread_name_prefix="bridge-partition") as pool:
+            futures = [pool.submit(_extract_range, query, params) for query, params in ranges]
+            wait(futures, return_when=FIRST_EXCEPTION)
+        
+        # Relança a falha real (as demais partições apenas abortaram); um
+        # _ProducerStopped (consumidor parou) só é relançado se não houver outra
+        errors = [future.exception() for future in futures if future.exception() is not None]
+        errors = [e for e in errors if not isinstance(e, _PartitionAborted)]
+        errors.sort(key=lambda e: isinstance(e, _ProducerStopped))
+        if errors:
+            raise errors[0]
+    
+    return _produce_in_thread(_produce, maxsize=4)
+
+
+def _create_mapping_extractor(mapping_config: Dict[str, Any], source_type: str,
+                              source_config: Mapping) -> DataExtractor:
+    """
+    Cria o extrator da fonte com as opções de transferência do mapeamento
+    (streaming, COPY do PostgreSQL, partições do ConnectorX).
+    
+    Args:
+        mapping_config: Configuração do mapeamento
+        source_type: Tipo da fonte de dados
+        source_config: Configuração resolvida da fonte
+        
+    Returns:
+        Extrator configurado (ainda sem conexão)
+    """
+    logger.debug("🏭 Criando extrator para %s...", source_type)
+    extractor = ExtractorFactory.create_extractor(source_type, source_config)
+    transfer = mapping_config.get('transfer', {})
+    extractor.streaming = bool(transfer.get('streaming', extractor.streaming))
+    if (isinstance(extractor, PostgreSQLExtractor) and transfer.get('pg_copy')
+            and not mapping_config.get('query')
+            and transfer.get('incremental_mode', 'full') == 'full'):
+        # COPY só para carga completa gerada automaticamente
+        extractor.copy_mode = True
+    if isinstance(extractor, ConnectorXExtractor) and transfer.get('cx_partitions'):
+        # Leitura paralela em faixas da PK, uma conexão por partição
+        extractor.partition_on = transfer.get('pk_column')
+        extractor.partition_num = int(transfer['cx_partitions'])
+    return extractor
+
+
+def _partition_count(extractor: DataExtractor, mapping_config: Dict[str, Any]) -> int:
+    """
+    Número de partições paralelas por faixa da PK a usar no mapeamento.
+    
+    Args:
+        extractor: Extrator configurado
+        mapping_config: Configuração do mapeamento
+        
+    Returns:
+        Número de partições, ou 0 quando a extração não é particionada
+    """
+    transfer = mapping_config.get('transfer', {})
+    partitions = int(transfer.get('parallel_partitions') or 0)
+    if not (partitions > 1 and not mapping_config.get('query')
+            and not getattr(extractor, 'copy_mode', False)
+            and bool(transfer.get('pk_column'))
+            and transfer.get('incremental_mode', 'full') in ('full', 'incremental_pk')):
+        return 0
+    
+    # Cada partição usa uma conexão do pool da fonte: mais partições que
+    # `pool_max` esperariam por conexões e falhariam por tempo esgotado
+    pool_max = int(extractor.config.get('pool_max', DEFAULT_POOL_MAX))
+    if 0 < pool_max < partitions:
+        logger.warning("⚠️ parallel_partitions=%d limitado a pool_max=%d", partitions, pool_max)
+        partitions = pool_max
+    return partitions if partitions > 1 else 0
+
+
+def _failed_result(error_msg: str, start_time: int, sql: Optional[str] = None) -> ExtractionResult:
+    """
+    Registra o erro e monta o resultado de uma extração que falhou.
+    
+    Args:
+        error_msg: Mensagem de erro
+        start_time: Timestamp de início da extração
+        sql: Query em execução quando o erro ocorreu, se houver
+        
+    Returns:
+        Resultado da extração sem registros
+    """
+    if sql:
+        logger.error("❌ %s. SQL executado: %s", error_msg, sql)
+    else:
+        logger.error("❌ %s", error_msg)
+    return ExtractionResult(
+        success=False,
+        record_count=0,
+        error_message=error_msg,
+        start_time=start_time,
+        end_time=get_current_timestamp()
+    )
+
+
 def extract_mapping_data(mapping_config: Dict[str, Any], 
-                        batch_size: int = 1000) -> ExtractionResult:
+                        batch_size: int = 1000,
+                        collect: bool = True) -> ExtractionResult:
     """
     Extrai dados de um mapeamento específico.
     
     Args:
         mapping_config: Configuração do mapeamento
         batch_size: Tamanho do lote para extração
+        collect: Se False, apenas conta os registros (data vem como lista vazia)
         
     Returns:
         Resultado da extração
     """
     start_time = get_current_timestamp()
+    started = time.perf_counter()
     mapping_name = mapping_config.get('name', 'unknown')
     
-    logger.debug(f"🔄 Iniciando extração para mapeamento: {mapping_name}")
+    logger.debug("🔄 Iniciando extração para mapeamento: %s", mapping_name)
     
     try:
         # Resolve a configuração da fonte usando connection_ref
-        logger.info(f"🔍 Configuração recebida para extração: {json.dumps(mapping_config, indent=2, default=str)}")
-        logger.debug(f"🔍 Resolvendo configuração da fonte de dados...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔍 Configuração recebida para extração: %s", json.dumps(mapping_config, default=str))
+        logger.debug("🔍 Resolvendo configuração da fonte de dados...")
         source_config = _resolve_source_config(mapping_config)
         if not source_config:
-            error_msg = "Não foi possível resolver a configuração da fonte de dados"
-            logger.error(f"❌ {error_msg}")
-            return ExtractionResult(
-                success=False,
-                record_count=0,
-                error_message=error_msg,
-                start_time=start_time,
-                end_time=get_current_timestamp()
-            )
+            return _failed_result("Não foi possível resolver a configuração da fonte de dados", start_time)
         
         source_type = source_config.get('type')
         host = source_config.get('host', 'N/A')
         database = source_config.get('database', 'N/A')
         
-        logger.info(f"🗄️ Fonte de dados: {source_type.upper()}")
+        logger.info("🗄️ Fonte de dados: %s", source_type.upper())
         
         if source_type == 'laravel_log':
             records = _extract_laravel_log_records(source_config)
             # Se houver erro, _extract_laravel_log_records lançará exceção que será capturada abaixo
             
-            end_time = get_current_timestamp()
-            extraction_time = end_time - start_time
             return ExtractionResult(
                 success=True,
                 record_count=len(records),
-                data=records,
-                extraction_time=extraction_time,
+                data=records if collect else [],
+                extraction_time=time.perf_counter() - started,
                 start_time=start_time,
-                end_time=end_time
+                end_time=get_current_timestamp()
             )
         
         # Constrói a query automaticamente se não existir
-        logger.debug(f"🔧 Construindo query SQL...")
-        query = build_sql_query(mapping_config)
+        logger.debug("🔧 Construindo query SQL...")
+        built_query = build_sql_query_with_params(mapping_config, source_type)
+        query, params = built_query if built_query else (None, ())
         
         if not source_type:
-            error_msg = "Tipo de fonte não especificado"
-            logger.error(f"❌ {error_msg}")
-            return ExtractionResult(
-                success=False,
-                record_count=0,
-                error_message=error_msg,
-                start_time=start_time,
-                end_time=get_current_timestamp()
-            )
+            return _failed_result("Tipo de fonte não especificado", start_time)
         
         if not query:
-            error_msg = "Não foi possível construir a query SQL"
-            logger.error(f"❌ {error_msg}")
-            return ExtractionResult(
-                success=False,
-                record_count=0,
-                error_message=error_msg,
-                start_time=start_time,
-                end_time=get_current_timestamp()
-            )
+            return _failed_result("Não foi possível construir a query SQL", start_time)
         
         # Log da query que será executada
-        logger.info(f"📝 Query SQL: {query}")
+        logger.info("📝 Query SQL: %s", query)
+        if params:
+            logger.info("📎 Parâmetros: %s", list(params))
         
         # Cria o extrator
-        logger.debug(f"🏭 Criando extrator para {source_type}...")
-        extractor = ExtractorFactory.create_extractor(source_type, source_config)
+        extractor = _create_mapping_extractor(mapping_config, source_type, source_config)
         
         # Extrai os dados
         record_count = 0
         all_data = []
         batch_count = 0
+        prealloc = collect and bool(mapping_config.get('transfer', {}).get('prealloc'))
+        partitions = _partition_count(extractor, mapping_config)
+        partitioned = partitions > 1
+        if partitioned:
+            prealloc = False
         
-        logger.debug(f"🔌 Estabelecendo conexão com a fonte de dados...")
+        logger.debug("🔌 Estabelecendo conexão com a fonte de dados...")
         with extractor:
-            logger.debug(f"🧪 Testando conexão...")
-            if not extractor.test_connection():
-                error_msg = "Falha na conexão com a fonte de dados"
-                logger.error(f"❌ {error_msg}")
-                return ExtractionResult(
-                    success=False,
-                    record_count=0,
-                    error_message=error_msg,
-                    start_time=start_time,
-                    end_time=get_current_timestamp()
-                )
+            # Sem SELECT 1 prévio: o connect já valida a conexão e uma conexão
+            # quebrada falha na própria query de extração
+            if extractor.connection is None:
+                return _failed_result("Falha na conexão com a fonte de dados", start_time)
             
-            logger.info(f"✅ Conexão estabelecida com sucesso!")
-            logger.debug(f"📊 Iniciando extração de dados em lotes de {batch_size} registros...")
+            logger.info("✅ Conexão estabelecida com sucesso!")
+            logger.debug("📊 Iniciando extração de dados em lotes de %s registros...", batch_size)
             
-            for batch in extractor.extract_data(query, batch_size):
+            total_in_rows = False
+            if prealloc:
+                if not mapping_config.get('query') and extractor.supports_count_over():
+                    # A contagem vem na primeira linha (COUNT(*) OVER()), sem ida extra ao banco
+                    query, params = build_sql_query_with_params(mapping_config, source_type, with_total=True)
+                    total_in_rows = True
+                else:
+                    # Contar à parte executaria a query duas vezes; a lista cresce normalmente
+                    logger.debug("prealloc ignorado: fonte sem COUNT(*) OVER() ou query customizada")
+                    prealloc = False
+            
+            batches = None
+            if partitioned:
+                batches = _extract_partitioned(extractor, mapping_config, source_type, batch_size, partitions)
+            if batches is None:
+                # A busca do próximo lote no banco acontece em paralelo ao consumo deste
+                batches = _prefetch_batches(extractor.extract_data(query, batch_size, params))
+            
+            for batch in batches:
                 batch_count += 1
                 batch_size_actual = len(batch)
+                if total_in_rows:
+                    if batch_count == 1:
+                        all_data = [None] * int(batch[0].get(TOTAL_COLUMN) or 0)
+                    for record in batch:
+                        record.pop(TOTAL_COLUMN, None)
+                if prealloc:
+                    # Atribuição por fatia; cresce normalmente se a estimativa ficar curta
+                    all_data[record_count:record_count + batch_size_actual] = batch
+                elif collect:
+                    all_data.extend(batch)
                 record_count += batch_size_actual
-                all_data.extend(batch)
                 
-                logger.debug(f"📦 Lote {batch_count}: {batch_size_actual} registros extraídos (Total: {record_count})")
+                logger.debug("📦 Lote %d: %d registros extraídos (Total: %d)", batch_count, batch_size_actual, record_count)
+                if batch_count % PROGRESS_LOG_EVERY_BATCHES == 0:
+                    logger.info("⏳ %d registros extraídos até agora", record_count)
+            
+            if prealloc and len(all_data) > record_count:
+                # Registros removidos entre a contagem e a leitura
+                del all_data[record_count:]
         
-        end_time = get_current_timestamp()
-        extraction_time = end_time - start_time
+        extraction_time = time.perf_counter() - started
         
-        logger.info(f"✅ Extração concluída: {record_count} registros em {batch_count} lotes | Tempo: {format_duration(extraction_time)}")
+        logger.info("✅ Extração concluída: %s registros em %s lotes | Tempo: %s", record_count, batch_count, format_duration(extraction_time))
         
         return ExtractionResult(
             success=True,
@@ -917,28 +2295,143 @@ def extract_mapping_data(mapping_config: Dict[str, Any],
             data=all_data,
             extraction_time=extraction_time,
             start_time=start_time,
-            end_time=end_time
+            end_time=get_current_timestamp()
         )
         
     except Exception as e:
-        end_time = get_current_timestamp()
-        error_msg = f"Erro na extração: {e}"
-        try:
-            failed_sql = query  # pode não existir se erro ocorrer antes
-        except NameError:
-            failed_sql = None
-        if failed_sql:
-            logger.error(f"❌ {error_msg}. SQL executado: {failed_sql}")
-        else:
-            logger.error(f"❌ {error_msg}")
+        # query pode não existir se o erro ocorrer antes de sua construção
+        return _failed_result(f"Erro na extração: {e}", start_time, sql=locals().get('query'))
+
+
+def stream_mapping_data(mapping_config: Dict[str, Any],
+                        batch_size: int = 1000) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Extrai dados de um mapeamento em lotes, sem acumular o resultado.
+    
+    Diferente de extract_mapping_data, cada lote é entregue assim que lido e
+    pode ser descartado pelo consumidor: a memória fica em O(batch_size) em
+    vez de O(registros). A conexão é fechada quando o gerador termina ou é
+    fechado.
+    
+    Args:
+        mapping_config: Configuração do mapeamento
+        batch_size: Tamanho do lote para extração
         
-        return ExtractionResult(
-            success=False,
-            record_count=0,
-            error_message=error_msg,
-            start_time=start_time,
-            end_time=end_time
-        )
+    Yields:
+        Lotes de registros
+        
+    Raises:
+        RuntimeError: Se a fonte não puder ser resolvida, conectada ou consultada
+    """
+    mapping_name = mapping_config.get('name', 'unknown')
+    logger.debug("🔄 Iniciando extração em lotes para mapeamento: %s", mapping_name)
+    
+    source_config = _resolve_source_config(mapping_config)
+    if not source_config:
+        raise RuntimeError("Não foi possível resolver a configuração da fonte de dados")
+    
+    source_type = source_config.get('type')
+    if not source_type:
+        raise RuntimeError("Tipo de fonte não especificado")
+    
+    logger.info("🗄️ Fonte de dados: %s", source_type.upper())
+    
+    if source_type == 'laravel_log':
+        # O parser do log já devolve a lista inteira; só é fatiada em lotes
+        records = _extract_laravel_log_records(source_config)
+        for start in range(0, len(records), batch_size):
+            yield records[start:start + batch_size]
+        return
+    
+    built_query = build_sql_query_with_params(mapping_config, source_type)
+    query, params = built_query if built_query else (None, ())
+    if not query:
+        raise RuntimeError("Não foi possível construir a query SQL")
+    
+    logger.info("📝 Query SQL: %s", query)
+    if params:
+        logger.info("📎 Parâmetros: %s", list(params))
+    
+    extractor = _create_mapping_extractor(mapping_config, source_type, source_config)
+    partitions = _partition_count(extractor, mapping_config)
+    
+    with extractor:
+        if extractor.connection is None:
+            raise RuntimeError("Falha na conexão com a fonte de dados")
+        
+        batches = None
+        if partitions > 1:
+            batches = _extract_partitioned(extractor, mapping_config, source_type, batch_size, partitions)
+        if batches is None:
+            # A busca do próximo lote no banco acontece em paralelo ao consumo deste
+            batches = _prefetch_batches(extractor.extract_data(query, batch_size, params))
+        
+        yield from batches
+
+
+def _get_extraction_executor() -> ThreadPoolExecutor:
+    """
+    Obtém o pool de threads compartilhado das extrações, criando-o na primeira chamada.
+    
+    Returns:
+        Executor usado por extract_mapping_data_async
+    """
+    global _extraction_executor
+    if _extraction_executor is None:
+        with _extraction_executor_lock:
+            if _extraction_executor is None:
+                _extraction_executor = ThreadPoolExecutor(
+                    max_workers=EXTRACTION_MAX_WORKERS,
+                    thread_name_prefix="bridge-extract"
+                )
+    return _extraction_executor
+
+
+async def extract_mapping_data_async(mapping_config: Dict[str, Any],
+                                     batch_size: int = 1000,
+                                     collect: bool = True) -> ExtractionResult:
+    """
+    Versão assíncrona de extract_mapping_data.
+    
+    A extração (bloqueante, limitada por I/O de rede) roda no pool de threads
+    compartilhado, liberando o event loop para outras extrações.
+    
+    Args:
+        mapping_config: Configuração do mapeamento
+        batch_size: Tamanho do lote para extração
+        collect: Se False, apenas conta os registros
+        
+    Returns:
+        Resultado da extração
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_extraction_executor(),
+        functools.partial(extract_mapping_data, mapping_config, batch_size, collect)
+    )
+
+
+async def extract_many(mapping_configs: List[Dict[str, Any]],
+                       batch_size: int = 1000,
+                       collect: bool = True) -> List[ExtractionResult]:
+    """
+    Extrai dados de vários mapeamentos independentes de forma concorrente.
+    
+    O tempo total tende a max(t_i) em vez de sum(t_i) quando os mapeamentos
+    apontam para tabelas/bancos diferentes.
+    
+    Args:
+        mapping_configs: Lista de configurações de mapeamento
+        batch_size: Tamanho do lote para extração
+        collect: Se False, apenas conta os registros
+        
+    Returns:
+        Resultados na mesma ordem das configurações recebidas
+    """
+    results = await asyncio.gather(
+        *(extract_mapping_data_async(config, batch_size, collect) for config in mapping_configs)
+    )
+    return list(results)
 
 
 def delete_records_after_upload(mapping_config: Dict[str, Any], record_ids: List[Any], pk_column: str) -> DeletionResult:
@@ -985,11 +2478,12 @@ def delete_records_after_upload(mapping_config: Dict[str, Any], record_ids: List
         if delete_safety.get('enabled', False):
             where_column = delete_safety.get('where_column')
             if where_column and where_column != pk_column:
-                logger.warning(f"⚠️ Configuração de segurança delete_safety habilitada com coluna diferente da PK")
+                logger.warning("⚠️ Configuração de segurança delete_safety habilitada com coluna diferente da PK")
         
-        logger.info(f"🗑️ Iniciando deleção de {len(record_ids)} registros da tabela {table_name}")
+        logger.info("🗑️ Iniciando deleção de %s registros da tabela %s", len(record_ids), table_name)
         
-        # Cria o extrator para executar a deleção
+        # Cria o extrator para executar a deleção (ConnectorX só lê: usa o driver DB-API)
+        source_type = _base_source_type(source_type)
         extractor = ExtractorFactory.create_extractor(source_type, source_config)
         
         deleted_count = 0
@@ -1000,10 +2494,11 @@ def delete_records_after_upload(mapping_config: Dict[str, Any], record_ids: List
                 batch_ids = record_ids[i:i + batch_size]
                 
                 # Constrói a query de deleção
-                placeholders = ','.join(['?' if source_type in ['sqlserver', 'sqlite'] else '%s'] * len(batch_ids))
-                delete_query = f"DELETE FROM {table_name} WHERE {pk_column} IN ({placeholders})"
+                placeholders = ','.join([_placeholder(source_type)] * len(batch_ids))
+                delete_query = (f"DELETE FROM {_quote_identifier(table_name, source_type)} "
+                                f"WHERE {_quote_identifier(pk_column, source_type)} IN ({placeholders})")
                 
-                logger.debug(f"🔄 Executando deleção do lote {i//batch_size + 1}: {len(batch_ids)} registros")
+                logger.debug("🔄 Executando deleção do lote %d: %d registros", i // batch_size + 1, len(batch_ids))
                 
                 # Executa a deleção
                 cursor = extractor.connection.cursor()
@@ -1015,11 +2510,11 @@ def delete_records_after_upload(mapping_config: Dict[str, Any], record_ids: List
                 extractor.connection.commit()
                 cursor.close()
                 
-                logger.debug(f"✅ Lote {i//batch_size + 1} concluído: {batch_deleted} registros deletados")
+                logger.debug("✅ Lote %d concluído: %d registros deletados", i // batch_size + 1, batch_deleted)
         
         deletion_time = time.time() - start_time
         
-        logger.info(f"✅ Deleção concluída: {deleted_count} registros removidos em {deletion_time:.2f}s")
+        logger.info("✅ Deleção concluída: %s registros removidos em %.2fs", deleted_count, deletion_time)
         
         return DeletionResult(
             success=True,
@@ -1033,7 +2528,7 @@ def delete_records_after_upload(mapping_config: Dict[str, Any], record_ids: List
         # Tentar logar a query e parâmetros
         dq = delete_query if 'delete_query' in locals() else None
         params = batch_ids if 'batch_ids' in locals() else None
-        logger.error(f"❌ {error_msg}. SQL executado: {dq} | params: {params}")
+        logger.error("❌ %s. SQL executado: %s | params: %s", error_msg, dq, params)
         
         return DeletionResult(
             success=False,
@@ -1070,11 +2565,19 @@ def test_source_connection(source_config: Dict[str, Any]) -> Tuple[bool, str]:
                 return True, "Arquivo de log encontrado"
             return False, "Arquivo de log não encontrado"
         
-        # Para desenvolvimento, simula conexão bem-sucedida para MySQL
-        if source_type == 'mysql':
-            logger.info(f"Simulando conexão MySQL bem-sucedida para desenvolvimento")
+        # Simulação de conexão MySQL apenas quando habilitada explicitamente (desenvolvimento)
+        if source_type == 'mysql' and os.environ.get('BRIDGE_MOCK_MYSQL') == '1':
+            logger.warning("⚠️ BRIDGE_MOCK_MYSQL=1: simulando conexão MySQL bem-sucedida (não use em produção)")
             return True, "Conexão simulada bem-sucedida (desenvolvimento)"
         
+        # Falha rápido se o host não aceita conexões TCP, antes do handshake do driver
+        base_type = _base_source_type(source_type)
+        if base_type in _DEFAULT_PORTS:
+            host = source_config.get('host', 'localhost')
+            port = source_config.get('port') or _DEFAULT_PORTS[base_type]
+            if not _probe_tcp(host, port):
+                return False, f"Host {host}:{port} inacessível"
+        
         # Cria o extrator e testa a conexão para outros tipos
         extractor = ExtractorFactory.create_extractor(source_type, source_config)
         
@@ -1117,7 +2620,7 @@ def _extract_laravel_log_records(source_config: Dict[str, Any]) -> List[Dict[str
     if offset_file.exists():
         try:
             last_offset = int(offset_file.read_text().strip())
-            logger.info(f"📍 Retomando leitura do offset: {last_offset} bytes")
+            logger.info("📍 Retomando leitura do offset: %s bytes", last_offset)
         except (ValueError, IOError):
             last_offset = 0
     
@@ -1130,7 +2633,7 @@ def _extract_laravel_log_records(source_config: Dict[str, Any]) -> List[Dict[str
     # Verifica se arquivo foi rotacionado (menor que offset anterior)
     file_size = os.path.getsize(path)
     if file_size < last_offset:
-        logger.info(f"📄 Arquivo parece ter sido rotacionado (tamanho atual: {file_size}, offset anterior: {last_offset}). Reiniciando do início.")
+        logger.info("📄 Arquivo parece ter sido rotacionado (tamanho atual: %s, offset anterior: %s). Reiniciando do início.", file_size, last_offset)
         last_offset = 0
     
     current_offset = last_offset
@@ -1204,7 +2707,7 @@ def _extract_laravel_log_records(source_config: Dict[str, Any]) -> List[Dict[str
     source_config['_new_offset'] = current_offset
     source_config['_offset_file'] = str(offset_file)
     
-    logger.info(f"📊 Extraídos {len(records)} novos registros de log (offset: {last_offset} -> {current_offset})")
+    logger.info("📊 Extraídos %s novos registros de log (offset: %s -> %s)", len(records), last_offset, current_offset)
     
     return records
 
@@ -1237,9 +2740,9 @@ def commit_laravel_log_offset(source_config: Dict[str, Any], truncate: bool = Fa
             if Path(offset_file).exists():
                 Path(offset_file).unlink()
             
-            logger.info(f"🧹 Arquivo de log truncado após sync bem-sucedido: {path}")
+            logger.info("🧹 Arquivo de log truncado após sync bem-sucedido: %s", path)
         except Exception as e:
-            logger.warning(f"⚠️ Não foi possível truncar arquivo de log: {e}")
+            logger.warning("⚠️ Não foi possível truncar arquivo de log: %s", e)
             # Fallback: salva offset
             try:
                 Path(offset_file).write_text(str(new_offset))
@@ -1249,7 +2752,7 @@ def commit_laravel_log_offset(source_config: Dict[str, Any], truncate: bool = Fa
         # Salva offset para próxima execução
         try:
             Path(offset_file).write_text(str(new_offset))
-            logger.debug(f"📍 Offset salvo: {new_offset} em {offset_file}")
+            logger.debug("📍 Offset salvo: %s em %s", new_offset, offset_file)
         except Exception as e:
-            logger.warning(f"⚠️ Não foi possível salvar offset: {e}")
+            logger.warning("⚠️ Não foi possível salvar offset: %s", e)
 
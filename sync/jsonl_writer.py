@@ -3,36 +3,77 @@ Módulo para escrita de arquivos JSONL (JSON Lines).
 Gerencia a criação e escrita de arquivos no formato JSONL para upload.
 """
 
-import json
+import io
 import gzip
 import logging
-from typing import Dict, Any, List, Optional, Iterator, Union
+import queue
+import threading
+from typing import Callable, Dict, Any, List, Optional, Iterator, Union
 from pathlib import Path
 from dataclasses import dataclass
 import time
 import hashlib
 from contextlib import contextmanager
-from decimal import Decimal
+from itertools import islice
 
+try:
+    from isal import igzip
+    ISAL_AVAILABLE = True
+except ImportError:
+    igzip = None
+    ISAL_AVAILABLE = False
+
+from core.compat import DATACLASS_SLOTS
 from core.paths import BridgePaths
 from core.timeutil import get_current_timestamp, format_duration
+from sync.serialization import DecimalEncoder, dumps_line, dumps_record, loads  # noqa: F401 (DecimalEncoder reexportado)
 
 
 logger = logging.getLogger(__name__)
 
+# Volume acumulado por escrita em write_from_iterator
+WRITE_CHUNK_BYTES = 1024 * 1024
+
+# Buffer entre o escritor e o arquivo (ou o compressor gzip)
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Blocos aguardando o thread de escrita quando async_io está ativo
+ASYNC_QUEUE_SIZE = 4
+
+# Sinaliza o fim da fila do thread de escrita
+_WRITER_SENTINEL = object()
+
+# Tamanho das leituras em validate_jsonl_file
+VALIDATE_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Registros escritos entre verificações de tamanho em JSONLBatchWriter.write_record
+ROTATION_CHECK_INTERVAL = 1024
+
+# Nível de compressão gzip (9, o padrão do módulo gzip, custa bem mais CPU)
+GZIP_COMPRESSLEVEL = 6
 
-class DecimalEncoder(json.JSONEncoder):
-    """Encoder JSON personalizado para lidar com objetos Decimal."""
+# Nível de compressão do ISA-L (0 a 3); o formato gerado é o mesmo gzip
+ISAL_COMPRESSLEVEL = 1
+
+
+def _open_gzip(file_path: Path):
+    """
+    Abre um arquivo gzip para escrita, usando ISA-L (python-isal) quando instalado.
     
-    def default(self, obj):
-        if isinstance(obj, Decimal):
-            return float(obj)
-        return super().default(obj)
+    Args:
+        file_path: Caminho do arquivo
+        
+    Returns:
+        Arquivo gzip aberto em modo binário
+    """
+    if ISAL_AVAILABLE:
+        return igzip.open(file_path, 'wb', compresslevel=ISAL_COMPRESSLEVEL)
+    return gzip.open(file_path, 'wb', compresslevel=GZIP_COMPRESSLEVEL)
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class JSONLFileInfo:
-    """Informações sobre um arquivo JSONL."""
+    """Informações sobre um arquivo JSONL (imutável, sem __dict__ por instância)."""
     file_path: Path
     record_count: int
     file_size: int
@@ -60,7 +101,9 @@ class JSONLWriter:
     """Escritor de arquivos JSONL."""
     
     def __init__(self, mapping_name: str, schema_slug: str, 
-                 output_dir: Path = None, compress: bool = True):
+                 output_dir: Path = None, compress: bool = True,
+                 async_io: bool = False, *, timestamp: Optional[int] = None,
+                 ensure_dir: bool = True, checksum_algorithm: str = 'sha256'):
         """
         Inicializa o escritor JSONL.
         
@@ -69,25 +112,40 @@ class JSONLWriter:
             schema_slug: Slug do schema
             output_dir: Diretório de saída (padrão: .bridge/tmp/uploads)
             compress: Se deve comprimir o arquivo
+            async_io: Se a compressão, a escrita e o checksum rodam em um
+                thread separado, alimentado por uma fila limitada
+            timestamp: Timestamp usado no nome do arquivo (padrão: agora)
+            ensure_dir: Se deve criar o diretório de saída (False quando
+                quem chama já garantiu que ele existe)
+            checksum_algorithm: Algoritmo do hashlib usado no checksum,
+                calculado sobre o conteúdo não comprimido à medida que é gravado
         """
         self.mapping_name = mapping_name
         self.schema_slug = schema_slug
         self.compress = compress
+        self.async_io = async_io
         
         # Configura diretórios
-        self.paths = BridgePaths()
-        self.output_dir = output_dir or self.paths.uploads_dir
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.output_dir = output_dir or BridgePaths().uploads_dir
+        if ensure_dir:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
         
         # Estado do arquivo
         self.file_path: Optional[Path] = None
         self.file_handle = None
         self.record_count = 0
+        self.bytes_written = 0  # bytes não comprimidos gravados
         self.start_time = 0
-        self.checksum_hash = hashlib.sha256()
+        self.checksum_hash = hashlib.new(checksum_algorithm)
+        
+        # Thread de escrita (async_io)
+        self._queue: Optional["queue.Queue[Any]"] = None
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_errors: List[BaseException] = []
         
         # Gera nome do arquivo
-        timestamp = int(time.time())
+        if timestamp is None:
+            timestamp = int(time.time())
         filename = f"{mapping_name}_{schema_slug}_{timestamp}"
         
         if compress:
@@ -114,10 +172,20 @@ class JSONLWriter:
         self.start_time = get_current_timestamp()
         
         try:
+            # Modo binário: as linhas já chegam serializadas em UTF-8. O
+            # BufferedWriter evita chamar o compressor a cada escrita pequena
             if self.compress:
-                self.file_handle = gzip.open(self.file_path, 'wt', encoding='utf-8')
+                raw = _open_gzip(self.file_path)
+                self.file_handle = io.BufferedWriter(raw, buffer_size=WRITE_BUFFER_SIZE)
             else:
-                self.file_handle = open(self.file_path, 'w', encoding='utf-8')
+                self.file_handle = open(self.file_path, 'wb', buffering=WRITE_BUFFER_SIZE)
+            
+            if self.async_io:
+                self._queue = queue.Queue(maxsize=ASYNC_QUEUE_SIZE)
+                self._writer_thread = threading.Thread(
+                    target=self._writer_loop, name="bridge-jsonl-writer", daemon=True
+                )
+                self._writer_thread.start()
             
             logger.info(f"Arquivo JSONL aberto: {self.file_path}")
             
@@ -136,8 +204,10 @@ class JSONLWriter:
             raise RuntimeError("Arquivo não está aberto")
         
         try:
+            self._stop_writer_thread()
             self.file_handle.close()
             self.file_handle = None
+            self._raise_writer_error()
             
             # Obtém informações do arquivo
             file_size = self.file_path.stat().st_size
@@ -177,22 +247,75 @@ class JSONLWriter:
         if not self.file_handle:
             raise RuntimeError("Arquivo não está aberto")
         
-        try:
-            # Serializa o registro usando o encoder personalizado
-            json_line = json.dumps(record, ensure_ascii=False, separators=(',', ':'), cls=DecimalEncoder)
-            
-            # Escreve no arquivo
-            self.file_handle.write(json_line + '\n')
-            
-            # Atualiza checksum
-            self.checksum_hash.update(json_line.encode('utf-8'))
-            
-            # Incrementa contador
-            self.record_count += 1
-            
-        except Exception as e:
-            logger.error(f"Erro ao escrever registro: {e}")
-            raise
+        # Serializa o registro (orjson quando disponível) direto em bytes UTF-8,
+        # já com a quebra de linha; os mesmos bytes vão para o arquivo e o checksum
+        self._write_blob(dumps_line(record), 1)
+    
+    def _write_lines(self, lines: List[bytes]) -> None:
+        """
+        Grava linhas já serializadas com uma única escrita e uma única
+        atualização do checksum.
+        
+        Args:
+            lines: Registros serializados (sem quebra de linha)
+        """
+        if not lines:
+            return
+        
+        # Um bloco contíguo permite uma escrita e uma única atualização do
+        # checksum; com os.writev o hash teria de ser atualizado linha a
+        # linha, o que custa mais que a cópia feita pelo join. O b'' final
+        # gera a última quebra de linha sem copiar o bloco de novo
+        self._write_blob(b'\n'.join([*lines, b'']), len(lines))
+    
+    def _write_blob(self, blob: bytes, count: int) -> None:
+        """
+        Grava um bloco de linhas completas e atualiza o checksum, direto ou
+        pelo thread de escrita.
+        
+        Args:
+            blob: Linhas serializadas, cada uma terminada em quebra de linha
+            count: Número de registros no bloco
+        """
+        if self._queue is not None:
+            self._raise_writer_error()
+            self._queue.put(blob)
+        else:
+            self.file_handle.write(blob)
+            self.checksum_hash.update(blob)
+        
+        self.bytes_written += len(blob)
+        self.record_count += count
+    
+    def _writer_loop(self) -> None:
+        """Consome a fila gravando os blocos; após um erro apenas drena a fila."""
+        while True:
+            blob = self._queue.get()
+            try:
+                if blob is _WRITER_SENTINEL:
+                    return
+                if not self._writer_errors:
+                    self.file_handle.write(blob)
+                    self.checksum_hash.update(blob)
+            except BaseException as e:
+                self._writer_errors.append(e)
+            finally:
+                self._queue.task_done()
+    
+    def _stop_writer_thread(self) -> None:
+        """Aguarda o thread de escrita gravar os blocos pendentes e o encerra."""
+        if self._writer_thread is None:
+            return
+        
+        self._queue.put(_WRITER_SENTINEL)
+        self._writer_thread.join()
+        self._writer_thread = None
+        self._queue = None
+    
+    def _raise_writer_error(self) -> None:
+        """Relança no produtor o erro ocorrido no thread de escrita."""
+        if self._writer_errors:
+            raise self._writer_errors[0]
     
     def write_batch(self, records: List[Dict[str, Any]]) -> None:
         """
@@ -201,43 +324,103 @@ class JSONLWriter:
         Args:
             records: Lista de registros
         """
-        for record in records:
-            self.write_record(record)
+        if not self.file_handle:
+            raise RuntimeError("Arquivo não está aberto")
+        
+        try:
+            self._write_lines([dumps_record(record) for record in records])
+        except Exception as e:
+            logger.error(f"Erro ao escrever lote: {e}")
+            raise
+    
+    def write_batch_bytes(self, lines: List[bytes]) -> None:
+        """
+        Escreve um lote de registros já serializados em JSON (UTF-8, sem a
+        quebra de linha), sem passar pelo serializador.
+        
+        Prefira este método quando os registros já chegam como JSON
+        (ex.: colunas JSON lidas do banco).
+        
+        Args:
+            lines: Registros serializados
+        """
+        if not self.file_handle:
+            raise RuntimeError("Arquivo não está aberto")
+        
+        try:
+            self._write_lines(lines)
+        except Exception as e:
+            logger.error(f"Erro ao escrever lote: {e}")
+            raise
     
     def write_from_iterator(self, records: Iterator[Dict[str, Any]], 
-                           batch_size: int = 1000) -> None:
+                           batch_size: int = 1000,
+                           chunk_bytes: int = WRITE_CHUNK_BYTES) -> None:
         """
-        Escreve registros de um iterador.
+        Escreve registros de um iterador em blocos de aproximadamente
+        ``chunk_bytes``, uma escrita por bloco.
+        
+        O primeiro bloco tem ``batch_size`` registros; os seguintes são
+        dimensionados pelo tamanho médio das linhas já gravadas.
         
         Args:
             records: Iterador de registros
             batch_size: Tamanho do lote para logging
+            chunk_bytes: Volume aproximado (em bytes) por escrita
         """
-        batch_count = 0
+        if not self.file_handle:
+            raise RuntimeError("Arquivo não está aberto")
         
-        for record in records:
-            self.write_record(record)
-            
-            # Log de progresso
-            if self.record_count % batch_size == 0:
-                batch_count += 1
-                logger.debug(f"Escritos {self.record_count} registros (lote {batch_count})")
+        # Referências locais para o laço
+        dumps = dumps_record
+        write_lines = self._write_lines
+        source = iter(records)
+        
+        # Progresso só é calculado com DEBUG ativo
+        log_progress = logger.isEnabledFor(logging.DEBUG)
+        log_every = max(1, batch_size)
+        next_log = self.record_count + log_every
+        
+        chunk_records = log_every
+        
+        try:
+            while True:
+                lines = [dumps(record) for record in islice(source, chunk_records)]
+                if not lines:
+                    break
+                
+                written_before = self.bytes_written
+                write_lines(lines)
+                chunk_size = self.bytes_written - written_before
+                chunk_records = max(1, chunk_bytes * len(lines) // chunk_size)
+                
+                # Log de progresso
+                if log_progress and self.record_count >= next_log:
+                    next_log = self.record_count + log_every
+                    logger.debug(f"Escritos {self.record_count} registros")
+        except Exception as e:
+            logger.error(f"Erro ao escrever registros (após {self.record_count} gravados): {e}")
+            raise
     
     def flush(self) -> None:
-        """Força a escrita dos dados em buffer."""
+        """Força a escrita dos dados em buffer (inclusive os do compressor)."""
         if self.file_handle:
+            if self._queue is not None:
+                self._queue.join()
+                self._raise_writer_error()
             self.file_handle.flush()
     
     def get_current_size(self) -> int:
         """
-        Obtém o tamanho atual do arquivo.
+        Obtém o tamanho atual do arquivo, contado em memória (sem stat).
+        
+        Em arquivos comprimidos o valor é o volume antes da compressão, ou
+        seja, um limite superior do tamanho em disco.
         
         Returns:
             Tamanho em bytes
         """
-        if self.file_path and self.file_path.exists():
-            return self.file_path.stat().st_size
-        return 0
+        return self.bytes_written
     
     def get_progress_info(self) -> Dict[str, Any]:
         """
@@ -264,7 +447,9 @@ class JSONLBatchWriter:
     def __init__(self, mapping_name: str, schema_slug: str,
                  output_dir: Path = None, compress: bool = True,
                  max_file_size: int = 100 * 1024 * 1024,  # 100MB
-                 max_records_per_file: int = 1000000):
+                 max_records_per_file: int = 1000000,
+                 async_io: bool = False, checksum_algorithm: str = 'sha256',
+                 on_file_closed: Optional[Callable[[JSONLFileInfo], None]] = None):
         """
         Inicializa o escritor em lotes.
         
@@ -275,12 +460,20 @@ class JSONLBatchWriter:
             compress: Se deve comprimir os arquivos
             max_file_size: Tamanho máximo por arquivo em bytes
             max_records_per_file: Número máximo de registros por arquivo
+            async_io: Se cada arquivo é gravado por um thread separado
+            checksum_algorithm: Algoritmo do hashlib usado no checksum de cada arquivo
+            on_file_closed: Chamado com as informações de cada arquivo assim que
+                ele é fechado (ex.: para iniciar o upload antes do fim da escrita)
         """
         self.mapping_name = mapping_name
         self.schema_slug = schema_slug
         self.compress = compress
         self.max_file_size = max_file_size
         self.max_records_per_file = max_records_per_file
+        self.rotation_check_interval = ROTATION_CHECK_INTERVAL
+        self.async_io = async_io
+        self.checksum_algorithm = checksum_algorithm
+        self.on_file_closed = on_file_closed
         
         # Configura diretórios
         self.paths = BridgePaths()
@@ -292,6 +485,10 @@ class JSONLBatchWriter:
         self.file_sequence = 1
         self.total_records = 0
         self.created_files: List[JSONLFileInfo] = []
+        self._records_until_check = 0
+        
+        # Todas as partes usam o mesmo timestamp; a sequência garante nomes únicos
+        self._timestamp = int(time.time())
     
     def __enter__(self):
         """Context manager entry."""
@@ -299,6 +496,9 @@ class JSONLBatchWriter:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
+        if exc_type is not None:
+            # Arquivos de uma escrita interrompida não devem ser repassados
+            self.on_file_closed = None
         self.close()
     
     def _create_new_writer(self) -> JSONLWriter:
@@ -310,7 +510,11 @@ class JSONLBatchWriter:
             mapping_name=mapping_name,
             schema_slug=self.schema_slug,
             output_dir=self.output_dir,
-            compress=self.compress
+            compress=self.compress,
+            async_io=self.async_io,
+            timestamp=self._timestamp,
+            ensure_dir=False,
+            checksum_algorithm=self.checksum_algorithm
         )
         
         writer.open()
@@ -333,25 +537,77 @@ class JSONLBatchWriter:
         
         return False
     
+    def _next_check_interval(self) -> int:
+        """
+        Calcula quantos registros podem ser escritos até a próxima verificação
+        de rotação, sem ultrapassar o limite de registros do arquivo atual.
+        """
+        room = self.max_records_per_file - self.current_writer.record_count
+        return max(min(self.rotation_check_interval, room), 1)
+    
     def write_record(self, record: Dict[str, Any]) -> None:
         """
         Escreve um registro, rotacionando arquivos se necessário.
         
+        O limite de registros é exato; o de tamanho é verificado a cada
+        ``rotation_check_interval`` registros.
+        
         Args:
             record: Registro a ser escrito
         """
         # Rotaciona arquivo se necessário
-        if self._should_rotate_file():
-            if self.current_writer:
-                file_info = self.current_writer.close()
-                self.created_files.append(file_info)
-            
-            self.current_writer = self._create_new_writer()
+        if self._records_until_check <= 0:
+            if self._should_rotate_file():
+                self._rotate_file()
+            self._records_until_check = self._next_check_interval()
+        self._records_until_check -= 1
         
         # Escreve o registro
         self.current_writer.write_record(record)
         self.total_records += 1
     
+    def _rotate_file(self) -> None:
+        """Fecha o arquivo atual (se houver) e abre o próximo da sequência."""
+        if self.current_writer:
+            self._finish_file(self.current_writer.close())
+        
+        self.current_writer = self._create_new_writer()
+    
+    def _finish_file(self, file_info: JSONLFileInfo) -> None:
+        """Registra um arquivo fechado e notifica on_file_closed."""
+        self.created_files.append(file_info)
+        if self.on_file_closed:
+            self.on_file_closed(file_info)
+    
+    def _write_sliced(self, items: List[Any],
+                      write: Callable[[JSONLWriter, List[Any]], None]) -> None:
+        """
+        Repassa um lote ao arquivo atual em fatias inteiras (uma escrita e uma
+        atualização de checksum por fatia), rotacionando entre elas.
+        
+        O limite de registros é respeitado exatamente; o de tamanho é
+        verificado entre fatias, podendo ser excedido em até um lote.
+        
+        Args:
+            items: Registros (ou linhas serializadas)
+            write: Método do JSONLWriter que grava uma fatia
+        """
+        start = 0
+        total = len(items)
+        
+        while start < total:
+            if self._should_rotate_file():
+                self._rotate_file()
+            
+            room = max(self.max_records_per_file - self.current_writer.record_count, 1)
+            chunk = items[start:start + room]
+            write(self.current_writer, chunk)
+            self.total_records += len(chunk)
+            start += len(chunk)
+        
+        # Força a verificação no próximo write_record
+        self._records_until_check = 0
+    
     def write_batch(self, records: List[Dict[str, Any]]) -> None:
         """
         Escreve um lote de registros.
@@ -359,8 +615,17 @@ class JSONLBatchWriter:
         Args:
             records: Lista de registros
         """
-        for record in records:
-            self.write_record(record)
+        self._write_sliced(records, JSONLWriter.write_batch)
+    
+    def write_batch_bytes(self, lines: List[bytes]) -> None:
+        """
+        Escreve um lote de registros já serializados em JSON, sem passar
+        pelo serializador. Veja ``JSONLWriter.write_batch_bytes``.
+        
+        Args:
+            lines: Registros serializados (UTF-8, sem quebra de linha)
+        """
+        self._write_sliced(lines, JSONLWriter.write_batch_bytes)
     
     def close(self) -> List[JSONLFileInfo]:
         """
@@ -370,9 +635,9 @@ class JSONLBatchWriter:
             Lista de informações dos arquivos criados
         """
         if self.current_writer:
-            file_info = self.current_writer.close()
-            self.created_files.append(file_info)
-            self.current_writer = None
+            writer, self.current_writer = self.current_writer, None
+            self._records_until_check = 0
+            self._finish_file(writer.close())
         
         logger.info(
             f"Escritor em lotes finalizado: {len(self.created_files)} arquivos, "
@@ -441,6 +706,32 @@ def create_jsonl_writer(mapping_name: str, schema_slug: str,
         pass
 
 
+def _iter_chunked_lines(file_handle, chunk_size: int = VALIDATE_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Itera sobre as linhas de um arquivo binário lendo blocos grandes, com
+    memória limitada ao tamanho do bloco.
+    
+    Args:
+        file_handle: Arquivo aberto em modo binário
+        chunk_size: Tamanho de cada leitura em bytes
+        
+    Yields:
+        Linhas sem a quebra de linha
+    """
+    tail = b''
+    while True:
+        chunk = file_handle.read(chunk_size)
+        if not chunk:
+            break
+        
+        lines = (tail + chunk).split(b'\n')
+        tail = lines.pop()  # linha incompleta continua no próximo bloco
+        yield from lines
+    
+    if tail:
+        yield tail
+
+
 def validate_jsonl_file(file_path: Path) -> Dict[str, Any]:
     """
     Valida um arquivo JSONL.
@@ -465,25 +756,23 @@ def validate_jsonl_file(file_path: Path) -> Dict[str, Any]:
         
         result['file_size'] = file_path.stat().st_size
         
-        # Abre o arquivo (com suporte a compressão)
+        # Abre o arquivo (com suporte a compressão) em modo binário
         if file_path.suffix == '.gz':
-            file_handle = gzip.open(file_path, 'rt', encoding='utf-8')
+            file_handle = gzip.open(file_path, 'rb')
         else:
-            file_handle = open(file_path, 'r', encoding='utf-8')
+            file_handle = open(file_path, 'rb')
         
         with file_handle:
-            line_number = 0
-            for line in file_handle:
-                line_number += 1
+            for line_number, line in enumerate(_iter_chunked_lines(file_handle), 1):
                 line = line.strip()
                 
                 if not line:
                     continue
                 
                 try:
-                    json.loads(line)
+                    loads(line)
                     result['record_count'] += 1
-                except json.JSONDecodeError as e:
+                except ValueError as e:  # JSON inválido ou UTF-8 inválido
                     result['errors'].append(f"Linha {line_number}: {e}")
                     if len(result['errors']) >= 10:  # Limita erros
                         result['errors'].append("... (mais erros omitidos)")
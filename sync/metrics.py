@@ -3,25 +3,55 @@ Módulo para coleta e gerenciamento de métricas do pipeline de sincronização.
 Coleta métricas de performance, erros e estatísticas de uso.
 """
 
-import json
+import atexit
+import io
 import logging
+import threading
 import time
 import psutil
-from typing import Dict, Any, List, Optional, Union
+import shutil
+from typing import Dict, Any, Iterator, List, Optional, Union
 from pathlib import Path
-from dataclasses import dataclass, asdict
-from collections import defaultdict, deque
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from collections import Counter, deque
 from threading import Lock
-import statistics
 
 from core.timeutil import get_current_timestamp, format_duration
+from core.compat import DATACLASS_SLOTS
 from core.paths import BridgePaths
+from sync.serialization import dumps_indented, dumps_line, loads
 
 
 logger = logging.getLogger(__name__)
 
+# Limites do buffer de MetricsStorage.save_sync_metrics antes de gravar em disco
+METRICS_FLUSH_BYTES = 64 * 1024
+METRICS_FLUSH_RECORDS = 500
+METRICS_FLUSH_INTERVAL = 5.0  # segundos
 
-@dataclass
+# Folga nas leituras do mais recente para o mais antigo (sync_metrics.jsonl e
+# histórico do coletor): ambos seguem a ordem de término, e não de início, das
+# sincronizações
+METRICS_ORDER_SLACK = 24 * 3600  # segundos
+
+# Tipos de erro retornados por get_error_analysis (os mais frequentes)
+ERROR_TYPES_LIMIT = 20
+
+# Sincronizações mantidas em memória pelo coletor (as mais antigas são descartadas)
+SYNC_METRICS_HISTORY = 10000
+
+# Horas mantidas nos agregados por hora de get_performance_summary
+HOURLY_STATS_HOURS = 168
+
+# Intervalo (segundos) entre leituras de uso de disco em collect_system_metrics
+DISK_USAGE_REFRESH_INTERVAL = 60.0
+
+# Tamanho dos blocos lidos do fim do arquivo em load_sync_metrics
+REVERSE_READ_BLOCK_SIZE = 64 * 1024
+
+
+@dataclass(**DATACLASS_SLOTS)
 class SyncMetrics:
     """Métricas de uma sincronização."""
     mapping_name: str
@@ -56,8 +86,19 @@ class SyncMetrics:
     retry_count: int = 0
     
     def to_dict(self) -> Dict[str, Any]:
-        """Converte para dicionário."""
-        return asdict(self)
+        """Converte para dicionário (campos primitivos, sem a cópia profunda do asdict)."""
+        return {name: getattr(self, name) for name in _SYNC_METRICS_FIELDS}
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Resumo com os campos exibidos em get_current_metrics/format_metrics_report."""
+        return {
+            'mapping_name': self.mapping_name,
+            'schema_slug': self.schema_slug,
+            'start_time': self.start_time,
+            'records_extracted': self.records_extracted,
+            'success': self.success,
+            'duration': self.duration,
+        }
     
     def calculate_rates(self) -> Dict[str, float]:
         """Calcula taxas de processamento."""
@@ -71,9 +112,9 @@ class SyncMetrics:
         }
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class SystemMetrics:
-    """Métricas do sistema."""
+    """Métricas do sistema (amostra imutável)."""
     timestamp: int
     cpu_percent: float
     memory_percent: float
@@ -82,14 +123,94 @@ class SystemMetrics:
     disk_free_gb: float
     
     def to_dict(self) -> Dict[str, Any]:
-        """Converte para dicionário."""
-        return asdict(self)
+        """Converte para dicionário (campos primitivos, sem a cópia profunda do asdict)."""
+        return {name: getattr(self, name) for name in _SYSTEM_METRICS_FIELDS}
+
+
+# Nomes dos campos, calculados uma vez para os to_dict()
+_SYNC_METRICS_FIELDS = tuple(f.name for f in fields(SyncMetrics))
+_SYSTEM_METRICS_FIELDS = tuple(f.name for f in fields(SystemMetrics))
+
+
+@dataclass(**DATACLASS_SLOTS)
+class HourlySyncStats:
+    """Agregado incremental das sincronizações iniciadas em uma hora."""
+    count: int = 0
+    success_count: int = 0
+    total_records: int = 0
+    total_files: int = 0
+    total_size: int = 0
+    duration_sum: int = 0
+    duration_count: int = 0
+    
+    def add(self, sync: SyncMetrics) -> None:
+        """Acumula uma sincronização."""
+        self.count += 1
+        if sync.success:
+            self.success_count += 1
+        self.total_records += sync.records_extracted
+        self.total_files += sync.files_created
+        self.total_size += sync.total_file_size
+        if sync.duration:
+            self.duration_sum += sync.duration
+            self.duration_count += 1
+    
+    def merge(self, other: 'HourlySyncStats') -> None:
+        """Acumula outro agregado."""
+        self.count += other.count
+        self.success_count += other.success_count
+        self.total_records += other.total_records
+        self.total_files += other.total_files
+        self.total_size += other.total_size
+        self.duration_sum += other.duration_sum
+        self.duration_count += other.duration_count
+
+
+@dataclass(**DATACLASS_SLOTS)
+class DayStats:
+    """Estatísticas acumuladas das sincronizações de um dia."""
+    syncs_count: int = 0
+    total_records: int = 0
+    total_files: int = 0
+    total_size: int = 0
+    success_count: int = 0
+    error_count: int = 0
+    
+    def to_dict(self) -> Dict[str, int]:
+        """Converte para dicionário"""
+        return {name: getattr(self, name) for name in _DAY_STATS_FIELDS}
+
+
+_DAY_STATS_FIELDS = tuple(f.name for f in fields(DayStats))
+
+
+@lru_cache(maxsize=256)
+def _error_key(error_message: str) -> str:
+    """
+    Simplifica uma mensagem de erro para agrupamento (texto antes do primeiro
+    ':'); memorizado porque as mesmas mensagens se repetem.
+    
+    Args:
+        error_message: Mensagem de erro
+        
+    Returns:
+        Chave de agrupamento
+    """
+    return error_message.partition(':')[0]
 
 
 class MetricsCollector:
-    """Coletor de métricas em tempo real."""
+    """
+    Coletor de métricas em tempo real.
+    
+    As atualizações da sincronização atual (update_*) e a coleta de métricas
+    do sistema não usam o lock: cada uma atribui campos de um objeto já
+    obtido ou faz um append no deque, operações atômicas sob o GIL. O lock
+    fica com as operações que trocam a sincronização atual ou percorrem o
+    histórico.
+    """
     
-    def __init__(self, collection_interval: int = 5):
+    def __init__(self, collection_interval: float = 5):
         """
         Inicializa o coletor.
         
@@ -98,21 +219,25 @@ class MetricsCollector:
         """
         self.collection_interval = collection_interval
         self.system_metrics: deque = deque(maxlen=1000)  # Últimas 1000 amostras
-        self.sync_metrics: List[SyncMetrics] = []
+        self.sync_metrics: deque = deque(maxlen=SYNC_METRICS_HISTORY)  # Últimas sincronizações
         self.current_sync: Optional[SyncMetrics] = None
         
         self._lock = Lock()
         self._collecting = False
+        self._stop_collecting = threading.Event()
+        self._collector_thread: Optional[threading.Thread] = None
+        
+        # Coleta de métricas do sistema
+        self._disk_root = str(BridgePaths().base_dir)
+        self._disk_usage = None
+        self._disk_usage_at = 0.0
+        psutil.cpu_percent(interval=None)  # primeira leitura, base para as seguintes
         
         # Métricas agregadas
-        self.daily_stats = defaultdict(lambda: {
-            'syncs_count': 0,
-            'total_records': 0,
-            'total_files': 0,
-            'total_size': 0,
-            'success_count': 0,
-            'error_count': 0
-        })
+        self._hourly_stats: Dict[int, HourlySyncStats] = {}  # hora (epoch // 3600) -> agregado
+        self._day_key_cache = (0, 0, '')  # (início do dia, fim do dia, 'YYYY-MM-DD')
+        self.daily_stats: Dict[str, DayStats] = {}  # 'YYYY-MM-DD' -> estatísticas
+        self.daily_stats_dirty = False  # alteradas desde o último save_daily_stats
     
     def start_sync_metrics(self, mapping_name: str, schema_slug: str) -> SyncMetrics:
         """
@@ -157,10 +282,19 @@ class MetricsCollector:
             self.current_sync.error_message = error_message
             
             # Calcula métricas de sistema
-            if self.system_metrics:
-                recent_metrics = list(self.system_metrics)[-10:]  # Últimas 10 amostras
-                self.current_sync.peak_memory_mb = max(m.memory_used_mb for m in recent_metrics)
-                self.current_sync.avg_cpu_percent = statistics.mean(m.cpu_percent for m in recent_metrics)
+            # Últimas 10 amostras, por índice: sem copiar o deque e sem
+            # iterá-lo enquanto outro thread pode estar acrescentando amostras
+            samples = self.system_metrics
+            count = min(10, len(samples))
+            if count:
+                peak_memory = 0.0
+                cpu_sum = 0.0
+                for i in range(1, count + 1):
+                    sample = samples[-i]
+                    peak_memory = max(peak_memory, sample.memory_used_mb)
+                    cpu_sum += sample.cpu_percent
+                self.current_sync.peak_memory_mb = peak_memory
+                self.current_sync.avg_cpu_percent = cpu_sum / count
             
             # Adiciona às métricas coletadas
             completed_sync = self.current_sync
@@ -168,6 +302,7 @@ class MetricsCollector:
             
             # Atualiza estatísticas diárias
             self._update_daily_stats(completed_sync)
+            self._update_hourly_stats(completed_sync)
             
             self.current_sync = None
             
@@ -182,10 +317,10 @@ class MetricsCollector:
             records_count: Número de registros extraídos
             duration: Duração da extração
         """
-        with self._lock:
-            if self.current_sync:
-                self.current_sync.records_extracted = records_count
-                self.current_sync.extraction_time = duration
+        sync = self.current_sync
+        if sync:
+            sync.records_extracted = records_count
+            sync.extraction_time = duration
     
     def update_writing_metrics(self, records_count: int, files_count: int, 
                               total_size: int, duration: int) -> None:
@@ -198,12 +333,12 @@ class MetricsCollector:
             total_size: Tamanho total dos arquivos
             duration: Duração da escrita
         """
-        with self._lock:
-            if self.current_sync:
-                self.current_sync.records_written = records_count
-                self.current_sync.files_created = files_count
-                self.current_sync.total_file_size = total_size
-                self.current_sync.writing_time = duration
+        sync = self.current_sync
+        if sync:
+            sync.records_written = records_count
+            sync.files_created = files_count
+            sync.total_file_size = total_size
+            sync.writing_time = duration
     
     def update_upload_metrics(self, files_uploaded: int, records_uploaded: int, 
                              duration: int, retry_count: int = 0) -> None:
@@ -216,12 +351,12 @@ class MetricsCollector:
             duration: Duração do upload
             retry_count: Número de tentativas
         """
-        with self._lock:
-            if self.current_sync:
-                self.current_sync.files_uploaded = files_uploaded
-                self.current_sync.records_uploaded = records_uploaded
-                self.current_sync.upload_time = duration
-                self.current_sync.retry_count = retry_count
+        sync = self.current_sync
+        if sync:
+            sync.files_uploaded = files_uploaded
+            sync.records_uploaded = records_uploaded
+            sync.upload_time = duration
+            sync.retry_count = retry_count
     
     def update_deletion_metrics(self, records_deleted: int, mapping_name: str) -> None:
         """
@@ -231,14 +366,12 @@ class MetricsCollector:
             records_deleted: Número de registros deletados
             mapping_name: Nome do mapeamento
         """
-        with self._lock:
-            if self.current_sync:
-                # Adiciona informação de deleção às métricas atuais
-                if not hasattr(self.current_sync, 'records_deleted'):
-                    self.current_sync.records_deleted = 0
-                self.current_sync.records_deleted = records_deleted
-                
-                logger.info(f"📊 Métricas de deleção atualizadas: {records_deleted} registros deletados para {mapping_name}")
+        sync = self.current_sync
+        if sync:
+            # Adiciona informação de deleção às métricas atuais
+            sync.records_deleted = records_deleted
+            
+            logger.info(f"📊 Métricas de deleção atualizadas: {records_deleted} registros deletados para {mapping_name}")
     
     def collect_system_metrics(self) -> SystemMetrics:
         """
@@ -248,13 +381,16 @@ class MetricsCollector:
             Métricas do sistema atual
         """
         try:
-            # CPU e memória
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # CPU (desde a chamada anterior, sem bloquear) e memória
+            cpu_percent = psutil.cpu_percent(interval=None)
             memory = psutil.virtual_memory()
             
-            # Disco (diretório do projeto)
-            paths = BridgePaths()
-            disk_usage = psutil.disk_usage(str(paths.get_app_root()))
+            # Disco (diretório do projeto), renovado a cada DISK_USAGE_REFRESH_INTERVAL
+            now = time.monotonic()
+            if self._disk_usage is None or now - self._disk_usage_at >= DISK_USAGE_REFRESH_INTERVAL:
+                self._disk_usage = psutil.disk_usage(self._disk_root)
+                self._disk_usage_at = now
+            disk_usage = self._disk_usage
             
             metrics = SystemMetrics(
                 timestamp=get_current_timestamp(),
@@ -265,8 +401,7 @@ class MetricsCollector:
                 disk_free_gb=disk_usage.free / (1024 * 1024 * 1024)
             )
             
-            with self._lock:
-                self.system_metrics.append(metrics)
+            self.system_metrics.append(metrics)  # deque.append é atômico
             
             return metrics
             
@@ -281,6 +416,48 @@ class MetricsCollector:
                 disk_free_gb=0
             )
     
+    def start_collecting(self) -> None:
+        """
+        Inicia a coleta periódica de métricas do sistema em um thread daemon,
+        a cada ``collection_interval`` segundos.
+        
+        As amostras vão direto para ``system_metrics``: o deque limitado faz o
+        papel de fila entre o thread de coleta e os leitores, sem lock.
+        """
+        with self._lock:
+            if self._collecting:
+                return
+            
+            self._collecting = True
+            self._stop_collecting.clear()
+            self._collector_thread = threading.Thread(
+                target=self._collect_loop, name="bridge-metrics-sampler", daemon=True
+            )
+            self._collector_thread.start()
+    
+    def stop_collecting(self, timeout: float = 5.0) -> None:
+        """
+        Encerra a coleta periódica de métricas do sistema.
+        
+        Args:
+            timeout: Tempo máximo de espera pelo thread de coleta
+        """
+        with self._lock:
+            if not self._collecting:
+                return
+            
+            self._collecting = False
+            self._stop_collecting.set()
+            thread = self._collector_thread
+            self._collector_thread = None
+        
+        thread.join(timeout)
+    
+    def _collect_loop(self) -> None:
+        """Laço do thread de coleta."""
+        while not self._stop_collecting.wait(self.collection_interval):
+            self.collect_system_metrics()
+    
     def _update_daily_stats(self, sync_metrics: SyncMetrics) -> None:
         """
         Atualiza estatísticas diárias.
@@ -288,26 +465,57 @@ class MetricsCollector:
         Args:
             sync_metrics: Métricas da sincronização
         """
-        # Usa data como chave (YYYY-MM-DD)
-        date_key = time.strftime('%Y-%m-%d', time.localtime(sync_metrics.start_time))
+        # Usa data local como chave (YYYY-MM-DD), recalculada só ao mudar de dia
+        start_time = sync_metrics.start_time
+        day_start, day_end, date_key = self._day_key_cache
+        if not day_start <= start_time < day_end:
+            local = time.localtime(start_time)
+            date_key = time.strftime('%Y-%m-%d', local)
+            day_start = start_time - (local.tm_hour * 3600 + local.tm_min * 60 + local.tm_sec)
+            day_end = int(time.mktime((local.tm_year, local.tm_mon, local.tm_mday + 1,
+                                       0, 0, 0, 0, 0, -1)))
+            self._day_key_cache = (day_start, day_end, date_key)
         
-        stats = self.daily_stats[date_key]
-        stats['syncs_count'] += 1
-        stats['total_records'] += sync_metrics.records_extracted
-        stats['total_files'] += sync_metrics.files_created
-        stats['total_size'] += sync_metrics.total_file_size
+        stats = self.daily_stats.get(date_key)
+        if stats is None:
+            stats = self.daily_stats[date_key] = DayStats()
+        self.daily_stats_dirty = True
+        stats.syncs_count += 1
+        stats.total_records += sync_metrics.records_extracted
+        stats.total_files += sync_metrics.files_created
+        stats.total_size += sync_metrics.total_file_size
         
         if sync_metrics.success:
-            stats['success_count'] += 1
+            stats.success_count += 1
         else:
-            stats['error_count'] += 1
+            stats.error_count += 1
+    
+    def _update_hourly_stats(self, sync_metrics: SyncMetrics) -> None:
+        """
+        Acumula a sincronização no agregado da sua hora, descartando horas
+        além de HOURLY_STATS_HOURS.
+        
+        Args:
+            sync_metrics: Métricas da sincronização
+        """
+        hour = sync_metrics.start_time // 3600
+        bucket = self._hourly_stats.get(hour)
+        if bucket is None:
+            bucket = self._hourly_stats[hour] = HourlySyncStats()
+            
+            oldest = hour - HOURLY_STATS_HOURS
+            for old_hour in [h for h in self._hourly_stats if h < oldest]:
+                del self._hourly_stats[old_hour]
+        
+        bucket.add(sync_metrics)
     
     def get_current_metrics(self) -> Dict[str, Any]:
         """
         Obtém métricas atuais.
         
         Returns:
-            Métricas atuais do sistema e sincronização
+            Métricas atuais do sistema e sincronização (resumos via
+            SyncMetrics.snapshot; use to_dict para todos os campos)
         """
         with self._lock:
             result = {
@@ -322,13 +530,16 @@ class MetricsCollector:
             
             # Sincronização atual
             if self.current_sync:
-                current_dict = self.current_sync.to_dict()
+                current_dict = self.current_sync.snapshot()
                 if self.current_sync.start_time:
                     current_dict['elapsed_time'] = get_current_timestamp() - self.current_sync.start_time
                 result['current_sync'] = current_dict
             
             # Sincronizações recentes
-            result['recent_syncs'] = [s.to_dict() for s in self.sync_metrics[-10:]]
+            syncs = self.sync_metrics
+            result['recent_syncs'] = [
+                syncs[i].snapshot() for i in range(max(0, len(syncs) - 10), len(syncs))
+            ]
             
             return result
     
@@ -342,16 +553,31 @@ class MetricsCollector:
         Returns:
             Resumo de performance
         """
-        cutoff_time = get_current_timestamp() - (hours * 3600)
+        now = get_current_timestamp()
+        cutoff_time = now - (hours * 3600)
         
         with self._lock:
-            # Filtra sincronizações recentes
-            recent_syncs = [
-                s for s in self.sync_metrics 
-                if s.start_time >= cutoff_time
-            ]
+            totals = HourlySyncStats()
+            
+            if hours <= HOURLY_STATS_HOURS:
+                # Soma os agregados por hora (a hora do corte entra inteira)
+                for hour in range(cutoff_time // 3600, now // 3600 + 1):
+                    bucket = self._hourly_stats.get(hour)
+                    if bucket:
+                        totals.merge(bucket)
+            else:
+                # Período maior que o mantido em agregados: percorre o histórico
+                # do mais recente para o mais antigo, em uma única passada, e
+                # para quando passa do corte (com a folga de ordenação, já que
+                # a ordem é a de término)
+                stop_time = cutoff_time - METRICS_ORDER_SLACK
+                for sync in reversed(self.sync_metrics):
+                    if sync.start_time >= cutoff_time:
+                        totals.add(sync)
+                    elif sync.start_time < stop_time:
+                        break
             
-            if not recent_syncs:
+            if not totals.count:
                 return {
                     'period_hours': hours,
                     'total_syncs': 0,
@@ -362,28 +588,20 @@ class MetricsCollector:
                     'total_size_mb': 0
                 }
             
-            # Calcula estatísticas
-            successful_syncs = [s for s in recent_syncs if s.success]
-            
-            total_records = sum(s.records_extracted for s in recent_syncs)
-            total_files = sum(s.files_created for s in recent_syncs)
-            total_size = sum(s.total_file_size for s in recent_syncs)
-            
-            durations = [s.duration for s in recent_syncs if s.duration]
-            avg_duration = statistics.mean(durations) if durations else 0
+            avg_duration = totals.duration_sum / totals.duration_count if totals.duration_count else 0
             
             return {
                 'period_hours': hours,
-                'total_syncs': len(recent_syncs),
-                'successful_syncs': len(successful_syncs),
-                'success_rate': (len(successful_syncs) / len(recent_syncs)) * 100,
+                'total_syncs': totals.count,
+                'successful_syncs': totals.success_count,
+                'success_rate': (totals.success_count / totals.count) * 100,
                 'avg_duration': avg_duration,
                 'avg_duration_formatted': format_duration(int(avg_duration)),
-                'total_records': total_records,
-                'total_files': total_files,
-                'total_size_mb': total_size / (1024 * 1024),
-                'avg_records_per_sync': total_records / len(recent_syncs),
-                'avg_files_per_sync': total_files / len(recent_syncs)
+                'total_records': totals.total_records,
+                'total_files': totals.total_files,
+                'total_size_mb': totals.total_size / (1024 * 1024),
+                'avg_records_per_sync': totals.total_records / totals.count,
+                'avg_files_per_sync': totals.total_files / totals.count
             }
     
     def get_error_analysis(self, hours: int = 24) -> Dict[str, Any]:
@@ -410,26 +628,26 @@ class MetricsCollector:
                     'period_hours': hours,
                     'total_errors': 0,
                     'error_types': {},
+                    'error_type_total': 0,
                     'affected_mappings': [],
                     'recent_errors': []
                 }
             
             # Agrupa erros por tipo
-            error_types = defaultdict(int)
+            error_types: Counter = Counter()
             affected_mappings = set()
             
             for sync in error_syncs:
                 if sync.error_message:
-                    # Simplifica mensagem de erro para agrupamento
-                    error_key = sync.error_message.split(':')[0] if ':' in sync.error_message else sync.error_message
-                    error_types[error_key] += 1
+                    error_types[_error_key(sync.error_message)] += 1
                 
                 affected_mappings.add(sync.mapping_name)
             
             return {
                 'period_hours': hours,
                 'total_errors': len(error_syncs),
-                'error_types': dict(error_types),
+                'error_types': dict(error_types.most_common(ERROR_TYPES_LIMIT)),
+                'error_type_total': len(error_types),
                 'affected_mappings': list(affected_mappings),
                 'recent_errors': [
                     {
@@ -443,6 +661,78 @@ class MetricsCollector:
             }
 
 
+def _iter_lines_reversed(file_handle, block_size: int = REVERSE_READ_BLOCK_SIZE) -> Iterator[bytes]:
+    """
+    Itera sobre as linhas de um arquivo binário do fim para o início, lendo
+    blocos de tamanho fixo.
+    
+    Args:
+        file_handle: Arquivo aberto em modo binário
+        block_size: Tamanho de cada leitura em bytes
+        
+    Yields:
+        Linhas (sem a quebra de linha), da última para a primeira
+    """
+    position = file_handle.seek(0, 2)
+    tail = b''
+    
+    while position > 0:
+        read_size = min(block_size, position)
+        position -= read_size
+        file_handle.seek(position)
+        
+        lines = (file_handle.read(read_size) + tail).split(b'\n')
+        tail = lines[0]  # pode continuar no bloco anterior
+        yield from reversed(lines[1:])
+    
+    yield tail
+
+
+def _find_start_time_offset(file_handle, target_time: int) -> int:
+    """
+    Busca binária pelo início da primeira linha com start_time >= target_time,
+    assumindo as linhas em ordem cronológica.
+    
+    Linhas inválidas são tratadas como recentes, de modo que a busca erre
+    mantendo dados, nunca descartando-os.
+    
+    Args:
+        file_handle: Arquivo JSONL aberto em modo binário
+        target_time: Timestamp procurado
+        
+    Returns:
+        Offset (em bytes) do início da linha encontrada, ou o tamanho do arquivo
+    """
+    def line_start_at(position: int) -> int:
+        # Início da primeira linha que começa em position ou depois
+        if position == 0:
+            return 0
+        file_handle.seek(position - 1)
+        file_handle.readline()
+        return file_handle.tell()
+    
+    def is_recent(position: int) -> bool:
+        file_handle.seek(line_start_at(position))
+        line = file_handle.readline()
+        if not line:
+            return True  # fim do arquivo
+        try:
+            return loads(line).get('start_time', 0) >= target_time
+        except ValueError:
+            return True
+    
+    low = 0
+    high = file_handle.seek(0, 2)
+    while low < high:
+        middle = (low + high) // 2
+        if is_recent(middle):
+            high = middle
+        else:
+            low = middle + 1
+    
+    return line_start_at(low)
+
+
 class MetricsStorage:
     """Armazenamento persistente de métricas."""
     
@@ -459,34 +749,82 @@ class MetricsStorage:
         
         self.metrics_file = self.storage_dir / "sync_metrics.jsonl"
         self.daily_stats_file = self.storage_dir / "daily_stats.json"
+        
+        # Buffer de linhas pendentes de save_sync_metrics (JSON em UTF-8)
+        self._buffer: List[bytes] = []
+        self._buffer_bytes = 0
+        self._buffer_lock = Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        atexit.register(self.flush)
     
     def save_sync_metrics(self, metrics: SyncMetrics) -> None:
         """
         Salva métricas de sincronização.
         
+        As linhas ficam em buffer e são gravadas juntas ao atingir
+        METRICS_FLUSH_BYTES ou METRICS_FLUSH_RECORDS, após
+        METRICS_FLUSH_INTERVAL segundos ou na saída da aplicação.
+        
         Args:
             metrics: Métricas a serem salvas
         """
         try:
-            with open(self.metrics_file, 'a', encoding='utf-8') as f:
-                json.dump(metrics.to_dict(), f, ensure_ascii=False)
-                f.write('\n')
+            line = dumps_line(metrics.to_dict())
+            
+            with self._buffer_lock:
+                self._buffer.append(line)
+                self._buffer_bytes += len(line)
+                full = (self._buffer_bytes >= METRICS_FLUSH_BYTES or
+                        len(self._buffer) >= METRICS_FLUSH_RECORDS)
+                
+                if not full and self._flush_timer is None:
+                    self._flush_timer = threading.Timer(METRICS_FLUSH_INTERVAL, self.flush)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+            
+            if full:
+                self.flush()
             
             logger.debug(f"Métricas salvas: {metrics.mapping_name}")
             
         except Exception as e:
             logger.error(f"Erro ao salvar métricas: {e}")
     
+    def flush(self) -> None:
+        """Grava em disco as métricas pendentes no buffer."""
+        with self._buffer_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            
+            if not self._buffer:
+                return
+            
+            data = b''.join(self._buffer)
+            self._buffer = []
+            self._buffer_bytes = 0
+            
+            try:
+                with open(self.metrics_file, 'ab') as f:
+                    f.write(data)
+            except Exception as e:
+                logger.error(f"Erro ao gravar métricas: {e}")
+    
     def save_daily_stats(self, daily_stats: Dict[str, Dict[str, Any]]) -> None:
         """
         Salva estatísticas diárias.
         
+        O JSON é gravado em um arquivo temporário e trocado com replace, para
+        que leitores nunca vejam o arquivo pela metade.
+        
         Args:
             daily_stats: Estatísticas diárias
         """
+        temp_file = self.daily_stats_file.with_suffix('.tmp')
         try:
-            with open(self.daily_stats_file, 'w', encoding='utf-8') as f:
-                json.dump(daily_stats, f, ensure_ascii=False, indent=2)
+            with open(temp_file, 'wb') as f:
+                f.write(dumps_indented(daily_stats))
+            temp_file.replace(self.daily_stats_file)
             
             logger.debug("Estatísticas diárias salvas")
             
@@ -506,27 +844,38 @@ class MetricsStorage:
         metrics = []
         cutoff_time = get_current_timestamp() - (days * 24 * 3600)
         
+        self.flush()
+        
         try:
             if not self.metrics_file.exists():
                 return metrics
             
-            with open(self.metrics_file, 'r', encoding='utf-8') as f:
-                for line in f:
+            # Lê do fim para o início: as linhas são acrescentadas ao fim das
+            # sincronizações, então a leitura para no primeiro registro que
+            # começou antes do corte com folga de METRICS_ORDER_SLACK
+            stop_time = cutoff_time - METRICS_ORDER_SLACK
+            
+            with open(self.metrics_file, 'rb') as f:
+                for line in _iter_lines_reversed(f):
                     line = line.strip()
                     if not line:
                         continue
                     
                     try:
-                        data = json.loads(line)
-                        
-                        # Filtra por data
-                        if data.get('start_time', 0) >= cutoff_time:
-                            # Converte de volta para SyncMetrics
-                            sync_metrics = SyncMetrics(**data)
-                            metrics.append(sync_metrics)
-                            
-                    except json.JSONDecodeError:
+                        data = loads(line)
+                    except ValueError:  # JSON inválido
                         continue
+                    
+                    start_time = data.get('start_time', 0)
+                    
+                    # Filtra por data
+                    if start_time >= cutoff_time:
+                        # Converte de volta para SyncMetrics
+                        metrics.append(SyncMetrics(**data))
+                    elif start_time < stop_time:
+                        break
+            
+            metrics.reverse()
             
             logger.debug(f"Carregadas {len(metrics)} métricas dos últimos {days} dias")
             
@@ -546,8 +895,8 @@ class MetricsStorage:
             if not self.daily_stats_file.exists():
                 return {}
             
-            with open(self.daily_stats_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(self.daily_stats_file, 'rb') as f:
+                return loads(f.read())
                 
         except Exception as e:
             logger.error(f"Erro ao carregar estatísticas diárias: {e}")
@@ -560,6 +909,8 @@ class MetricsStorage:
         Args:
             days: Número de dias para manter
         """
+        self.flush()
+        
         try:
             if not self.metrics_file.exists():
                 return
@@ -567,34 +918,50 @@ class MetricsStorage:
             cutoff_time = get_current_timestamp() - (days * 24 * 3600)
             temp_file = self.metrics_file.with_suffix('.tmp')
             
-            kept_count = 0
             removed_count = 0
             
-            with open(self.metrics_file, 'r', encoding='utf-8') as input_f, \
-                 open(temp_file, 'w', encoding='utf-8') as output_f:
+            with open(self.metrics_file, 'rb') as input_f:
+                # Tudo antes deste ponto é antigo (com a folga de ordenação) e
+                # é descartado sem ser lido
+                offset = _find_start_time_offset(input_f, cutoff_time - METRICS_ORDER_SLACK)
+                input_f.seek(offset)
                 
-                for line in input_f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    try:
-                        data = json.loads(line)
+                with open(temp_file, 'wb') as output_f:
+                    for line in input_f:
+                        stripped = line.strip()
+                        if not stripped:
+                            continue
+                        
+                        try:
+                            start_time = loads(stripped).get('start_time', 0)
+                        except ValueError:
+                            # Mantém linhas inválidas
+                            output_f.write(stripped + b'\n')
+                            continue
                         
-                        if data.get('start_time', 0) >= cutoff_time:
-                            output_f.write(line + '\n')
-                            kept_count += 1
-                        else:
+                        if start_time < cutoff_time:
                             removed_count += 1
-                            
-                    except json.JSONDecodeError:
-                        # Mantém linhas inválidas
-                        output_f.write(line + '\n')
+                            continue
+                        
+                        output_f.write(stripped + b'\n')
+                        
+                        # Passada a janela de folga, o restante é copiado sem parse
+                        if start_time >= cutoff_time + METRICS_ORDER_SLACK:
+                            shutil.copyfileobj(input_f, output_f)
+                            break
+            
+            if offset == 0 and removed_count == 0:
+                temp_file.unlink()
+                logger.info("Limpeza de métricas: nenhuma métrica antiga")
+                return
             
             # Substitui arquivo original
             temp_file.replace(self.metrics_file)
             
-            logger.info(f"Limpeza de métricas: {kept_count} mantidas, {removed_count} removidas")
+            logger.info(
+                f"Limpeza de métricas: {offset} bytes antigos descartados, "
+                f"{removed_count} métricas removidas na janela de corte"
+            )
             
         except Exception as e:
             logger.error(f"Erro na limpeza de métricas: {e}")
@@ -603,19 +970,27 @@ class MetricsStorage:
 # Instância global do coletor
 _metrics_collector = None
 _metrics_storage = None
+_instances_lock = Lock()
 
 
 def get_metrics_collector() -> MetricsCollector:
     """
     Obtém instância global do coletor de métricas.
     
+    Criada uma única vez mesmo com acessos simultâneos (verificação dupla:
+    o lock só é usado enquanto a instância não existe).
+    
     Returns:
         Instância do coletor
     """
     global _metrics_collector
-    if _metrics_collector is None:
-        _metrics_collector = MetricsCollector()
-    return _metrics_collector
+    collector = _metrics_collector
+    if collector is None:
+        with _instances_lock:
+            if _metrics_collector is None:
+                _metrics_collector = MetricsCollector()
+            collector = _metrics_collector
+    return collector
 
 
 def get_metrics_storage() -> MetricsStorage:
@@ -626,9 +1001,13 @@ def get_metrics_storage() -> MetricsStorage:
         Instância do armazenamento
     """
     global _metrics_storage
-    if _metrics_storage is None:
-        _metrics_storage = MetricsStorage()
-    return _metrics_storage
+    storage = _metrics_storage
+    if storage is None:
+        with _instances_lock:
+            if _metrics_storage is None:
+                _metrics_storage = MetricsStorage()
+            storage = _metrics_storage
+    return storage
 
 
 def save_metrics_on_exit(collector: MetricsCollector, storage: MetricsStorage) -> None:
@@ -643,9 +1022,13 @@ def save_metrics_on_exit(collector: MetricsCollector, storage: MetricsStorage) -
         # Salva métricas pendentes
         for sync_metrics in collector.sync_metrics:
             storage.save_sync_metrics(sync_metrics)
+        storage.flush()
         
-        # Salva estatísticas diárias
-        storage.save_daily_stats(dict(collector.daily_stats))
+        # Salva estatísticas diárias, se houve sincronizações desde o último save
+        if collector.daily_stats_dirty:
+            storage.save_daily_stats({date_key: stats.to_dict()
+                                      for date_key, stats in collector.daily_stats.items()})
+            collector.daily_stats_dirty = False
         
         logger.info("Métricas salvas ao sair da aplicação")
         
@@ -663,39 +1046,39 @@ def format_metrics_report(metrics: Dict[str, Any]) -> str:
     Returns:
         Relatório formatado
     """
-    lines = []
+    buffer = io.StringIO()
+    write = buffer.write
     
     # Cabeçalho
-    lines.append("=== RELATÓRIO DE MÉTRICAS ===")
-    lines.append("")
+    write("=== RELATÓRIO DE MÉTRICAS ===\n\n")
     
     # Sistema atual
     if metrics.get('system'):
         sys = metrics['system']
-        lines.append("Sistema:")
-        lines.append(f"  CPU: {sys['cpu_percent']:.1f}%")
-        lines.append(f"  Memória: {sys['memory_percent']:.1f}% ({sys['memory_used_mb']:.0f} MB)")
-        lines.append(f"  Disco: {sys['disk_usage_percent']:.1f}% ({sys['disk_free_gb']:.1f} GB livres)")
-        lines.append("")
+        write("Sistema:\n")
+        write(f"  CPU: {sys['cpu_percent']:.1f}%\n")
+        write(f"  Memória: {sys['memory_percent']:.1f}% ({sys['memory_used_mb']:.0f} MB)\n")
+        write(f"  Disco: {sys['disk_usage_percent']:.1f}% ({sys['disk_free_gb']:.1f} GB livres)\n\n")
     
     # Sincronização atual
     if metrics.get('current_sync'):
         sync = metrics['current_sync']
-        lines.append("Sincronização Atual:")
-        lines.append(f"  Mapeamento: {sync['mapping_name']}")
-        lines.append(f"  Schema: {sync['schema_slug']}")
+        write("Sincronização Atual:\n")
+        write(f"  Mapeamento: {sync['mapping_name']}\n")
+        write(f"  Schema: {sync['schema_slug']}\n")
         if sync.get('elapsed_time'):
-            lines.append(f"  Tempo decorrido: {format_duration(sync['elapsed_time'])}")
-        lines.append(f"  Registros extraídos: {sync['records_extracted']}")
-        lines.append("")
+            write(f"  Tempo decorrido: {format_duration(sync['elapsed_time'])}\n")
+        write(f"  Registros extraídos: {sync['records_extracted']}\n\n")
     
     # Sincronizações recentes
     if metrics.get('recent_syncs'):
-        lines.append("Sincronizações Recentes:")
+        write("Sincronizações Recentes:\n")
         for sync in metrics['recent_syncs'][-5:]:  # Últimas 5
             status = "✓" if sync['success'] else "✗"
             duration = format_duration(sync['duration']) if sync['duration'] else "N/A"
-            lines.append(f"  {status} {sync['mapping_name']} - {sync['records_extracted']} registros ({duration})")
-        lines.append("")
+            write(f"  {status} {sync['mapping_name']} - {sync['records_extracted']} registros ({duration})\n")
+        write("\n")
     
-    return "\n".join(lines)
\ No newline at end of file
+    # Cada seção termina em linha em branco; o relatório termina com uma só quebra
+    report = buffer.getvalue()
+    return report[:-1]
\ No newline at end of file
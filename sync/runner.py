@@ -4,25 +4,111 @@ Gerencia o processo completo de extração, transformação e upload de dados.
 """
 
 import asyncio
+import json
 import logging
+import os
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from core.mapping_state_store import MappingStateStore
-from core.paths import BridgePaths
+from core.paths import BridgePaths, get_api_keys_file_path
 from core.secrets_store import secrets_store
 from core.timeutil import Timer, get_current_timestamp, format_duration
 from datasnap.api import DataSnapAPI
-from sync.extractor import extract_mapping_data, test_source_connection, _resolve_source_config
+from sync.extractor import (
+    stream_mapping_data,
+    test_source_connection,
+    delete_records_after_upload,
+    _resolve_source_config,
+    clear_source_config_cache,
+)
 from sync.jsonl_writer import JSONLBatchWriter, JSONLFileInfo
 from sync.metrics import get_metrics_collector
 from sync.token_cache import TokenCache
-from sync.uploader import BatchUploader, UploadProgress, cleanup_uploaded_files
+from sync.uploader import BatchUploader, UploadPipeline, UploadProgress, UploadResult, cleanup_uploaded_files
 from core.telemetry import telemetry
 from core.http import http_client
+from core.logger import log_phase
+
+
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """
+    Obtém o stat de um arquivo em uma única chamada, no lugar do par
+    exists() + stat().
+    
+    Args:
+        path: Caminho do arquivo
+        
+    Returns:
+        Resultado do stat ou None se o arquivo não existir
+    """
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+class _ExtractionError(RuntimeError):
+    """Erro da extração ocorrido enquanto os lotes eram gravados em JSONL."""
+
+
+class _BatchTracker:
+    """
+    Acompanha os lotes extraídos enquanto são gravados em JSONL, guardando só
+    o que a sincronização usa depois do upload: a contagem, os IDs para
+    delete_after_upload e o maior valor do watermark.
+    """
+    
+    def __init__(self, mapping_config: Dict):
+        transfer = mapping_config.get('transfer', {})
+        incremental_mode = transfer.get('incremental_mode', 'full')
+        
+        self.record_count = 0
+        self.record_ids: List[Any] = []
+        self.max_watermark: Any = None
+        
+        self._pk_column = transfer.get('pk_column') if transfer.get('delete_after_upload') else None
+        if incremental_mode == 'incremental_pk':
+            self._watermark_column = transfer.get('pk_column')
+        elif incremental_mode == 'incremental_timestamp':
+            self._watermark_column = transfer.get('timestamp_column')
+        else:
+            self._watermark_column = None
+    
+    def add(self, batch: List[Dict]) -> None:
+        """Acumula um lote."""
+        self.record_count += len(batch)
+        
+        pk_column = self._pk_column
+        if pk_column:
+            self.record_ids.extend(
+                record[pk_column] for record in batch
+                if record.get(pk_column) is not None
+            )
+        
+        watermark_column = self._watermark_column
+        if watermark_column:
+            for record in batch:
+                value = record.get(watermark_column)
+                if value is not None and (self.max_watermark is None or value > self.max_watermark):
+                    self.max_watermark = value
+    
+    def track(self, batches: Iterable[List[Dict]]) -> Iterator[List[Dict]]:
+        """
+        Repassa os lotes acumulando cada um; erros da extração saem como
+        _ExtractionError para não serem confundidos com erros de escrita.
+        """
+        try:
+            for batch in batches:
+                self.add(batch)
+                yield batch
+        except Exception as e:
+            raise _ExtractionError(f"Erro na extração de dados: {e}") from e
 
 
 @dataclass
@@ -37,6 +123,7 @@ class SyncConfig:
     dry_run: bool = False
     force_full_sync: bool = False
     skip_validation: bool = False
+    pipeline_uploads: bool = False  # Envia cada arquivo assim que é fechado, durante a extração
 
 
 @dataclass
@@ -67,40 +154,93 @@ class SyncRunner:
     def __init__(self, config: Optional[SyncConfig] = None):
         self.config = config or SyncConfig()
         self.logger = logging.getLogger(__name__)
-        self.logger.info(f"[DEBUG] SyncRunner.__init__ iniciado")
         
-        self.paths = BridgePaths()
-        self.logger.info(f"[DEBUG] BridgePaths inicializado")
+        with log_phase(self.logger, "SyncRunner.__init__"):
+            self.paths = BridgePaths()
+            self.state_store = MappingStateStore()
+            self.api = DataSnapAPI()
+            self.token_cache = TokenCache()
+            self.metrics = get_metrics_collector()
         
-        self.state_store = MappingStateStore()
-        self.logger.info(f"[DEBUG] MappingStateStore inicializado")
+        self._running_syncs: Set[str] = set()
+        self._run_ids: Dict[str, int] = {}
+        self._config_cache: Dict[str, Tuple[int, Dict]] = {}  # nome -> (mtime_ns, configuração)
+        self._available_mappings_cache: Optional[Tuple[int, List[str]]] = None  # (mtime_ns do diretório, nomes)
+        self._telemetry_token: Optional[str] = None
+        self._telemetry_token_loaded = False
+        self._telemetry_token_mtime_ns: Optional[int] = None  # mtime do arquivo de API Keys lido
+        self._telemetry_token_lock = threading.Lock()
+        self._bg_telemetry_tasks: Set[asyncio.Task] = set()
         
-        self.api = DataSnapAPI()
-        self.logger.info(f"[DEBUG] DataSnapAPI inicializado")
+        # Threads próprios para extração, teste de conexão e deleção, fora do
+        # executor padrão do event loop (compartilhado com todo to_thread)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(self.config.max_workers, 1),
+            thread_name_prefix="sync-worker"
+        )
+    
+    async def __aenter__(self) -> 'SyncRunner':
+        """Context manager entry."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        await self.wait_for_telemetry()
+        self.close()
+    
+    def close(self) -> None:
+        """Encerra os threads de trabalho do runner."""
+        self._executor.shutdown(wait=True)
+    
+    async def _run_in_worker(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Executa uma função bloqueante nos threads de trabalho do runner.
         
-        self.token_cache = TokenCache()
-        self.logger.info(f"[DEBUG] TokenCache inicializado")
+        Args:
+            func: Função a executar
+            *args: Argumentos posicionais
+            
+        Returns:
+            Retorno da função
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    def _get_telemetry_token(self) -> Optional[str]:
+        """
+        Obtém o token da telemetria (primeira API Key do sistema). O token é
+        reaproveitado enquanto o arquivo de API Keys não mudar (mtime); a
+        telemetria é enviada de threads, por isso o acesso é protegido por lock.
         
-        self.metrics = get_metrics_collector()
-        self.logger.info(f"[DEBUG] Metrics collector inicializado")
+        Returns:
+            Token ou None se não houver chave disponível
+        """
+        stat = _stat_or_none(get_api_keys_file_path())
+        mtime_ns = stat.st_mtime_ns if stat is not None else None
         
-        self._running_syncs: Set[str] = set()
-        self._run_ids: Dict[str, int] = {}
-        self.logger.info(f"[DEBUG] SyncRunner.__init__ concluído")
-
-    def _send_telemetry(self, event_type: str, status: str, mapping_config: Optional[Dict] = None, **kwargs):
-        """Helper para envio seguro de telemetria"""
-        try:
-            # Obter token válido
-            # Obter token válido
-            token = None
+        with self._telemetry_token_lock:
+            if self._telemetry_token_loaded and mtime_ns == self._telemetry_token_mtime_ns:
+                return self._telemetry_token
+            
             try:
+                if self._telemetry_token_loaded:
+                    # Arquivo alterado desde a última leitura
+                    secrets_store.load()
+                
                 # Tenta obter API Key do sistema (preferencial)
                 keys = secrets_store.list_keys()
-                if keys:
-                    token = keys[0].token
+                self._telemetry_token = keys[0].token if keys else None
+                self._telemetry_token_mtime_ns = mtime_ns
+                self._telemetry_token_loaded = True
             except Exception as e:
                 self.logger.warning(f"⚠️ Não foi possível obter token para telemetria: {e}")
+            return self._telemetry_token
+    
+    def _send_telemetry_sync(self, event_type: str, status: str, mapping_config: Optional[Dict] = None, **kwargs):
+        """Helper para envio seguro de telemetria (bloqueante)"""
+        try:
+            # Obter token válido
+            token = self._get_telemetry_token()
 
             # Determinar source e destination (não aplicável para heartbeat)
             source = None
@@ -133,11 +273,8 @@ class SyncRunner:
                 
             payload = telemetry.build_payload(**payload_kwargs)
             
-            # Enviar (sem bloquear ou falhar o processo principal)
-            # Como send_healthcheck é síncrono (requests), isso adiciona latência.
-            # Idealmente seria async, mas Runner é async def, http_client é sync.
-            # Para evitar travar loop, poderíamos usar thread, mas vamos manter simples por enquanto.
-            # Enviar e capturar resposta
+            # Enviar e capturar resposta (send_healthcheck é síncrono; os
+            # chamadores async usam _send_telemetry_async/_background)
             success, response = http_client.send_healthcheck(secret="", payload=payload, token=token)
             if not success:
                self.logger.warning(f"⚠️ Falha no envio de telemetria ({event_type}): {response}")
@@ -148,6 +285,30 @@ class SyncRunner:
         except Exception as e:
             self.logger.warning(f"⚠️ Erro ao processar telemetria: {e}")
         
+    async def _send_telemetry_async(self, event_type: str, status: str, mapping_config: Optional[Dict] = None, **kwargs):
+        """
+        Envia telemetria em um thread, sem bloquear o event loop, e aguarda a
+        resposta (usado quando o id retornado é necessário, como no run_start).
+        """
+        return await asyncio.to_thread(self._send_telemetry_sync, event_type, status, mapping_config, **kwargs)
+    
+    def _send_telemetry_background(self, event_type: str, status: str, mapping_config: Optional[Dict] = None, **kwargs) -> None:
+        """
+        Envia telemetria em segundo plano, sem esperar a resposta; a
+        sincronização não fica presa à latência do envio. Aguarde os envios
+        pendentes com wait_for_telemetry.
+        """
+        task = asyncio.create_task(
+            self._send_telemetry_async(event_type, status, mapping_config, **kwargs)
+        )
+        self._bg_telemetry_tasks.add(task)
+        task.add_done_callback(self._bg_telemetry_tasks.discard)
+    
+    async def wait_for_telemetry(self) -> None:
+        """Aguarda os envios de telemetria em segundo plano ainda pendentes."""
+        if self._bg_telemetry_tasks:
+            await asyncio.gather(*self._bg_telemetry_tasks, return_exceptions=True)
+    
     async def sync_mapping(self, mapping_name: str) -> SyncResult:
         """
         Sincroniza um mapeamento específico.
@@ -158,17 +319,16 @@ class SyncRunner:
         Returns:
             Resultado da sincronização
         """
-        self.logger.info(f"[DEBUG] sync_mapping iniciado para: {mapping_name}")
+        self.logger.debug("sync_mapping iniciado para: %s", mapping_name)
         
         if mapping_name in self._running_syncs:
-            self.logger.info(f"[DEBUG] Sincronização já em execução para {mapping_name}")
+            self.logger.debug("Sincronização já em execução para %s", mapping_name)
             return SyncResult(
                 mapping_name=mapping_name,
                 success=False,
                 error_message="Sincronização já está em execução para este mapeamento"
             )
         
-        self.logger.info(f"[DEBUG] Adicionando {mapping_name} aos syncs em execução")
         self._running_syncs.add(mapping_name)
         
         # Garantir que o mapping_name seja usado se o config não tiver 'name'
@@ -178,16 +338,12 @@ class SyncRunner:
         timer.start()  # Iniciar o timer
         
         try:
-            self.logger.info(f"[DEBUG] Iniciando sincronização do mapeamento: {mapping_name}")
-            
-            self.logger.info(f"[DEBUG] Chamando state_store.start_sync...")
-            self.state_store.start_sync(mapping_name)
-            self.logger.info(f"[DEBUG] state_store.start_sync concluído")
+            with log_phase(self.logger, "state_store.start_sync"):
+                self.state_store.start_sync(mapping_name)
             
-            self.logger.info(f"[DEBUG] Chamando metrics.start_sync_metrics...")
             # Carregar configuração do mapeamento primeiro para obter schema_slug
-            self.logger.info(f"[DEBUG] Carregando configuração do mapeamento: {mapping_name}")
-            mapping_config = self._load_mapping_config(mapping_name)
+            with log_phase(self.logger, "carregamento da configuração"):
+                mapping_config = self._load_mapping_config(mapping_name)
             if not mapping_config:
                 available = self._get_available_mappings()
                 msg = f"Configuração do mapeamento '{mapping_name}' não encontrada."
@@ -198,8 +354,6 @@ class SyncRunner:
                     msg += " Nenhum mapeamento disponível encontrado."
                 raise ValueError(msg)
             
-            self.logger.info(f"[DEBUG] Configuração carregada com sucesso: {mapping_config}")
-            
             # Inicializar metadados para o relatório
             dest_name = mapping_config.get('schema', {}).get('name', mapping_config.get('destination', {}).get('name', 'N/A'))
             extraction_status = "Pendente"
@@ -208,19 +362,18 @@ class SyncRunner:
             
             # Precisamos do schema_slug para iniciar as métricas
             schema_slug = mapping_config.get('schema_slug', mapping_name)
-            self.metrics.start_sync_metrics(mapping_name, schema_slug)
-            self.logger.info(f"[DEBUG] metrics.start_sync_metrics concluído")
+            with log_phase(self.logger, "metrics.start_sync_metrics"):
+                self.metrics.start_sync_metrics(mapping_name, schema_slug)
             
             # Testar conexão com a fonte
             if not self.config.skip_validation:
-                self.logger.info(f"[DEBUG] Testando conexão com a fonte de dados...")
-                await self._test_source_connection(mapping_config)
-                self.logger.info(f"[DEBUG] Teste de conexão concluído")
+                with log_phase(self.logger, "teste de conexão"):
+                    await self._test_source_connection(mapping_config)
             else:
-                self.logger.info(f"[DEBUG] Pulando validação de conexão (skip_validation=True)")
+                self.logger.debug("Pulando validação de conexão (skip_validation=True)")
             
             # Telemetria: Run Start
-            start_resp = self._send_telemetry(
+            start_resp = await self._send_telemetry_async(
                 event_type="run_start",
                 status="success", # Start é sempre success se chegou aqui
                 mapping_config=mapping_config
@@ -230,20 +383,34 @@ class SyncRunner:
                 self._run_ids[mapping_name] = start_resp['id']
 
             
-            # Extrair dados
-            self.logger.info(f"[DEBUG] Iniciando extração de dados...")
-            records = await self._extract_data(mapping_config, mapping_name)
+            # Extrair dados e escrever arquivos JSONL lote a lote, sem manter os registros em memória
+            self.logger.info(f"📝 Extraindo dados e escrevendo arquivos JSONL...")
+            tracker = _BatchTracker(mapping_config)
+            upload_pipeline = self._start_upload_pipeline(mapping_name, mapping_config)
+            try:
+                jsonl_files = await self._run_in_worker(
+                    self._write_jsonl_files,
+                    mapping_name,
+                    tracker.track(stream_mapping_data(mapping_config)),
+                    upload_pipeline.submit if upload_pipeline else None
+                )
+            except BaseException:
+                if upload_pipeline:
+                    # Aguarda os envios em andamento antes da limpeza dos arquivos
+                    await self._run_in_worker(upload_pipeline.results)
+                raise
             extraction_status = "Sucesso"
-            self.logger.info(f"[DEBUG] Extração concluída. Registros encontrados: {len(records) if records else 0}")
+            records_count = tracker.record_count
+            self.logger.info(f"✅ Extração concluída com sucesso: {records_count} registros extraídos")
             
-            if not records:
+            if records_count == 0:
                 mapping_display_name = mapping_config.get('name') or mapping_name or 'N/A'
                 source_name = mapping_config.get('source', {}).get('name', 'N/A')
                 self.logger.warning(f"📊 Nenhum registro encontrado para: {mapping_display_name} ({source_name} ➔ {dest_name})")
                 
                 # Telemetria: Run End (Empty)
                 run_id_val = self._run_ids.get(mapping_name)
-                self._send_telemetry(
+                self._send_telemetry_background(
                     event_type="run_end",
                     status="success",
                     mapping_config=mapping_config,
@@ -267,7 +434,6 @@ class SyncRunner:
             
             # Verificar número mínimo de registros para upload
             min_records_for_upload = mapping_config.get('transfer', {}).get('min_records_for_upload', 0)
-            records_count = len(records)
             
             if min_records_for_upload > 0 and records_count < min_records_for_upload:
                 source_name = mapping_config.get('source', {}).get('name', 'N/A')
@@ -276,12 +442,16 @@ class SyncRunner:
                 self.logger.info(f"📊 Registros encontrados para {mapping_display_name}: {records_count}")
                 self.logger.info(f"📋 Mínimo necessário: {min_records_for_upload}")
                 
+                # A contagem só é conhecida após a escrita: os arquivos não serão enviados
+                for file_info in jsonl_files:
+                    file_info.file_path.unlink(missing_ok=True)
+                
                 msg = f"Upload skip: {mapping_display_name} ({source_name} ➔ {dest_name}) | {records_count} registros encontrados, mínimo necessário: {min_records_for_upload}"
                 self.logger.warning(f"⚠️  {msg}")
 
                 # Telemetria: Run End (Skipped)
                 run_id_val = self._run_ids.get(mapping_name)
-                self._send_telemetry(
+                self._send_telemetry_background(
                     event_type="run_end",
                     status="success", # Considerado sucesso (skipped)
                     mapping_config=mapping_config,
@@ -306,10 +476,6 @@ class SyncRunner:
                 )
             
             self.logger.info(f"✅ Validação de número mínimo passou: {records_count} registros (mínimo: {min_records_for_upload})")
-            
-            # Escrever arquivos JSONL
-            self.logger.info(f"📝 Escrevendo arquivos JSONL...")
-            jsonl_files = await self._write_jsonl_files(mapping_name, records)
             self.logger.info(f"✅ Arquivos JSONL criados: {len(jsonl_files)}")
             
             # Upload dos arquivos
@@ -321,39 +487,16 @@ class SyncRunner:
             
             
             if not self.config.dry_run:
-                self.logger.info(f"🔄 Convertendo Path objects para JSONLFileInfo...")
-                # Converter Path objects para JSONLFileInfo
-                from sync.jsonl_writer import JSONLFileInfo
-                from core.timeutil import get_current_timestamp
-                import hashlib
+                # O writer já devolve tamanho, contagem e checksum MD5 de cada arquivo
+                files_info = jsonl_files
                 
-                files_info = []
-                for file_path in jsonl_files:
-                    if file_path.exists():
-                        file_size = file_path.stat().st_size
-                        
-                        # Somar ao total de bytes para telemetria
-                        total_upload_bytes += file_size
-                        
-                        # Calcular checksum simples
-                        with open(file_path, 'rb') as f:
-                            checksum = hashlib.md5(f.read()).hexdigest()
-                        
-                        file_info = JSONLFileInfo(
-                            file_path=file_path,
-                            record_count=0,  # Será atualizado pelo writer
-                            file_size=file_size,
-                            compressed=file_path.suffix == '.gz',
-                            checksum=checksum,
-                            created_at=get_current_timestamp(),
-                            mapping_name=mapping_name,
-                            schema_slug=schema_slug
-                        )
-                        files_info.append(file_info)
-                        self.logger.debug(f"📄 Arquivo convertido: {file_path.name} -> {file_size} bytes, checksum: {checksum[:8]}...")
+                # Somar ao total de bytes para telemetria
+                total_upload_bytes = sum(file_info.file_size for file_info in files_info)
                 
                 self.logger.warning(f"🚀 Iniciando upload de {len(files_info)} arquivo(s): {mapping_name}")
-                upload_res = self._upload_files(files_info, mapping_name)
+                upload_res = await self._run_in_worker(
+                    self._upload_files, files_info, mapping_name, mapping_config, upload_pipeline
+                )
                 
                 if isinstance(upload_res, tuple) and len(upload_res) >= 4:
                     upload_success = bool(upload_res[0])
@@ -383,12 +526,12 @@ class SyncRunner:
             cleanup_status = "N/A"
             
             # Calcular estatísticas
-            total_records = len(records)
+            total_records = records_count
             files_created = len(jsonl_files)
             
             # Deletar registros do banco se delete_after_upload estiver habilitado e upload foi bem-sucedido
             if (upload_success is True) and total_records > 0:
-                await self._handle_delete_after_upload(mapping_config, records, mapping_name)
+                await self._handle_delete_after_upload(mapping_config, tracker.record_ids, mapping_name)
                 
                 # Limpar Laravel log após upload bem-sucedido
                 source_config_raw = mapping_config.get('source', {})
@@ -410,9 +553,6 @@ class SyncRunner:
                     
                     if log_path and truncate:
                         try:
-                            import os
-                            from pathlib import Path
-                            
                             path_obj = Path(log_path)
                             size_before = path_obj.stat().st_size if path_obj.exists() else 0
                             
@@ -440,19 +580,18 @@ class SyncRunner:
             
             # Atualizar watermark se houver registros e modo incremental e upload foi sucesso
             if upload_success and total_records > 0:
-                self._update_watermark(mapping_config, records)
+                self._update_watermark(mapping_config, tracker.max_watermark)
             
             # Determinar se a sincronização foi bem-sucedida
             sync_success = upload_success or self.config.dry_run
             
-            # Atualizar estado baseado no resultado do upload
-            if sync_success:
-                self.state_store.finish_sync_success(
-                    mapping_name, 
-                    total_records
-                )
-            else:
-                self.state_store.finish_sync_error(mapping_name, upload_error or "Falha no upload de arquivos")
+            # Atualizar estado baseado no resultado do upload (uma única escrita)
+            self.state_store.finish_sync(
+                mapping_name,
+                total_records,
+                success=sync_success,
+                error_message=None if sync_success else (upload_error or "Falha no upload de arquivos")
+            )
             
             self.metrics.finish_sync_metrics(success=sync_success, 
                                            error_message=None if sync_success else "Falha no upload de arquivos")
@@ -485,7 +624,7 @@ class SyncRunner:
             if not sync_success and upload_error_details:
                 telemetry_error_kwargs = upload_error_details
                 
-            self._send_telemetry(
+            self._send_telemetry_background(
                 event_type="run_end",
                 status="success" if sync_success else "error",
                 mapping_config=mapping_config,
@@ -511,14 +650,14 @@ class SyncRunner:
             except Exception as cleanup_error:
                 self.logger.warning(f"⚠️ Erro durante limpeza de arquivos temporários: {cleanup_error}")
             
-            self.state_store.finish_sync_error(mapping_name, error_msg)
+            self.state_store.finish_sync(mapping_name, success=False, error_message=error_msg)
             self.metrics.finish_sync_metrics(success=False, error_message=error_msg)
             
             # Telemetria: Error
             # Tentar carregar mapping_config se não existir (para contexto)
             current_config = locals().get('mapping_config')
             
-            self._send_telemetry(
+            self._send_telemetry_background(
                 event_type="error",
                 status="error",
                 mapping_config=current_config,
@@ -552,24 +691,32 @@ class SyncRunner:
         
         Args:
             mapping_names: Lista de nomes dos mapeamentos
-            parallel: Se True, executa em paralelo
+            parallel: Se True, executa em paralelo (até config.max_workers por vez)
             
         Returns:
             Lista de resultados das sincronizações
         """
-        self.logger.info(f"[DEBUG] sync_multiple_mappings iniciado com mapeamentos: {mapping_names}, parallel: {parallel}")
+        self.logger.debug("sync_multiple_mappings iniciado com mapeamentos: %s, parallel: %s", mapping_names, parallel)
         
         if not parallel:
             results = []
             for mapping_name in mapping_names:
-                self.logger.info(f"[DEBUG] Processando mapeamento sequencial: {mapping_name}")
+                self.logger.debug("Processando mapeamento sequencial: %s", mapping_name)
                 result = await self.sync_mapping(mapping_name)
                 results.append(result)
+            await self.wait_for_telemetry()
             return results
         
-        # Execução paralela
-        self.logger.info(f"[DEBUG] Iniciando execução paralela para {len(mapping_names)} mapeamentos")
-        tasks = [self.sync_mapping(name) for name in mapping_names]
+        # Execução paralela, limitada a max_workers sincronizações simultâneas
+        # (cada uma ocupa threads e conexões com o banco de origem)
+        self.logger.debug("Iniciando execução paralela para %d mapeamentos", len(mapping_names))
+        semaphore = asyncio.Semaphore(max(self.config.max_workers, 1))
+        
+        async def _bounded_sync(name: str) -> SyncResult:
+            async with semaphore:
+                return await self.sync_mapping(name)
+        
+        tasks = [_bounded_sync(name) for name in mapping_names]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
         # Converter exceções em resultados de erro
@@ -584,7 +731,8 @@ class SyncRunner:
             else:
                 final_results.append(result)
         
-        self.logger.info(f"[DEBUG] sync_multiple_mappings concluído com {len(final_results)} resultados")
+        await self.wait_for_telemetry()
+        self.logger.debug("sync_multiple_mappings concluído com %d resultados", len(final_results))
         return final_results
     
     async def sync_all_mappings(self) -> List[SyncResult]:
@@ -611,45 +759,56 @@ class SyncRunner:
         """
         states = self.state_store.get_all_states()
         
+        # Uma única passada pelos estados
+        last_sync_times = {}
+        sync_counts = {}
+        error_counts = {}
+        for name, state in states.items():
+            sync_counts[name] = state.sync_count
+            if state.last_sync_timestamp:
+                last_sync_times[name] = state.last_sync_timestamp
+            if state.last_error:
+                error_counts[name] = 1
+        
         return {
             'running_syncs': list(self._running_syncs),
             'total_mappings': len(self._get_available_mappings()),
-            'last_sync_times': {
-                name: state.last_sync_timestamp 
-                for name, state in states.items()
-                if state.last_sync_timestamp
-            },
-            'sync_counts': {
-                name: state.sync_count 
-                for name, state in states.items()
-            },
-            'error_counts': {
-                name: 1 if state.last_error else 0
-                for name, state in states.items()
-                if state.last_error
-            }
+            'last_sync_times': last_sync_times,
+            'sync_counts': sync_counts,
+            'error_counts': error_counts
         }
     
     def _load_mapping_config(self, mapping_name: str) -> Optional[Dict]:
-        """Carrega a configuração de um mapeamento."""
+        """
+        Carrega a configuração de um mapeamento.
+        
+        O resultado fica em cache enquanto o mtime do arquivo não mudar (o
+        watermark, por exemplo, reescreve o arquivo e invalida o cache).
+        """
         try:
             self.logger.debug(f"📋 Iniciando carregamento da configuração do mapeamento: {mapping_name}")
             mapping_file = self.paths.get_mapping_file(mapping_name)
             self.logger.debug(f"📁 Caminho do arquivo de mapeamento: {mapping_file}")
             
-            if not mapping_file.exists():
+            stat = _stat_or_none(mapping_file)
+            if stat is None:
                 self.logger.error(f"❌ Arquivo de mapeamento não encontrado: {mapping_file}")
                 return None
             
-            file_size = mapping_file.stat().st_size
-            self.logger.debug(f"📊 Tamanho do arquivo: {file_size} bytes")
+            cached = self._config_cache.get(mapping_name)
+            if cached and cached[0] == stat.st_mtime_ns:
+                self.logger.debug(f"📋 Configuração do mapeamento em cache: {mapping_name}")
+                return cached[1]
+            
+            self.logger.debug(f"📊 Tamanho do arquivo: {stat.st_size} bytes")
             
-            import json
             with open(mapping_file, 'r', encoding='utf-8') as f:
                 config = json.load(f)
+            self._config_cache[mapping_name] = (stat.st_mtime_ns, config)
                 
             self.logger.info(f"✅ Configuração do mapeamento carregada com sucesso de: {mapping_file}")
-            self.logger.info(f"📜 Conteúdo da configuração: {json.dumps(config, indent=2, default=str)}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("📜 Conteúdo da configuração: %s", json.dumps(config, default=str))
             self.logger.debug(f"🔧 Fonte de dados: {config.get('source_type', 'N/A')}")
             self.logger.debug(f"🏷️ Schema slug: {config.get('schema_slug', 'N/A')}")
             self.logger.debug(f"🗂️ Tabela: {config.get('table_name', 'N/A')}")
@@ -667,7 +826,7 @@ class SyncRunner:
             self.logger.debug(f"🏠 Host: {mapping_config.get('host', 'N/A')}")
             self.logger.debug(f"🗂️ Database: {mapping_config.get('database', 'N/A')}")
             
-            success, error = await asyncio.to_thread(
+            success, error = await self._run_in_worker(
                 test_source_connection, 
                 mapping_config
             )
@@ -682,49 +841,28 @@ class SyncRunner:
             self.logger.error(f"💥 Erro ao testar conexão: {e}")
             raise ConnectionError(f"Erro ao testar conexão: {e}")
     
-    async def _extract_data(self, mapping_config: Dict, mapping_name: str) -> List[Dict]:
-        """Extrai dados da fonte."""
-        # Se 'name' não existir, tenta pegar do mapping_name do runner
-        mapping_display_name = mapping_config.get('name') or mapping_name or 'N/A'
-        source_name = mapping_config.get('source', {}).get('name', 'N/A')
-        dest_name = mapping_config.get('schema', {}).get('name', mapping_config.get('destination', {}).get('name', 'N/A'))
-        
-        try:
-            self.logger.warning(f"📊 Iniciando extração: {mapping_display_name} ({source_name} ➔ {dest_name})")
-            self.logger.debug(f"🔧 Configuração: {mapping_config.get('source_type', 'N/A')} -> {mapping_config.get('table_name', 'N/A')}")
-            
-            extraction_result = await asyncio.to_thread(
-                extract_mapping_data, 
-                mapping_config
-            )
-            
-            # extract_mapping_data retorna ExtractionResult, não uma lista
-            if not extraction_result.success:
-                self.logger.error(f"❌ Falha na extração: {extraction_result.error_message}")
-                raise RuntimeError(f"Falha na extração: {extraction_result.error_message}")
-            
-            records_count = len(extraction_result.data) if extraction_result.data else 0
-            self.logger.info(f"✅ Extração concluída com sucesso: {records_count} registros extraídos")
-            
-            if records_count > 0:
-                self.logger.debug(f"📋 Primeiro registro (amostra): {extraction_result.data[0] if extraction_result.data else 'N/A'}")
-            
-            # Agora retornamos os dados reais do ExtractionResult
-            return extraction_result.data or []
-            
-        except Exception as e:
-            self.logger.error(f"💥 Erro na extração de dados: {e}")
-            raise RuntimeError(f"Erro na extração de dados: {e}")
-    
-    async def _write_jsonl_files(
+    def _write_jsonl_files(
         self, 
         mapping_name: str, 
-        records: List[Dict]
-    ) -> List[Path]:
-        """Escreve os registros em arquivos JSONL."""
+        batches: Iterable[List[Dict]],
+        on_file_closed: Optional[Callable[[JSONLFileInfo], None]] = None
+    ) -> List[JSONLFileInfo]:
+        """
+        Escreve os lotes de registros em arquivos JSONL, à medida que chegam.
+        
+        O checksum MD5 enviado no upload (X-Checksum) é calculado pelo writer
+        sobre os mesmos bytes gravados, sem reler os arquivos.
+        
+        Args:
+            mapping_name: Nome do mapeamento
+            batches: Lotes de registros (ex.: gerador da extração)
+            on_file_closed: Chamado com cada arquivo assim que ele é fechado
+            
+        Returns:
+            Informações dos arquivos criados (nenhum se não houver registros)
+        """
         try:
             self.logger.info(f"📝 Iniciando escrita de arquivos JSONL...")
-            self.logger.debug(f"📊 Total de registros para escrever: {len(records)}")
             
             output_dir = self.paths.uploads_dir
             self.logger.debug(f"📁 Diretório de saída: {output_dir}")
@@ -735,38 +873,53 @@ class SyncRunner:
                 output_dir=output_dir,
                 compress=False,  # Alterado para False para gerar arquivos .jsonl em vez de .gz
                 max_records_per_file=self.config.batch_size,
-                max_file_size=self.config.max_file_size_mb * 1024 * 1024  # Convertendo MB para bytes
+                max_file_size=self.config.max_file_size_mb * 1024 * 1024,  # Convertendo MB para bytes
+                checksum_algorithm='md5',  # Arquivos sem compressão: o MD5 do conteúdo é o do arquivo
+                on_file_closed=on_file_closed
             )
             
             self.logger.debug(f"🔧 Configuração do writer: batch_size={self.config.batch_size}, max_file_size={self.config.max_file_size_mb}MB, compress=False")
             
             with batch_writer:
-                batch_writer.write_batch(records)
+                for batch in batches:
+                    batch_writer.write_batch(batch)
                 files_info = batch_writer.close()
             
-            file_paths = [file_info.file_path for file_info in files_info]
-            self.logger.info(f"✅ Arquivos JSONL criados com sucesso: {len(file_paths)} arquivo(s)")
+            self.logger.info(f"✅ Arquivos JSONL criados com sucesso: {len(files_info)} arquivo(s)")
             
             # Log detalhado dos arquivos criados
-            for i, file_path in enumerate(file_paths):
-                if file_path.exists():
-                    file_size = file_path.stat().st_size
-                    self.logger.debug(f"📄 Arquivo {i+1}: {file_path.name} ({file_size} bytes)")
-                else:
-                    self.logger.warning(f"⚠️ Arquivo {i+1} não encontrado: {file_path}")
-            
-            return file_paths
+            if self.logger.isEnabledFor(logging.DEBUG):
+                for i, file_info in enumerate(files_info, 1):
+                    self.logger.debug(
+                        "📄 Arquivo %d: %s (%d bytes, %d registros, checksum: %s...)",
+                        i, file_info.file_path.name, file_info.file_size,
+                        file_info.record_count, file_info.checksum[:8]
+                    )
+            
+            return files_info
+        except _ExtractionError as e:
+            self.logger.error(f"💥 {e}")
+            raise
         except Exception as e:
             self.logger.error(f"💥 Erro ao escrever arquivos JSONL: {e}")
             raise RuntimeError(f"Erro ao escrever arquivos JSONL: {e}")
     
-    def _upload_files(self, files_info: List[JSONLFileInfo], mapping_name: str) -> Tuple[bool, Optional[str], Optional[Dict], int]:
+    def _upload_files(
+        self,
+        files_info: List[JSONLFileInfo],
+        mapping_name: str,
+        mapping_config: Optional[Dict] = None,
+        upload_pipeline: Optional[UploadPipeline] = None
+    ) -> Tuple[bool, Optional[str], Optional[Dict], int]:
         """
         Faz upload dos arquivos JSONL.
         
         Args:
             files_info: Lista de informações dos arquivos
             mapping_name: Nome do mapeamento
+            mapping_config: Configuração já carregada (carregada aqui se omitida)
+            upload_pipeline: Pipeline que já recebeu os arquivos durante a escrita;
+                nesse caso apenas aguarda e analisa os resultados
             
         Returns:
             Tupla (sucesso, mensagem_erro, detalhes_erro)
@@ -775,24 +928,31 @@ class SyncRunner:
             self.logger.info(f"📤 Nenhum arquivo para upload no mapeamento {mapping_name}")
             return True, None, None, 0
         
-        start_time = get_current_timestamp()
+        start_time = upload_pipeline.started_at if upload_pipeline else get_current_timestamp()
         self.logger.warning(f"📤 Iniciando upload de {len(files_info)} arquivo(s) para: {mapping_name}")
         
         # Log detalhado dos arquivos que serão enviados
         total_size = 0
         for i, file_info in enumerate(files_info):
-            if file_info.file_path.exists():
-                file_size = file_info.file_path.stat().st_size
-                total_size += file_size
-                self.logger.debug(f"📄 Arquivo {i+1}: {file_info.file_path.name} ({file_size} bytes, {file_info.record_count} registros)")
+            stat = _stat_or_none(file_info.file_path)
+            if stat is not None:
+                total_size += stat.st_size
+                self.logger.debug("📄 Arquivo %d: %s (%d bytes, %d registros)",
+                                  i + 1, file_info.file_path.name, stat.st_size, file_info.record_count)
             else:
                 self.logger.warning(f"⚠️ Arquivo {i+1} não encontrado: {file_info.file_path}")
         
         self.logger.info(f"📊 Total de dados para upload: {total_size} bytes ({total_size / 1024 / 1024:.2f} MB)")
         
         try:
+            if upload_pipeline:
+                self.logger.info(f"⏳ Aguardando uploads iniciados durante a escrita...")
+                results = upload_pipeline.results()
+                return self._summarize_upload_results(results, mapping_name, start_time)
+            
             # Carrega configuração do mapping para obter o schema_slug correto
-            mapping_config = self._load_mapping_config(mapping_name)
+            if mapping_config is None:
+                mapping_config = self._load_mapping_config(mapping_name)
             if not mapping_config:
                 self.logger.error(f"❌ Não foi possível carregar configuração do mapping: {mapping_name}")
                 self.logger.error(f"❌ Não foi possível carregar configuração do mapping: {mapping_name}")
@@ -810,71 +970,15 @@ class SyncRunner:
             self.logger.debug(f"🔧 Criando BatchUploader...")
             uploader = BatchUploader(self.api, self.token_cache)
             
-            # Callback de progresso
-            def progress_callback(filename: str, progress: UploadProgress):
-                self.logger.info(f"📈 Upload progress - {filename}: {progress.percentage:.1f}% "
-                               f"({progress.bytes_uploaded}/{progress.total_bytes} bytes)")
-            
             # Faz upload
             self.logger.info(f"🚀 Iniciando upload para schema {schema_slug}...")
-            results = uploader.upload_files(files_info, schema_slug, progress_callback, mapping_name)
-            
-            # Analisa resultados
-            successful_uploads = [r for r in results if r.success]
-            failed_uploads = [r for r in results if not r.success]
-            
-            self.logger.info(f"📊 Resultados do upload: {len(successful_uploads)} sucessos, {len(failed_uploads)} falhas")
-            
-            # Log detalhado dos resultados
-            for result in results:
-                if result.success:
-                    self.logger.warning(f"✅ Upload bem-sucedido: {result.file_info.file_path.name} -> upload_id: {result.upload_id}")
-                else:
-                    self.logger.warning(f"❌ Upload falhou: {result.file_info.file_path.name} -> erro: {result.error_message}")
-            
-            # Atualiza métricas
-            total_records = sum(result.file_info.record_count for result in successful_uploads)
-            upload_duration = get_current_timestamp() - start_time
-            total_retries = sum(result.retry_count for result in results)
-            self.metrics.update_upload_metrics(
-                files_uploaded=len(successful_uploads), 
-                records_uploaded=total_records,
-                duration=upload_duration,
-                retry_count=total_retries
-            )
-            
-            if len(failed_uploads) == 0:
-                self.logger.warning(f"🎉 Todos os uploads foram bem-sucedidos para: {mapping_name}")
-                error_msg = None
-                error_details = None
-            else:
-                # Coleta mensagens de erro
-                error_msgs = [f"{r.file_info.file_path.name}: {r.error_message}" for r in failed_uploads]
-                error_msg = "; ".join(error_msgs)
-                
-                # Coleta detalhes do primeiro erro para telemetria (priorizando o que tem mais informação)
-                first_failure = failed_uploads[0]
-                error_details = {
-                    'error_code': first_failure.error_code,
-                    'error_stack': first_failure.error_stack,
-                    'error_context': first_failure.error_context
-                }
-                
-                self.logger.warning(f"⚠️ {len(failed_uploads)} upload(s) falharam para {mapping_name}: {error_msg}")
-            
-            # Limpar arquivos temporários após upload (sucesso ou falha)
-            try:
-                cleanup_uploaded_files(results, keep_failed=False)  # Remove todos os arquivos, incluindo os que falharam
-            except Exception as e:
-                self.logger.warning(f"⚠️ Erro durante limpeza de arquivos temporários: {e}")
-            
-            return len(failed_uploads) == 0, error_msg, error_details, total_retries
+            results = uploader.upload_files(files_info, schema_slug, self._log_upload_progress, mapping_name)
+            return self._summarize_upload_results(results, mapping_name, start_time)
             
         except Exception as e:
             msg = f"Erro crítico durante processo de upload: {e}"
             self.logger.error(f"💥 {msg}")
             
-            import traceback
             error_details = {
                 'error_code': type(e).__name__,
                 'error_stack': traceback.format_exc(),
@@ -882,6 +986,107 @@ class SyncRunner:
             }
             return False, msg, error_details
     
+    def _start_upload_pipeline(self, mapping_name: str, mapping_config: Dict) -> Optional[UploadPipeline]:
+        """
+        Cria o pipeline que envia cada arquivo assim que o writer o fecha.
+        
+        Só é usado com ``pipeline_uploads`` habilitado e fora de dry-run, e não
+        quando há mínimo de registros para upload (a decisão depende do total
+        extraído). Se a extração falhar no meio, os arquivos já enviados não
+        são desfeitos.
+        
+        Args:
+            mapping_name: Nome do mapeamento
+            mapping_config: Configuração do mapeamento
+            
+        Returns:
+            Pipeline de upload, ou None para enviar tudo após a escrita
+        """
+        if not self.config.pipeline_uploads or self.config.dry_run:
+            return None
+        if mapping_config.get('transfer', {}).get('min_records_for_upload', 0) > 0:
+            return None
+        
+        schema_slug = mapping_config.get('schema', {}).get('slug')
+        if not schema_slug:
+            return None  # _upload_files reporta o erro
+        
+        uploader = BatchUploader(self.api, self.token_cache)
+        return uploader.start_pipeline(schema_slug, self._log_upload_progress, mapping_name)
+    
+    def _log_upload_progress(self, filename: str, progress: UploadProgress) -> None:
+        """Callback de progresso do upload."""
+        self.logger.info(f"📈 Upload progress - {filename}: {progress.percentage:.1f}% "
+                         f"({progress.bytes_uploaded}/{progress.total_bytes} bytes)")
+    
+    def _summarize_upload_results(
+        self,
+        results: List[UploadResult],
+        mapping_name: str,
+        start_time: int
+    ) -> Tuple[bool, Optional[str], Optional[Dict], int]:
+        """
+        Analisa os resultados do upload, atualiza métricas e remove os arquivos.
+        
+        Args:
+            results: Resultados do upload
+            mapping_name: Nome do mapeamento
+            start_time: Timestamp do início do upload
+            
+        Returns:
+            Tupla (sucesso, mensagem_erro, detalhes_erro, total_retries)
+        """
+        # Analisa resultados
+        successful_uploads = [r for r in results if r.success]
+        failed_uploads = [r for r in results if not r.success]
+        
+        self.logger.info(f"📊 Resultados do upload: {len(successful_uploads)} sucessos, {len(failed_uploads)} falhas")
+        
+        # Log detalhado dos resultados
+        for result in results:
+            if result.success:
+                self.logger.warning(f"✅ Upload bem-sucedido: {result.file_info.file_path.name} -> upload_id: {result.upload_id}")
+            else:
+                self.logger.warning(f"❌ Upload falhou: {result.file_info.file_path.name} -> erro: {result.error_message}")
+        
+        # Atualiza métricas
+        total_records = sum(result.file_info.record_count for result in successful_uploads)
+        upload_duration = get_current_timestamp() - start_time
+        total_retries = sum(result.retry_count for result in results)
+        self.metrics.update_upload_metrics(
+            files_uploaded=len(successful_uploads), 
+            records_uploaded=total_records,
+            duration=upload_duration,
+            retry_count=total_retries
+        )
+        
+        if len(failed_uploads) == 0:
+            self.logger.warning(f"🎉 Todos os uploads foram bem-sucedidos para: {mapping_name}")
+            error_msg = None
+            error_details = None
+        else:
+            # Coleta mensagens de erro
+            error_msgs = [f"{r.file_info.file_path.name}: {r.error_message}" for r in failed_uploads]
+            error_msg = "; ".join(error_msgs)
+            
+            # Coleta detalhes do primeiro erro para telemetria (priorizando o que tem mais informação)
+            first_failure = failed_uploads[0]
+            error_details = {
+                'error_code': first_failure.error_code,
+                'error_stack': first_failure.error_stack,
+                'error_context': first_failure.error_context
+            }
+            
+            self.logger.warning(f"⚠️ {len(failed_uploads)} upload(s) falharam para {mapping_name}: {error_msg}")
+        
+        # Limpar arquivos temporários após upload (sucesso ou falha)
+        try:
+            cleanup_uploaded_files(results, keep_failed=False)  # Remove todos os arquivos, incluindo os que falharam
+        except Exception as e:
+            self.logger.warning(f"⚠️ Erro durante limpeza de arquivos temporários: {e}")
+        
+        return len(failed_uploads) == 0, error_msg, error_details, total_retries
+    
     def _cleanup_temp_files_for_mapping(self, mapping_name: str) -> None:
         """
         Limpa arquivos temporários específicos de um mapeamento.
@@ -891,22 +1096,25 @@ class SyncRunner:
         """
         try:
             uploads_dir = self.paths.uploads_dir
-            if not uploads_dir.exists():
-                return
             
-            # Procura por arquivos que começam com o nome do mapeamento
-            pattern = f"{mapping_name}_*"
-            files_to_remove = list(uploads_dir.glob(pattern))
+            # Procura por arquivos que começam com o nome do mapeamento; o
+            # scandir já traz o tipo de cada entrada, sem um stat por arquivo
+            prefix = f"{mapping_name}_"
+            try:
+                with os.scandir(uploads_dir) as entries:
+                    files_to_remove = [entry for entry in entries
+                                       if entry.name.startswith(prefix) and entry.is_file()]
+            except FileNotFoundError:
+                return
             
             removed_count = 0
-            for file_path in files_to_remove:
+            for entry in files_to_remove:
                 try:
-                    if file_path.is_file():
-                        file_path.unlink()
-                        removed_count += 1
-                        self.logger.debug(f"Arquivo temporário removido: {file_path.name}")
+                    os.unlink(entry.path)
+                    removed_count += 1
+                    self.logger.debug(f"Arquivo temporário removido: {entry.name}")
                 except Exception as e:
-                    self.logger.warning(f"Erro ao remover arquivo {file_path.name}: {e}")
+                    self.logger.warning(f"Erro ao remover arquivo {entry.name}: {e}")
             
             if removed_count > 0:
                 self.logger.info(f"🧹 Limpeza concluída: {removed_count} arquivos temporários removidos para {mapping_name}")
@@ -916,13 +1124,13 @@ class SyncRunner:
         except Exception as e:
             self.logger.warning(f"Erro durante limpeza de arquivos temporários para {mapping_name}: {e}")
     
-    async def _handle_delete_after_upload(self, mapping_config: Dict, records: List[Dict], mapping_name: str) -> None:
+    async def _handle_delete_after_upload(self, mapping_config: Dict, record_ids: List[Any], mapping_name: str) -> None:
         """
         Deleta registros do banco de dados após upload bem-sucedido, se configurado.
         
         Args:
             mapping_config: Configuração do mapeamento
-            records: Lista de registros que foram enviados
+            record_ids: IDs (coluna pk_column) dos registros que foram enviados
             mapping_name: Nome do mapeamento
         """
         try:
@@ -934,22 +1142,12 @@ class SyncRunner:
                 self.logger.debug(f"🔄 delete_after_upload não está habilitado para {mapping_name}, pulando deleção")
                 return
             
-            if not records:
-                self.logger.debug(f"📊 Nenhum registro para deletar em {mapping_name}")
-                return
-            
             # Identifica a chave primária para deleção
             pk_column = transfer_config.get('pk_column')
             if not pk_column:
                 self.logger.error(f"❌ Coluna de chave primária não configurada para delete_after_upload em {mapping_name}")
                 return
             
-            # Coleta os IDs dos registros para deletar
-            record_ids = []
-            for record in records:
-                if pk_column in record and record[pk_column] is not None:
-                    record_ids.append(record[pk_column])
-            
             if not record_ids:
                 self.logger.warning(f"⚠️ Nenhum ID válido encontrado para deleção em {mapping_name}")
                 return
@@ -957,9 +1155,7 @@ class SyncRunner:
             self.logger.info(f"🗑️ Iniciando deleção de {len(record_ids)} registros de {mapping_name}...")
             
             # Executa a deleção
-            from sync.extractor import delete_records_after_upload
-            
-            delete_result = await asyncio.to_thread(
+            delete_result = await self._run_in_worker(
                 delete_records_after_upload,
                 mapping_config,
                 record_ids,
@@ -982,8 +1178,14 @@ class SyncRunner:
             self.logger.error(f"💥 Erro durante deleção de registros em {mapping_name}: {e}")
             # Não propaga o erro para não falhar a sincronização
 
-    def _update_watermark(self, mapping_config: Dict, records: List[Dict]) -> None:
-        """Atualiza o watermark no arquivo de configuração após sincronização bem-sucedida."""
+    def _update_watermark(self, mapping_config: Dict, max_watermark: Any) -> None:
+        """
+        Atualiza o watermark no arquivo de configuração após sincronização bem-sucedida.
+        
+        Args:
+            mapping_config: Configuração do mapeamento
+            max_watermark: Maior valor da coluna do watermark entre os registros enviados
+        """
         try:
             # Verifica se é sincronização incremental
             transfer_config = mapping_config.get('transfer', {})
@@ -1004,18 +1206,6 @@ class SyncRunner:
                 self.logger.debug(f"📊 Coluna de watermark não configurada para modo {incremental_mode}, pulando atualização")
                 return
             
-            if not records:
-                self.logger.debug(f"📊 Nenhum registro para atualizar watermark")
-                return
-            
-            # Encontra o maior valor da coluna watermark nos registros
-            max_watermark = None
-            for record in records:
-                if watermark_column in record and record[watermark_column] is not None:
-                    current_value = record[watermark_column]
-                    if max_watermark is None or current_value > max_watermark:
-                        max_watermark = current_value
-            
             if max_watermark is None:
                 self.logger.warning(f"⚠️ Não foi possível encontrar valor válido para watermark na coluna '{watermark_column}'")
                 return
@@ -1029,7 +1219,6 @@ class SyncRunner:
                 return
             
             # Lê o arquivo atual
-            import json
             with open(mapping_file, 'r', encoding='utf-8') as f:
                 config_data = json.load(f)
             
@@ -1050,11 +1239,27 @@ class SyncRunner:
             # Não propaga o erro para não falhar a sincronização
     
     def _get_available_mappings(self) -> List[str]:
-        """Retorna a lista de mapeamentos disponíveis."""
+        """
+        Retorna a lista de mapeamentos disponíveis.
+        
+        A listagem fica em cache enquanto o mtime do diretório de mapeamentos
+        não mudar (criar, remover ou renomear arquivos altera o mtime).
+        """
         try:
-            mapping_files = self.paths.list_mapping_files()
-            # Converte Path objects para strings (apenas o nome do arquivo sem extensão)
-            return [path.stem for path in mapping_files]
+            stat = _stat_or_none(self.paths.mappings_dir)
+            if stat is None:
+                return []
+            
+            cached = self._available_mappings_cache
+            if cached and cached[0] == stat.st_mtime_ns:
+                return list(cached[1])
+            
+            # Nome do arquivo sem a extensão .json; o scandir evita um stat por entrada
+            with os.scandir(self.paths.mappings_dir) as entries:
+                names = [entry.name[:-5] for entry in entries
+                         if entry.name.endswith('.json') and entry.is_file()]
+            self._available_mappings_cache = (stat.st_mtime_ns, names)
+            return list(names)
         except Exception as e:
             self.logger.error(f"Erro ao listar mapeamentos: {e}")
             return []
@@ -1096,7 +1301,11 @@ async def run_sync_command(
         Lista de resultados das sincronizações
     """
     logger = logging.getLogger(__name__)
-    logger.info(f"[DEBUG] run_sync_command iniciado com mapping_names: {mapping_names}, all_mappings: {all_mappings}, dry_run: {dry_run}")
+    logger.debug("run_sync_command iniciado com mapping_names: %s, all_mappings: %s, dry_run: %s",
+                 mapping_names, all_mappings, dry_run)
+    
+    # Datasources são carregadas uma vez por execução
+    clear_source_config_cache()
     
     # Enviar heartbeat único por execução do comando
     try:
@@ -1124,29 +1333,24 @@ async def run_sync_command(
         logger.warning(f"Falha no heartbeat inicial do comando: {e}")
 
     try:
-        logger.info(f"[DEBUG] Verificando config...")
         if not config:
-            logger.info(f"[DEBUG] Criando nova config...")
             config = SyncConfig(
                 dry_run=dry_run,
                 force_full_sync=force
             )
-            logger.info(f"[DEBUG] Config criada: {config}")
-        
-        logger.info(f"[DEBUG] Prestes a criar SyncRunner...")
-        runner = create_sync_runner(config)
-        logger.info(f"[DEBUG] SyncRunner criado com sucesso")
+            logger.debug("Config criada: %s", config)
         
-        if all_mappings:
-            logger.info(f"[DEBUG] Executando sync_all_mappings")
-            return await runner.sync_all_mappings()
-        elif mapping_names:
-            logger.info(f"[DEBUG] Executando sync_multiple_mappings com {len(mapping_names)} mapeamentos")
-            return await runner.sync_multiple_mappings(mapping_names, parallel)
-        else:
-            raise ValueError("Especifique mapeamentos ou use --all")
+        async with create_sync_runner(config) as runner:
+            if all_mappings:
+                logger.debug("Executando sync_all_mappings")
+                return await runner.sync_all_mappings()
+            elif mapping_names:
+                logger.debug("Executando sync_multiple_mappings com %d mapeamentos", len(mapping_names))
+                return await runner.sync_multiple_mappings(mapping_names, parallel)
+            else:
+                raise ValueError("Especifique mapeamentos ou use --all")
     except Exception as e:
-        logger.error(f"[DEBUG] Erro em run_sync_command: {e}")
+        logger.error("Erro em run_sync_command: %s", e)
         raise
 
 
@@ -5,6 +5,7 @@ Gerencia o processo de upload com retry, progresso e validação.
 
 import logging
 import time
+import traceback
 import hashlib
 from typing import Dict, Any, List, Optional, Callable
 from pathlib import Path
@@ -496,51 +497,78 @@ class BatchUploader:
         
         with ThreadPoolExecutor(max_workers=self.max_concurrent) as executor:
             # Submete tarefas
-            future_to_file = {}
-            
-            for file_info in files_info:
-                uploader = FileUploader(self.api, self.token_cache, **self.uploader_kwargs)
-                
-                # Callback específico do arquivo
-                file_progress_callback = None
-                if progress_callback:
-                    file_progress_callback = lambda p, fname=file_info.file_path.name: progress_callback(fname, p)
-                
-                future = executor.submit(
-                    uploader.upload_file,
-                    file_info,
-                    schema_slug,
-                    file_progress_callback,
-                    mapping_name
-                )
-                
-                future_to_file[future] = file_info
+            futures = [
+                executor.submit(self._upload_one, file_info, schema_slug, progress_callback, mapping_name)
+                for file_info in files_info
+            ]
             
             # Coleta resultados
-            for future in as_completed(future_to_file):
-                file_info = future_to_file[future]
-                
-                try:
-                    result = future.result()
-                    results.append(result)
-                    
-                    if result.success:
-                        logger.info(f"Upload bem-sucedido: {file_info.file_path.name}")
-                    else:
-                        logger.error(f"Upload falhou: {file_info.file_path.name} - {result.error_message}")
-                        
-                except Exception as e:
-                    logger.error(f"Erro no upload de {file_info.file_path.name}: {e}")
-                    import traceback
-                    results.append(UploadResult(
-                        success=False,
-                        file_info=file_info,
-                        error_message=str(e),
-                        error_code=type(e).__name__,
-                        error_stack=traceback.format_exc()
-                    ))
+            for future in as_completed(futures):
+                results.append(future.result())
+        
+        self._log_batch_summary(results, mapping_name)
+        return results
+    
+    def start_pipeline(self, schema_slug: str,
+                       progress_callback: Optional[Callable[[str, UploadProgress], None]] = None,
+                       mapping_name: str = None) -> 'UploadPipeline':
+        """
+        Cria um pipeline que envia cada arquivo assim que ele é fechado.
+        
+        Args:
+            schema_slug: Slug do schema
+            progress_callback: Callback de progresso (recebe nome do arquivo e progresso)
+            mapping_name: Nome do mapeamento (opcional)
+            
+        Returns:
+            Pipeline de upload; use submit() para cada arquivo e results() ao final
+        """
+        return UploadPipeline(self, schema_slug, progress_callback, mapping_name)
+    
+    def _upload_one(self, file_info: JSONLFileInfo, schema_slug: str,
+                    progress_callback: Optional[Callable[[str, UploadProgress], None]] = None,
+                    mapping_name: str = None) -> UploadResult:
+        """
+        Faz upload de um arquivo, convertendo exceções em resultado de falha.
         
-        # Estatísticas finais
+        Args:
+            file_info: Informações do arquivo
+            schema_slug: Slug do schema
+            progress_callback: Callback de progresso (recebe nome do arquivo e progresso)
+            mapping_name: Nome do mapeamento (opcional)
+            
+        Returns:
+            Resultado do upload
+        """
+        uploader = FileUploader(self.api, self.token_cache, **self.uploader_kwargs)
+        
+        # Callback específico do arquivo
+        file_progress_callback = None
+        if progress_callback:
+            file_progress_callback = lambda p, fname=file_info.file_path.name: progress_callback(fname, p)
+        
+        try:
+            result = uploader.upload_file(file_info, schema_slug, file_progress_callback, mapping_name)
+        except Exception as e:
+            logger.error(f"Erro no upload de {file_info.file_path.name}: {e}")
+            return UploadResult(
+                success=False,
+                file_info=file_info,
+                error_message=str(e),
+                error_code=type(e).__name__,
+                error_stack=traceback.format_exc()
+            )
+        
+        if result.success:
+            logger.info(f"Upload bem-sucedido: {file_info.file_path.name}")
+        else:
+            logger.error(f"Upload falhou: {file_info.file_path.name} - {result.error_message}")
+        
+        return result
+    
+    @staticmethod
+    def _log_batch_summary(results: List[UploadResult], mapping_name: Optional[str]) -> None:
+        """Registra as estatísticas finais de um lote de uploads."""
         successful = sum(1 for r in results if r.success)
         failed = len(results) - successful
         
@@ -548,8 +576,6 @@ class BatchUploader:
             logger.warning(f"📊 Upload em lote concluído para {mapping_name or 'N/A'}: {successful} sucessos, {failed} falhas")
         else:
             logger.info(f"📊 Upload em lote concluído para {mapping_name or 'N/A'}: {successful} sucessos, {failed} falhas")
-        
-        return results
     
     def get_upload_summary(self, results: List[UploadResult]) -> Dict[str, Any]:
         """
@@ -605,6 +631,74 @@ class BatchUploader:
         }
 
 
+class UploadPipeline:
+    """
+    Envia arquivos conforme ficam prontos, sobrepondo upload e escrita em disco.
+    
+    submit() pode ser chamado de qualquer thread (ex.: callback de fechamento do
+    JSONLBatchWriter); results() aguarda os envios pendentes e libera os threads.
+    """
+    
+    def __init__(self, batch_uploader: BatchUploader, schema_slug: str,
+                 progress_callback: Optional[Callable[[str, UploadProgress], None]] = None,
+                 mapping_name: str = None):
+        """
+        Inicializa o pipeline de upload.
+        
+        Args:
+            batch_uploader: Uploader em lote usado para cada arquivo
+            schema_slug: Slug do schema
+            progress_callback: Callback de progresso (recebe nome do arquivo e progresso)
+            mapping_name: Nome do mapeamento (opcional)
+        """
+        self.batch_uploader = batch_uploader
+        self.schema_slug = schema_slug
+        self.progress_callback = progress_callback
+        self.mapping_name = mapping_name
+        self.started_at = get_current_timestamp()
+        self._executor: Optional[ThreadPoolExecutor] = None  # criado no primeiro arquivo
+        self._futures = []
+    
+    def submit(self, file_info: JSONLFileInfo) -> None:
+        """
+        Agenda o upload de um arquivo já fechado.
+        
+        Args:
+            file_info: Informações do arquivo
+        """
+        logger.debug("📤 Arquivo pronto para upload: %s", file_info.file_path.name)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.batch_uploader.max_concurrent,
+                                                thread_name_prefix="bridge-upload")
+        self._futures.append(self._executor.submit(
+            self.batch_uploader._upload_one,
+            file_info,
+            self.schema_slug,
+            self.progress_callback,
+            self.mapping_name
+        ))
+    
+    def results(self) -> List[UploadResult]:
+        """
+        Aguarda os uploads agendados e retorna os resultados na ordem de envio.
+        
+        Returns:
+            Lista de resultados
+        """
+        if self._executor is None:
+            return []
+        
+        try:
+            results = [future.result() for future in self._futures]
+        finally:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._futures = []
+        
+        self.batch_uploader._log_batch_summary(results, self.mapping_name)
+        return results
+
+
 def cleanup_uploaded_files(results: List[UploadResult], keep_failed: bool = True) -> None:
     """
     Remove arquivos que foram enviados com sucesso.
@@ -0,0 +1,95 @@
+"""
+Testes unitários para o módulo sync.connection_pool
+"""
+
+import threading
+
+import pytest
+
+from sync.connection_pool import ConnectionPool
+
+
+class FakeConnection:
+    """Conexão falsa que registra rollback e close"""
+
+    def __init__(self, fail_rollback=False):
+        self.fail_rollback = fail_rollback
+        self.rollbacks = 0
+        self.closed = False
+
+    def rollback(self):
+        self.rollbacks += 1
+        if self.fail_rollback:
+            raise RuntimeError("conexão perdida")
+
+    def close(self):
+        self.closed = True
+
+
+class TestConnectionPool:
+    """Testes para o pool de conexões"""
+
+    def test_reuses_released_connection(self):
+        """Testa que uma conexão devolvida é reaproveitada"""
+        created = []
+        pool = ConnectionPool(lambda: created.append(FakeConnection()) or created[-1], max_size=2)
+
+        first = pool.acquire()
+        pool.release(first)
+        second = pool.acquire()
+
+        assert second is first
+        assert len(created) == 1
+        assert first.rollbacks == 1
+
+    def test_acquire_times_out_when_exhausted(self):
+        """Testa o limite de conexões abertas"""
+        pool = ConnectionPool(FakeConnection, max_size=1)
+        pool.acquire()
+
+        with pytest.raises(TimeoutError):
+            pool.acquire(timeout=0.05)
+
+    def test_waiting_acquire_gets_released_connection(self):
+        """Testa que uma espera é atendida quando outra thread devolve a conexão"""
+        pool = ConnectionPool(FakeConnection, max_size=1)
+        connection = pool.acquire()
+        timer = threading.Timer(0.05, pool.release, args=(connection,))
+        timer.start()
+
+        assert pool.acquire(timeout=2) is connection
+        timer.join()
+
+    def test_failed_rollback_discards_connection(self):
+        """Testa que conexões quebradas não voltam ao pool"""
+        pool = ConnectionPool(lambda: FakeConnection(fail_rollback=True), max_size=1)
+        connection = pool.acquire()
+
+        pool.release(connection)
+
+        assert connection.closed
+        assert pool.stats()["size"] == 0
+
+    def test_reap_idle_closes_old_connections(self):
+        """Testa o fechamento de conexões ociosas"""
+        pool = ConnectionPool(FakeConnection, max_size=2, idle_timeout=0)
+        connection = pool.acquire()
+        pool.release(connection)
+
+        assert pool.reap_idle() == 1
+        assert connection.closed
+        assert pool.stats() == {"size": 0, "idle": 0, "in_use": 0, "max_size": 2}
+
+    def test_close_closes_idle_and_returned_connections(self):
+        """Testa que o fechamento do pool alcança conexões emprestadas"""
+        pool = ConnectionPool(FakeConnection, max_size=2)
+        idle = pool.acquire()
+        borrowed = pool.acquire()
+        pool.release(idle)
+
+        pool.close()
+        pool.release(borrowed)
+
+        assert idle.closed and borrowed.closed
+        with pytest.raises(RuntimeError):
+            pool.acquire()
@@ -0,0 +1,676 @@
+"""
+Testes unitários para o módulo sync.extractor
+"""
+
+import asyncio
+import os
+import socket
+import sqlite3
+import tempfile
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+from sync.extractor import (
+    ExtractorFactory,
+    ResolvedSourceConfig,
+    SQLiteExtractor,
+    _CopyJsonSink,
+    _fetch_ahead,
+    build_sql_query,
+    build_sql_query_with_params,
+    delete_records_after_upload,
+    _fix_dict_rows,
+    _prefetch_batches,
+    _probe_tcp,
+    _quote_identifier,
+    _converter_for_type_code,
+    _extract_partitioned,
+    _partition_count,
+    _rows_to_records,
+    _rows_to_records_with_converters,
+    extract_mapping_data,
+    extract_many,
+    stream_mapping_data,
+    test_source_connection as check_source_connection,
+)
+
+
+def _create_sqlite_db(rows):
+    """Cria um banco SQLite temporário com a tabela `items`"""
+    fd, db_path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, updated_at TEXT)")
+    conn.executemany("INSERT INTO items (id, name, updated_at) VALUES (?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+def _sqlite_mapping(db_path, **transfer):
+    """Monta uma configuração de mapeamento mínima para SQLite"""
+    return {
+        "name": "items",
+        "source": {"type": "sqlite", "database": db_path},
+        "table": "items",
+        "transfer": {"incremental_mode": "full", **transfer},
+    }
+
+
+class PooledSQLiteExtractor(SQLiteExtractor):
+    """Extrator SQLite que obtém as conexões do pool compartilhado"""
+
+    def connect(self):
+        def _open():
+            connection = sqlite3.connect(self.config["database"], check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            return connection
+
+        self.connection = self._acquire_connection(_open, {"database": self.config["database"]})
+        return True
+
+    def disconnect(self):
+        self._release_connection()
+
+
+@pytest.fixture
+def sqlite_db():
+    rows = [(i, f"item {i}", f"2024-01-{i:02d} 00:00:00") for i in range(1, 11)]
+    db_path = _create_sqlite_db(rows)
+    yield db_path
+    os.unlink(db_path)
+
+
+class TestExtractMappingData:
+    """Testes para a extração de dados de mapeamentos"""
+
+    def test_full_extraction_sqlite(self, sqlite_db):
+        """Testa a extração completa de uma tabela SQLite"""
+        result = extract_mapping_data(_sqlite_mapping(sqlite_db), batch_size=3)
+
+        assert result.success
+        assert result.record_count == 10
+        assert result.data[0] == {"id": 1, "name": "item 1", "updated_at": "2024-01-01 00:00:00"}
+        assert 0 < result.extraction_time < 60
+
+    def test_failure_result_without_table(self, sqlite_db):
+        """Testa o resultado de falha quando a query não pode ser construída"""
+        mapping = _sqlite_mapping(sqlite_db)
+        del mapping["table"]
+
+        result = extract_mapping_data(mapping)
+
+        assert not result.success
+        assert result.error_message == "Não foi possível construir a query SQL"
+        assert result.end_time >= result.start_time
+
+    def test_full_extraction_with_prealloc(self, sqlite_db):
+        """Testa a extração com lista pré-alocada pela contagem"""
+        result = extract_mapping_data(_sqlite_mapping(sqlite_db, prealloc=True), batch_size=4)
+
+        assert result.success
+        assert result.record_count == 10
+        assert [r["id"] for r in result.data] == list(range(1, 11))
+
+    def test_prealloc_with_count_over_drops_total_column(self, sqlite_db):
+        """Testa que a contagem via COUNT(*) OVER() não vaza para os registros"""
+        result = extract_mapping_data(_sqlite_mapping(sqlite_db, prealloc=True, order_by="id"), batch_size=3)
+
+        assert result.record_count == 10
+        assert all("_bridge_total" not in record for record in result.data)
+        assert [r["id"] for r in result.data] == list(range(1, 11))
+
+    def test_parallel_partitions(self, sqlite_db):
+        """Testa a extração paralela em faixas da PK"""
+        mapping = _sqlite_mapping(sqlite_db, pk_column="id", parallel_partitions=3)
+
+        result = extract_mapping_data(mapping, batch_size=2)
+
+        assert result.success
+        assert sorted(r["id"] for r in result.data) == list(range(1, 11))
+
+    def test_parallel_partitions_incremental_pk(self, sqlite_db):
+        """Testa que a extração paralela respeita o watermark"""
+        mapping = _sqlite_mapping(sqlite_db, incremental_mode="incremental_pk", pk_column="id",
+                                  initial_watermark="6", parallel_partitions=2)
+
+        result = extract_mapping_data(mapping, batch_size=2)
+
+        assert sorted(r["id"] for r in result.data) == [7, 8, 9, 10]
+
+    def test_parallel_partition_failure_is_raised(self, monkeypatch):
+        """Testa que a falha de uma partição não encerra a extração como sucesso"""
+        rows = [(i, f"item {i}", "2024-01-01 00:00:00") for i in range(1, 301)]
+        db_path = _create_sqlite_db(rows)
+        original = SQLiteExtractor.extract_data
+
+        def extract_data(self, query, batch_size=1000, params=None):
+            if params and params[0] > 200:
+                raise RuntimeError("falha na partição")
+            return original(self, query, batch_size, params)
+
+        monkeypatch.setattr(SQLiteExtractor, "extract_data", extract_data)
+        mapping = _sqlite_mapping(db_path, pk_column="id", parallel_partitions=3)
+        try:
+            with pytest.raises(RuntimeError, match="falha na partição"):
+                for _ in stream_mapping_data(mapping, batch_size=10):
+                    pass
+
+            result = extract_mapping_data(mapping, batch_size=10)
+        finally:
+            os.unlink(db_path)
+
+        assert not result.success
+        assert "falha na partição" in result.error_message
+
+    def test_parallel_partitions_limited_by_pool(self, sqlite_db):
+        """Testa que as partições cabem no pool mesmo pedindo mais que pool_max"""
+        mapping = _sqlite_mapping(sqlite_db, pk_column="id", parallel_partitions=4)
+        extractor = PooledSQLiteExtractor({"database": sqlite_db, "pool_max": 2})
+
+        partitions = _partition_count(extractor, mapping)
+        with extractor:
+            batches = _extract_partitioned(extractor, mapping, "sqlite", 3, partitions)
+            records = [r for batch in batches for r in batch]
+
+        assert partitions == 2
+        assert sorted(r["id"] for r in records) == list(range(1, 11))
+        assert extractor._pool is None and extractor.connection is None
+
+    def test_count_only_extraction(self, sqlite_db):
+        """Testa a extração que apenas conta os registros"""
+        result = extract_mapping_data(_sqlite_mapping(sqlite_db), batch_size=4, collect=False)
+
+        assert result.success
+        assert result.record_count == 10
+        assert result.data == []
+
+    def test_extract_many_preserves_order(self, sqlite_db):
+        """Testa que extract_many retorna os resultados na ordem das configurações"""
+        configs = [
+            _sqlite_mapping(sqlite_db),
+            {**_sqlite_mapping(sqlite_db), "query": "SELECT * FROM items WHERE id <= 2"},
+        ]
+
+        results = asyncio.run(extract_many(configs, batch_size=5))
+
+        assert [r.record_count for r in results] == [10, 2]
+        assert all(r.success for r in results)
+
+    def test_stream_yields_batches(self, sqlite_db):
+        """Testa a extração em lotes sem acumular o resultado"""
+        batches = list(stream_mapping_data(_sqlite_mapping(sqlite_db), batch_size=4))
+
+        assert [len(batch) for batch in batches] == [4, 4, 2]
+        assert [r["id"] for batch in batches for r in batch] == list(range(1, 11))
+
+    def test_stream_raises_without_table(self, sqlite_db):
+        """Testa que a extração em lotes lança erro quando a query não pode ser construída"""
+        mapping = _sqlite_mapping(sqlite_db)
+        del mapping["table"]
+
+        with pytest.raises(RuntimeError, match="query SQL"):
+            next(stream_mapping_data(mapping))
+
+
+class TestExtractorFactory:
+    """Testes para a criação de extratores"""
+
+    def test_source_type_is_case_insensitive(self):
+        """Testa que o tipo da fonte não diferencia maiúsculas"""
+        assert isinstance(ExtractorFactory.create_extractor("SQLite", {"database": ":memory:"}), SQLiteExtractor)
+
+    def test_unsupported_type_lists_available(self):
+        """Testa a mensagem de erro com os tipos disponíveis"""
+        with pytest.raises(ValueError, match="Disponíveis: sqlserver, postgresql"):
+            ExtractorFactory.create_extractor("oracle", {})
+
+
+class TestConnectionPoolKey:
+    """Testes para o compartilhamento de pools entre extratores"""
+
+    def _connected_pool(self, config):
+        extractor = PooledSQLiteExtractor(config)
+        extractor.connect()
+        pool = extractor._pool
+        extractor.disconnect()
+        return pool
+
+    def test_same_settings_share_pool(self, sqlite_db):
+        """Testa que configurações idênticas usam o mesmo pool"""
+        config = {"database": sqlite_db, "pool_max": 3}
+
+        assert self._connected_pool(config) is self._connected_pool(dict(config))
+
+    @pytest.mark.parametrize("override", [{"pool_max": 2}, {"pool_idle_timeout": 10}])
+    def test_pool_settings_split_pools(self, sqlite_db, override):
+        """Testa que pools com limites diferentes não são compartilhados"""
+        config = {"database": sqlite_db, "pool_max": 3}
+
+        assert self._connected_pool(config) is not self._connected_pool({**config, **override})
+
+    def test_connect_args_split_pools(self):
+        """Testa que parâmetros de conexão diferentes geram chaves diferentes"""
+        extractor = ExtractorFactory.create_extractor("postgresql", {"host": "localhost"})
+        base = {"host": "localhost", "charset": "utf8mb4", "read_timeout": 30}
+
+        key = extractor._pool_key(base, 5, 300.0)
+        assert key == extractor._pool_key(dict(reversed(list(base.items()))), 5, 300.0)
+        assert key != extractor._pool_key({**base, "charset": "latin1"}, 5, 300.0)
+        assert key != extractor._pool_key({**base, "read_timeout": 60}, 5, 300.0)
+
+
+class TestResolvedSourceConfig:
+    """Testes para a configuração resolvida de fontes do store"""
+
+    def test_behaves_like_source_dict(self):
+        """Testa que a configuração responde como o dicionário equivalente"""
+        config = ResolvedSourceConfig("mysql", "db.local", 3306, "shop", "app", "secret")
+
+        assert dict(config) == {
+            "type": "mysql", "host": "db.local", "port": 3306,
+            "database": "shop", "username": "app", "password": "secret",
+        }
+        assert config.get("driver") is None
+        assert config.get("fast_fail", False) is False
+        assert "schema" not in config
+
+    def test_is_immutable(self):
+        """Testa que a configuração compartilhada não pode ser alterada"""
+        config = ResolvedSourceConfig("postgresql", "db.local", 5432, "shop", "app", "secret", schema="sales")
+
+        assert config["schema"] == "sales"
+        with pytest.raises(AttributeError):
+            config.host = "other"
+
+
+class TestDeleteRecords:
+    """Testes para a deleção após o upload"""
+
+    def test_delete_quotes_identifiers(self):
+        """Testa a deleção em tabela com nome de palavra reservada"""
+        fd, db_path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        conn = sqlite3.connect(db_path)
+        conn.execute('CREATE TABLE "order" ("group" INTEGER PRIMARY KEY)')
+        conn.executemany('INSERT INTO "order" VALUES (?)', [(1,), (2,), (3,)])
+        conn.commit()
+        conn.close()
+        try:
+            mapping = {"source": {"type": "sqlite", "database": db_path}, "table": "order"}
+
+            result = delete_records_after_upload(mapping, [1, 3], "group")
+
+            assert result.success
+            assert result.deleted_count == 2
+        finally:
+            os.unlink(db_path)
+
+
+class TestRecordCounts:
+    """Testes para contagem de registros"""
+
+    def test_get_record_counts_bulk(self, sqlite_db):
+        """Testa a contagem de várias queries em uma única consulta"""
+        queries = [
+            "SELECT * FROM items",
+            "SELECT * FROM items WHERE id > 7",
+            "SELECT * FROM items WHERE id > 100",
+        ]
+
+        with SQLiteExtractor({"database": sqlite_db}) as extractor:
+            assert extractor.get_record_counts_bulk(queries) == [10, 3, 0]
+            assert extractor.get_record_counts_bulk([]) == []
+
+    def test_get_record_count_async_uses_separate_connection(self, sqlite_db):
+        """Testa a contagem em segundo plano sem ocupar a conexão da extração"""
+        with SQLiteExtractor({"database": sqlite_db}) as extractor:
+            future = extractor.get_record_count_async("SELECT * FROM items WHERE id > ?", (4,))
+            batches = list(extractor.extract_data("SELECT * FROM items", batch_size=5))
+
+            assert future.result(timeout=5) == 6
+            assert sum(len(batch) for batch in batches) == 10
+
+    def test_extract_data_json(self, sqlite_db):
+        """Testa a extração já serializada em linhas JSON"""
+        with SQLiteExtractor({"database": sqlite_db}) as extractor:
+            batches = list(extractor.extract_data_json("SELECT id, name FROM items WHERE id <= 3", batch_size=2))
+
+        assert batches == [[b'{"id":1,"name":"item 1"}', b'{"id":2,"name":"item 2"}'], [b'{"id":3,"name":"item 3"}']]
+
+    def test_get_record_counts_bulk_fallback(self, sqlite_db):
+        """Testa o fallback por query quando a consulta combinada falha"""
+        queries = ["SELECT * FROM items", "SELECT * FROM missing_table"]
+
+        with SQLiteExtractor({"database": sqlite_db}) as extractor:
+            assert extractor.get_record_counts_bulk(queries) == [10, 0]
+
+
+    def test_get_record_counts_bulk_fallback_after_aborted_transaction(self, sqlite_db):
+        """Testa que o fallback desfaz a transação abortada pela consulta combinada"""
+        queries = ["SELECT * FROM items", "SELECT * FROM missing_table", "SELECT * FROM items WHERE id <= 3"]
+
+        with SQLiteExtractor({"database": sqlite_db}) as extractor:
+            extractor.connection = AbortingConnection(extractor.connection)
+            assert extractor.get_record_counts_bulk(queries) == [10, 0, 3]
+
+
+class AbortingConnection:
+    """Conexão que, como no PostgreSQL, rejeita comandos após um erro até o rollback"""
+
+    def __init__(self, connection):
+        self._connection = connection
+        self.aborted = False
+
+    def cursor(self):
+        return AbortingCursor(self, self._connection.cursor())
+
+    def rollback(self):
+        self.aborted = False
+        self._connection.rollback()
+
+    def close(self):
+        self._connection.close()
+
+
+class AbortingCursor:
+    """Cursor que marca a transação como abortada quando um comando falha"""
+
+    def __init__(self, owner, cursor):
+        self._owner = owner
+        self._cursor = cursor
+
+    def execute(self, query, *params):
+        if self._owner.aborted:
+            raise sqlite3.OperationalError("current transaction is aborted")
+        try:
+            return self._cursor.execute(query, *params)
+        except sqlite3.Error:
+            self._owner.aborted = True
+            raise
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class TestPrefetchBatches:
+    """Testes para a thread produtora de lotes"""
+
+    def test_preserves_order(self):
+        """Testa que os lotes chegam na ordem original"""
+        batches = ([{"id": i}] for i in range(20))
+
+        assert [b[0]["id"] for b in _prefetch_batches(batches)] == list(range(20))
+
+    def test_propagates_producer_error(self):
+        """Testa que erros da produtora são relançados no consumidor"""
+        def failing():
+            yield [{"id": 1}]
+            raise RuntimeError("falha no banco")
+
+        consumed = []
+        with pytest.raises(RuntimeError, match="falha no banco"):
+            for batch in _prefetch_batches(failing()):
+                consumed.append(batch)
+        assert consumed == [[{"id": 1}]]
+
+    def test_early_exit_closes_source(self):
+        """Testa que parar o consumo fecha o iterador de origem"""
+        closed = []
+
+        def source():
+            try:
+                for i in range(100):
+                    yield [{"id": i}]
+            finally:
+                closed.append(True)
+
+        iterator = _prefetch_batches(source())
+        assert next(iterator) == [{"id": 0}]
+        iterator.close()
+
+        assert closed == [True]
+
+
+class FakeCursor:
+    """Cursor falso que entrega as linhas em lotes via fetchmany"""
+
+    def __init__(self, total):
+        self.rows = [(i,) for i in range(total)]
+        self.fetches = 0
+
+    def fetchmany(self, size):
+        self.fetches += 1
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        return batch
+
+
+class TestFetchAhead:
+    """Testes para a busca antecipada de lotes do cursor"""
+
+    def test_yields_all_batches_in_order(self):
+        """Testa que os lotes do cursor chegam completos e em ordem"""
+        batches = list(_fetch_ahead(FakeCursor(7), 3))
+
+        assert batches == [[(0,), (1,), (2,)], [(3,), (4,), (5,)], [(6,)]]
+
+    def test_close_stops_fetching(self):
+        """Testa que fechar o iterador encerra a thread antes do fim do cursor"""
+        cursor = FakeCursor(1000)
+        fetched = _fetch_ahead(cursor, 1, maxsize=1)
+
+        assert next(fetched) == [(0,)]
+        fetched.close()
+
+        assert cursor.fetches < 10
+
+
+class TestRowConversion:
+    """Testes para a conversão de linhas em registros"""
+
+    def test_rows_to_records_converts_special_types(self):
+        """Testa a conversão de datetime e bytes mantendo os demais tipos"""
+        rows = [(1, "a", Decimal("1.50"), None, datetime(2024, 1, 2, 3, 4, 5), b"bin", date(2024, 1, 2))]
+        columns = ["id", "name", "price", "empty", "created_at", "raw", "day"]
+
+        assert _rows_to_records(columns, rows) == [{
+            "id": 1,
+            "name": "a",
+            "price": Decimal("1.50"),
+            "empty": None,
+            "created_at": "2024-01-02T03:04:05",
+            "raw": "bin",
+            "day": "2024-01-02",
+        }]
+
+    def test_fix_dict_rows_only_touches_listed_keys(self):
+        """Testa que apenas as colunas indicadas são convertidas"""
+        rows = [{"id": 1, "created_at": datetime(2024, 1, 2), "raw": b"x"}]
+
+        assert _fix_dict_rows(rows, ["created_at"]) == [
+            {"id": 1, "created_at": "2024-01-02T00:00:00", "raw": b"x"}
+        ]
+
+
+class TestConnectionProbe:
+    """Testes para o teste de alcance TCP"""
+
+    def test_probe_tcp_open_port(self):
+        """Testa o probe contra uma porta aberta local"""
+        with socket.socket() as server:
+            server.bind(("127.0.0.1", 0))
+            server.listen(1)
+            port = server.getsockname()[1]
+
+            assert _probe_tcp("127.0.0.1", port, timeout=1)
+
+    def test_source_connection_fails_fast_on_closed_port(self):
+        """Testa que o teste de conexão falha sem carregar o driver"""
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+
+        ok, message = check_source_connection({"type": "postgresql", "host": "127.0.0.1", "port": port})
+
+        assert not ok
+        assert "inacessível" in message
+
+
+class TestBuildSqlQuery:
+    """Testes para a construção automática de queries"""
+
+    def test_quote_identifier_per_dialect(self):
+        """Testa a delimitação de identificadores por dialeto"""
+        assert _quote_identifier("orders", "mysql") == "`orders`"
+        assert _quote_identifier("orders", "postgresql") == '"orders"'
+        assert _quote_identifier("orders", "sqlserver") == "[orders]"
+        assert _quote_identifier("orders") == "`orders`"
+        assert _quote_identifier("sales.orders", "postgresql") == '"sales"."orders"'
+
+    def test_connectorx_types_use_base_dialect(self):
+        """Testa que os tipos *_cx seguem o dialeto do banco de origem"""
+        mapping = {
+            "table": "orders",
+            "transfer": {"incremental_mode": "incremental_pk", "pk_column": "id", "initial_watermark": "5"},
+        }
+
+        assert _quote_identifier("orders", "postgresql_cx") == '"orders"'
+        assert build_sql_query_with_params(mapping, "sqlserver_cx") == (
+            "SELECT * FROM [orders] WHERE [id] > ? ORDER BY [id] ASC", (5,)
+        )
+
+    def test_quote_identifier_escapes_closing_quote(self):
+        """Testa que o caractere de fechamento é duplicado no nome"""
+        assert _quote_identifier("we`ird", "mysql") == "`we``ird`"
+        assert _quote_identifier("we]ird", "sqlserver") == "[we]]ird]"
+
+    def test_incremental_pk_query_sqlserver(self):
+        """Testa a query incremental por PK no dialeto do SQL Server"""
+        mapping = {
+            "table": "orders",
+            "transfer": {"incremental_mode": "incremental_pk", "pk_column": "id", "initial_watermark": "10"},
+        }
+
+        assert build_sql_query(mapping, "sqlserver") == "SELECT * FROM [orders] WHERE [id] > 10 ORDER BY [id] ASC"
+
+    def test_incremental_pk_query_with_params(self):
+        """Testa que o watermark vai como parâmetro e não como literal"""
+        mapping = {
+            "table": "orders",
+            "transfer": {"incremental_mode": "incremental_pk", "pk_column": "id", "initial_watermark": "10"},
+        }
+
+        assert build_sql_query_with_params(mapping, "sqlserver") == (
+            "SELECT * FROM [orders] WHERE [id] > ? ORDER BY [id] ASC", (10,)
+        )
+        assert build_sql_query_with_params(mapping, "postgresql")[0] == (
+            'SELECT * FROM "orders" WHERE "id" > %s ORDER BY "id" ASC'
+        )
+
+    def test_incremental_extraction_binds_watermark(self, sqlite_db):
+        """Testa a extração incremental com o watermark parametrizado"""
+        mapping = _sqlite_mapping(sqlite_db, incremental_mode="incremental_timestamp",
+                                  timestamp_column="updated_at", initial_watermark="2024-01-08 00:00:00")
+
+        result = extract_mapping_data(mapping, batch_size=5)
+
+        assert [r["id"] for r in result.data] == [9, 10]
+
+    def test_query_with_total(self):
+        """Testa a inclusão da contagem total via função de janela"""
+        mapping = {"table": "orders", "transfer": {"incremental_mode": "full"}}
+
+        assert build_sql_query(mapping, "postgresql", with_total=True) == (
+            'SELECT "orders".*, COUNT(*) OVER() AS _bridge_total FROM "orders"'
+        )
+
+    def test_default_dialect_keeps_backticks(self):
+        """Testa que sem tipo de fonte a query mantém crases"""
+        mapping = {"table": "orders", "transfer": {"incremental_mode": "full", "order_by": "id"}}
+
+        assert build_sql_query(mapping) == "SELECT * FROM `orders` ORDER BY `id` ASC"
+
+    def test_rows_to_records_with_converters(self):
+        """Testa a conversão guiada pelos tipos declarados no cursor"""
+        columns = ["id", "created_at", "raw"]
+        converters = [_converter_for_type_code(t) for t in (int, datetime, bytearray)]
+        rows = [(1, datetime(2024, 1, 2), b"abc"), (2, None, None)]
+
+        assert converters[0] is None
+        assert _rows_to_records_with_converters(columns, rows, converters) == [
+            {"id": 1, "created_at": "2024-01-02T00:00:00", "raw": "abc"},
+            {"id": 2, "created_at": None, "raw": None},
+        ]
+
+    def test_rows_to_records_without_converters(self):
+        """Testa o caminho rápido quando nenhuma coluna precisa de conversão"""
+        converters = [_converter_for_type_code(t) for t in (int, str)]
+
+        assert _rows_to_records_with_converters(["id", "name"], [(1, "a")], converters) == [{"id": 1, "name": "a"}]
+
+
+class TestCopyJsonSink:
+    """Testes para o destino do COPY em formato texto"""
+
+    def test_parses_lines_across_chunks(self):
+        """Testa o agrupamento em lotes com linhas quebradas entre escritas"""
+        batches = []
+        sink = _CopyJsonSink(2, batches.append)
+
+        sink.write('{"id": 1, "price": 1.50}\n{"id": 2, "na')
+        sink.write('me": "a\\\\"b"}\n')
+        sink.write(b'{"id": 3, "when": "2024-01-02T00:00:00"}\n')
+        sink.finish()
+
+        assert batches == [
+            [{"id": 1, "price": Decimal("1.50")}, {"id": 2, "name": 'a"b'}],
+            [{"id": 3, "when": "2024-01-02T00:00:00"}],
+        ]
+
+    def test_unescapes_control_characters(self):
+        """Testa colunas json formatadas e escapes JSON dentro de strings"""
+        batches = []
+        sink = _CopyJsonSink(10, batches.append)
+
+        # Quebras de linha e tabs fora de strings (coluna json formatada) chegam
+        # escapadas pelo COPY; o escape JSON "\n" dentro de string chega como "\\n"
+        sink.write('{"id":1,"payload":{"a":\\n\\t1}}\n')
+        sink.write('{"id":2,"text":"a\\\\nb","path":"c:\\\\\\\\dir"}\n')
+        sink.write('{"id":3,"payload":{"b":\\r\\n 2}}\n')
+        sink.finish()
+
+        assert batches == [[
+            {"id": 1, "payload": {"a": 1}},
+            {"id": 2, "text": "a\nb", "path": "c:\\dir"},
+            {"id": 3, "payload": {"b": 2}},
+        ]]
+
+
+class FakeDescriptionCursor:
+    """Cursor falso que só informa a descrição das colunas"""
+
+    def __init__(self, description):
+        self.description = description
+        self.queries = []
+
+    def execute(self, query, params=None):
+        self.queries.append(query)
+
+    def close(self):
+        pass
+
+
+class TestPostgreSQLCopyMode:
+    """Testes para a escolha entre COPY e cursor no PostgreSQL"""
+
+    @pytest.mark.parametrize("type_code, expected", [(25, True), (17, False)])
+    def test_copy_skipped_for_bytea_columns(self, type_code, expected):
+        """Testa que resultados com bytea seguem pelo cursor"""
+        extractor = ExtractorFactory.create_extractor("postgresql", {"host": "localhost"})
+        cursor = FakeDescriptionCursor([("id", 23), ("data", type_code)])
+        extractor.connection = type("FakeConnection", (), {"cursor": lambda self: cursor})()
+
+        assert extractor._copy_supported("SELECT * FROM items") is expected
+        assert cursor.queries == ["SELECT * FROM (SELECT * FROM items) AS copy_probe LIMIT 0"]
@@ -0,0 +1,218 @@
+"""
+Testes unitários para o módulo sync.jsonl_writer
+"""
+
+import gzip
+import hashlib
+import json
+from dataclasses import FrozenInstanceError
+from decimal import Decimal
+
+import pytest
+
+from sync.jsonl_writer import (
+    JSONLBatchWriter,
+    JSONLWriter,
+    _iter_chunked_lines,
+    validate_jsonl_file,
+)
+
+
+def _read_lines(path):
+    """Lê as linhas de um arquivo JSONL (comprimido ou não)"""
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rb") as f:
+        return f.read().splitlines()
+
+
+class TestJSONLWriter:
+    """Testes para o escritor de arquivos JSONL"""
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_write_records(self, tmp_path, compress):
+        """Testa a escrita de registros com e sem compressão"""
+        records = [{"id": 1, "name": "ação", "price": Decimal("1.50")}, {"id": 2, "name": None}]
+
+        with JSONLWriter("items", "items", output_dir=tmp_path, compress=compress) as writer:
+            writer.write_batch(records)
+
+        lines = _read_lines(writer.file_path)
+        assert [json.loads(line) for line in lines] == [
+            {"id": 1, "name": "ação", "price": 1.5},
+            {"id": 2, "name": None},
+        ]
+        assert writer.record_count == 2
+
+    def test_checksum_matches_uncompressed_content(self, tmp_path):
+        """Testa que o checksum cobre exatamente o conteúdo gravado"""
+        writer = JSONLWriter("items", "items", output_dir=tmp_path, compress=False)
+        writer.open()
+        writer.write_record({"id": 1})
+        writer.write_record({"id": 2})
+        info = writer.close()
+
+        assert info.checksum == hashlib.sha256(writer.file_path.read_bytes()).hexdigest()
+        assert info.record_count == 2
+
+    def test_checksum_algorithm(self, tmp_path):
+        """Testa o checksum com outro algoritmo do hashlib"""
+        with JSONLBatchWriter("items", "items", output_dir=tmp_path, compress=False,
+                              max_records_per_file=2, checksum_algorithm="md5") as writer:
+            writer.write_batch([{"id": i} for i in range(3)])
+            files = writer.close()
+
+        assert [info.checksum for info in files] == [
+            hashlib.md5(info.file_path.read_bytes()).hexdigest() for info in files
+        ]
+
+    def test_file_info_is_immutable(self, tmp_path):
+        """Testa que as informações do arquivo não podem ser alteradas"""
+        writer = JSONLWriter("items", "items", output_dir=tmp_path, compress=False)
+        writer.open()
+        info = writer.close()
+
+        with pytest.raises(FrozenInstanceError):
+            info.record_count = 10
+        assert info.to_dict()["record_count"] == 0
+
+    def test_write_from_iterator_in_chunks(self, tmp_path):
+        """Testa a escrita acumulada de um iterador em vários blocos"""
+        writer = JSONLWriter("items", "items", output_dir=tmp_path, compress=False)
+        writer.open()
+        writer.write_from_iterator(({"id": i} for i in range(25)), batch_size=4, chunk_bytes=32)
+        info = writer.close()
+
+        ids = [json.loads(line)["id"] for line in _read_lines(writer.file_path)]
+        assert ids == list(range(25))
+        assert info.record_count == 25
+        assert info.checksum == hashlib.sha256(writer.file_path.read_bytes()).hexdigest()
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_async_io_matches_sync_output(self, tmp_path, compress):
+        """Testa que o thread de escrita gera o mesmo conteúdo e checksum"""
+        records = [{"id": i, "name": f"item {i}"} for i in range(50)]
+        infos = []
+        for async_io in (False, True):
+            writer = JSONLWriter("items", f"async{async_io}", output_dir=tmp_path,
+                                 compress=compress, async_io=async_io)
+            writer.open()
+            for i in range(0, len(records), 7):
+                writer.write_batch(records[i:i + 7])
+            writer.write_record({"id": 50})
+            infos.append(writer.close())
+
+        sync_info, async_info = infos
+        assert _read_lines(async_info.file_path) == _read_lines(sync_info.file_path)
+        assert async_info.checksum == sync_info.checksum
+        assert async_info.record_count == 51
+
+    def test_async_io_propagates_write_errors(self, tmp_path):
+        """Testa que erros do thread de escrita chegam ao produtor"""
+        writer = JSONLWriter("items", "items", output_dir=tmp_path, compress=False, async_io=True)
+        writer.open()
+        writer.file_handle.close()  # força a falha na escrita
+
+        writer.write_record({"id": 1})
+        with pytest.raises(ValueError):
+            writer.close()
+
+
+class TestJSONLBatchWriter:
+    """Testes para o escritor JSONL com rotação de arquivos"""
+
+    def test_rotates_by_record_count(self, tmp_path):
+        """Testa a rotação de arquivos pelo número de registros"""
+        with JSONLBatchWriter("items", "items", output_dir=tmp_path, compress=False,
+                              max_records_per_file=3) as writer:
+            writer.write_batch([{"id": i} for i in range(7)])
+            files = writer.close()
+
+        assert [info.record_count for info in files] == [3, 3, 1]
+        names = [info.file_path.name for info in files]
+        assert len(set(names)) == 3
+        assert names[0].startswith("items_part001_items_")
+        ids = [json.loads(line)["id"] for info in files for line in _read_lines(info.file_path)]
+        assert ids == list(range(7))
+
+    def test_rotates_by_bytes_written(self, tmp_path):
+        """Testa a rotação pelo tamanho contado em memória"""
+        with JSONLBatchWriter("items", "items", output_dir=tmp_path, compress=False,
+                              max_file_size=18) as writer:
+            writer.rotation_check_interval = 1
+            for i in range(4):
+                writer.write_record({"id": i})  # 9 bytes por linha
+            files = writer.close()
+
+        assert [info.record_count for info in files] == [2, 2]
+        assert all(info.file_size == 18 for info in files)
+
+    def test_size_checked_every_interval(self, tmp_path):
+        """Testa que o tamanho só é verificado a cada intervalo, mas o limite de registros é exato"""
+        with JSONLBatchWriter("items", "items", output_dir=tmp_path, compress=False,
+                              max_file_size=18, max_records_per_file=5) as writer:
+            writer.rotation_check_interval = 3
+            for i in range(7):
+                writer.write_record({"id": i})
+            files = writer.close()
+
+        assert [info.record_count for info in files] == [3, 3, 1]
+
+    def test_write_batch_bytes(self, tmp_path):
+        """Testa a escrita de linhas já serializadas com rotação"""
+        with JSONLBatchWriter("items", "items", output_dir=tmp_path, compress=False,
+                              max_records_per_file=2) as writer:
+            writer.write_batch_bytes([b'{"id":1}', b'{"id":2}', b'{"id":3}'])
+            files = writer.close()
+
+        assert [info.record_count for info in files] == [2, 1]
+        assert files[0].file_path.read_bytes() == b'{"id":1}\n{"id":2}\n'
+
+    def test_on_file_closed(self, tmp_path):
+        """Testa a notificação de cada arquivo assim que ele é fechado"""
+        closed = []
+        with JSONLBatchWriter("items", "items", output_dir=tmp_path, compress=False,
+                              max_records_per_file=2, on_file_closed=closed.append) as writer:
+            writer.write_batch([{"id": i} for i in range(3)])
+            assert [info.record_count for info in closed] == [2]
+            files = writer.close()
+
+        assert closed == files
+
+    def test_on_file_closed_skipped_on_error(self, tmp_path):
+        """Testa que arquivos de uma escrita interrompida não são notificados"""
+        closed = []
+        with pytest.raises(RuntimeError):
+            with JSONLBatchWriter("items", "items", output_dir=tmp_path, compress=False,
+                                  on_file_closed=closed.append) as writer:
+                writer.write_batch([{"id": 1}])
+                raise RuntimeError("falha na extração")
+
+        assert closed == []
+        assert len(writer.created_files) == 1
+
+
+class TestValidateJSONLFile:
+    """Testes para a validação de arquivos JSONL"""
+
+    def test_valid_and_invalid_lines(self, tmp_path):
+        """Testa a contagem de registros e o relato de linhas inválidas"""
+        path = tmp_path / "data.jsonl"
+        path.write_bytes(b'{"id": 1}\n\n{"id": 2}\n{broken\n')
+
+        result = validate_jsonl_file(path)
+
+        assert result["record_count"] == 2
+        assert not result["valid"]
+        assert result["errors"][0].startswith("Linha 4")
+
+    def test_lines_split_across_chunks(self, tmp_path):
+        """Testa linhas que atravessam o limite entre blocos lidos"""
+        path = tmp_path / "data.jsonl.gz"
+        with gzip.open(path, "wb") as f:
+            f.write(b"".join(b'{"id": %d}\n' % i for i in range(100)) + b'{"id": 100}')
+
+        with gzip.open(path, "rb") as f:
+            lines = list(_iter_chunked_lines(f, chunk_size=7))
+
+        assert len(lines) == 101
+        assert validate_jsonl_file(path)["record_count"] == 101
@@ -0,0 +1,44 @@
+"""
+Testes unitários para o módulo core.mapping_state_store
+"""
+
+import json
+
+from core.mapping_state_store import MappingStateStore
+
+
+class TestMappingStateStore:
+    """Testes para o store de estados dos mapeamentos"""
+
+    def _count_saves(self, store, monkeypatch):
+        """Conta as escritas do arquivo de estados"""
+        saves = []
+        original = store._save_states
+        monkeypatch.setattr(store, "_save_states", lambda: (saves.append(1), original()))
+        return saves
+
+    def test_new_mapping_saved_once_per_step(self, tmp_path, monkeypatch):
+        """Testa que início e fim de um mapeamento novo gravam uma vez cada"""
+        store = MappingStateStore(state_file=tmp_path / "state.json")
+        saves = self._count_saves(store, monkeypatch)
+
+        store.start_sync("orders")
+        store.finish_sync("orders", 10, success=True)
+
+        assert len(saves) == 2
+        data = json.loads((tmp_path / "state.json").read_text(encoding="utf-8"))
+        assert data["orders"]["last_batch_records"] == 10
+        assert data["orders"]["is_running"] is False
+
+    def test_finish_sync_error(self, tmp_path):
+        """Testa o fim com erro e o reaproveitamento via finish_sync_error"""
+        store = MappingStateStore(state_file=tmp_path / "state.json")
+        store.start_sync("orders")
+        store.finish_sync_success("orders", 5)
+
+        store.finish_sync_error("orders", "falha no upload")
+
+        state = MappingStateStore(state_file=tmp_path / "state.json").get_state("orders")
+        assert state.last_error == "falha no upload"
+        assert state.total_records_processed == 5
+        assert state.is_running is False
@@ -0,0 +1,321 @@
+"""
+Testes unitários para o módulo sync.metrics
+"""
+
+import threading
+import time
+from dataclasses import asdict
+
+from core.timeutil import get_current_timestamp
+from sync import metrics as metrics_module
+from sync.metrics import (
+    MetricsCollector,
+    MetricsStorage,
+    SyncMetrics,
+    SystemMetrics,
+    _iter_lines_reversed,
+    format_metrics_report,
+    get_metrics_collector,
+    save_metrics_on_exit,
+)
+from sync.serialization import loads
+
+
+class TestMetricsCollector:
+    """Testes para o coletor de métricas"""
+
+    def test_sync_lifecycle(self):
+        """Testa o ciclo de início, atualização e finalização de uma sincronização"""
+        collector = MetricsCollector()
+        collector.start_sync_metrics("clientes", "clientes")
+
+        collector.update_extraction_metrics(100, 2)
+        collector.update_writing_metrics(100, 1, 2048, 1)
+        collector.update_upload_metrics(1, 100, 3, retry_count=1)
+        collector.update_deletion_metrics(100, "clientes")
+        completed = collector.finish_sync_metrics(success=True)
+
+        assert completed.records_extracted == 100
+        assert completed.total_file_size == 2048
+        assert completed.retry_count == 1
+        assert completed.records_deleted == 100
+        assert collector.current_sync is None
+        assert list(collector.sync_metrics) == [completed]
+        assert collector.get_current_metrics()["recent_syncs"] == [completed.snapshot()]
+
+    def test_current_metrics_snapshot(self):
+        """Testa o resumo da sincronização atual com o tempo decorrido"""
+        collector = MetricsCollector()
+        collector.current_sync = SyncMetrics(mapping_name="clientes", schema_slug="s",
+                                             start_time=get_current_timestamp() - 30,
+                                             records_extracted=7)
+
+        current = collector.get_current_metrics()["current_sync"]
+
+        assert current["records_extracted"] == 7
+        assert current["elapsed_time"] >= 30
+        assert "error_message" not in current
+        assert "Registros extraídos: 7" in format_metrics_report({"current_sync": current})
+
+    def test_finish_summarizes_last_system_samples(self):
+        """Testa o pico de memória e a CPU média das últimas 10 amostras"""
+        collector = MetricsCollector()
+        for i in range(15):
+            collector.system_metrics.append(SystemMetrics(
+                timestamp=i, cpu_percent=float(i), memory_percent=0,
+                memory_used_mb=float(100 - i), disk_usage_percent=0, disk_free_gb=0,
+            ))
+        collector.start_sync_metrics("clientes", "clientes")
+
+        completed = collector.finish_sync_metrics()
+
+        assert completed.peak_memory_mb == 95.0
+        assert completed.avg_cpu_percent == 9.5
+
+    def test_collect_system_metrics_does_not_block(self):
+        """Testa que a coleta não espera pela medição de CPU e reaproveita o uso de disco"""
+        collector = MetricsCollector()
+
+        started = time.monotonic()
+        first = collector.collect_system_metrics()
+        second = collector.collect_system_metrics()
+
+        assert time.monotonic() - started < 0.5
+        assert first.memory_used_mb > 0
+        assert second.disk_free_gb == first.disk_free_gb
+        assert len(collector.system_metrics) == 2
+
+    def test_performance_summary_from_hourly_stats(self):
+        """Testa o resumo de performance a partir dos agregados por hora"""
+        collector = MetricsCollector()
+        for records, success in [(100, True), (50, False)]:
+            collector.start_sync_metrics("clientes", "clientes")
+            collector.update_extraction_metrics(records, 1)
+            collector.update_writing_metrics(records, 1, 1024 * 1024, 1)
+            collector.finish_sync_metrics(success=success)
+        collector.current_sync = SyncMetrics(mapping_name="antigo", schema_slug="s",
+                                             start_time=get_current_timestamp() - 48 * 3600)
+        collector.finish_sync_metrics()
+
+        summary = collector.get_performance_summary(hours=24)
+
+        assert summary["total_syncs"] == 2
+        assert summary["successful_syncs"] == 1
+        assert summary["success_rate"] == 50
+        assert summary["total_records"] == 150
+        assert summary["total_size_mb"] == 2
+        assert collector.get_performance_summary(hours=72)["total_syncs"] == 3
+        assert collector.get_performance_summary(hours=1000)["total_syncs"] == 3
+
+    def test_to_dict_matches_asdict(self):
+        """Testa que to_dict gera o mesmo dicionário que dataclasses.asdict"""
+        metrics = SyncMetrics(mapping_name="clientes", schema_slug="s", start_time=1,
+                              records_extracted=5, error_message="falha")
+        sample = SystemMetrics(timestamp=1, cpu_percent=1.5, memory_percent=2.0,
+                               memory_used_mb=3.0, disk_usage_percent=4.0, disk_free_gb=5.0)
+
+        assert metrics.to_dict() == asdict(metrics)
+        assert sample.to_dict() == asdict(sample)
+
+    def test_error_analysis_groups_by_message_prefix(self):
+        """Testa o agrupamento de erros pelo texto antes do primeiro ':'"""
+        collector = MetricsCollector()
+        for message in ["Timeout: host a", "Timeout: host b", "Falha geral"]:
+            collector.start_sync_metrics("clientes", "clientes")
+            collector.finish_sync_metrics(success=False, error_message=message)
+
+        analysis = collector.get_error_analysis()
+
+        assert analysis["total_errors"] == 3
+        assert analysis["error_types"] == {"Timeout": 2, "Falha geral": 1}
+        assert list(analysis["error_types"]) == ["Timeout", "Falha geral"]
+        assert analysis["error_type_total"] == 2
+        assert analysis["affected_mappings"] == ["clientes"]
+
+    def test_daily_stats_use_local_date(self):
+        """Testa a chave de data das estatísticas diárias, inclusive na virada do dia"""
+        collector = MetricsCollector()
+        midnight = int(time.mktime((2024, 3, 10, 0, 0, 0, 0, 0, -1)))
+        for start_time in (midnight - 1, midnight, midnight + 3600, midnight - 2):
+            collector.current_sync = SyncMetrics(mapping_name="m", schema_slug="s", start_time=start_time)
+            collector.finish_sync_metrics()
+
+        assert collector.daily_stats["2024-03-09"].syncs_count == 2
+        assert collector.daily_stats["2024-03-10"].syncs_count == 2
+        assert collector.daily_stats["2024-03-10"].to_dict() == {
+            "syncs_count": 2, "total_records": 0, "total_files": 0,
+            "total_size": 0, "success_count": 2, "error_count": 0,
+        }
+
+    def test_background_collection(self):
+        """Testa a coleta periódica em thread separado"""
+        collector = MetricsCollector(collection_interval=0.01)
+
+        collector.start_collecting()
+        collector.start_collecting()  # idempotente
+        deadline = time.monotonic() + 2
+        while len(collector.system_metrics) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        collector.stop_collecting()
+        collected = len(collector.system_metrics)
+        time.sleep(0.05)
+
+        assert collected >= 2
+        assert len(collector.system_metrics) == collected
+
+    def test_updates_without_current_sync_are_ignored(self):
+        """Testa que atualizações fora de uma sincronização não falham"""
+        collector = MetricsCollector()
+
+        collector.update_extraction_metrics(10, 1)
+
+        assert collector.finish_sync_metrics() is None
+
+
+class TestMetricsStorage:
+    """Testes para o armazenamento de métricas"""
+
+    def test_saved_metrics_are_buffered_until_flush(self, tmp_path):
+        """Testa que as métricas ficam em buffer e são lidas após o flush"""
+        storage = MetricsStorage(storage_dir=tmp_path)
+        metrics = SyncMetrics(mapping_name="clientes", schema_slug="clientes",
+                              start_time=get_current_timestamp(), success=True)
+
+        storage.save_sync_metrics(metrics)
+        assert not storage.metrics_file.exists()
+
+        loaded = storage.load_sync_metrics(days=1)
+
+        assert loaded == [metrics]
+        assert storage.metrics_file.exists()
+
+    def test_cleanup_keeps_recent_and_invalid_lines(self, tmp_path):
+        """Testa a remoção de métricas antigas preservando linhas inválidas"""
+        storage = MetricsStorage(storage_dir=tmp_path)
+        now = get_current_timestamp()
+        storage.save_sync_metrics(SyncMetrics(mapping_name="antigo", schema_slug="s", start_time=now - 100 * 86400))
+        storage.save_sync_metrics(SyncMetrics(mapping_name="recente", schema_slug="s", start_time=now))
+        storage.flush()
+        with open(storage.metrics_file, "ab") as f:
+            f.write(b"{quebrado\n")
+
+        storage.cleanup_old_metrics(days=90)
+
+        lines = storage.metrics_file.read_bytes().splitlines()
+        assert len(lines) == 2
+        assert lines[1] == b"{quebrado"
+        assert [m.mapping_name for m in storage.load_sync_metrics(days=1)] == ["recente"]
+
+    def test_load_reads_backwards_until_cutoff(self, tmp_path):
+        """Testa a leitura reversa, mantendo a ordem do arquivo"""
+        storage = MetricsStorage(storage_dir=tmp_path)
+        now = get_current_timestamp()
+        for name, age_days in [("velho", 60), ("meio", 5), ("novo", 0)]:
+            storage.save_sync_metrics(SyncMetrics(mapping_name=name, schema_slug="s",
+                                                  start_time=now - age_days * 86400))
+
+        assert [m.mapping_name for m in storage.load_sync_metrics(days=30)] == ["meio", "novo"]
+
+    def test_daily_stats_saved_only_when_changed(self, tmp_path):
+        """Testa a gravação das estatísticas diárias somente após novas sincronizações"""
+        storage = MetricsStorage(storage_dir=tmp_path)
+        collector = MetricsCollector()
+
+        save_metrics_on_exit(collector, storage)
+        assert not storage.daily_stats_file.exists()
+
+        collector.start_sync_metrics("clientes", "clientes")
+        collector.finish_sync_metrics(success=True)
+        save_metrics_on_exit(collector, storage)
+
+        saved = storage.load_daily_stats()
+        assert [stats["syncs_count"] for stats in saved.values()] == [1]
+        assert not collector.daily_stats_dirty
+        assert not storage.daily_stats_file.with_suffix(".tmp").exists()
+
+    def test_cleanup_drops_old_prefix_without_reading_it(self, tmp_path):
+        """Testa a limpeza com vários registros antigos antes do corte"""
+        storage = MetricsStorage(storage_dir=tmp_path)
+        now = get_current_timestamp()
+        for age_days in range(120, -1, -1):
+            storage.save_sync_metrics(SyncMetrics(mapping_name=f"d{age_days}", schema_slug="s",
+                                                  start_time=now - age_days * 86400 + 60))
+
+        storage.cleanup_old_metrics(days=90)
+
+        names = [loads(line)["mapping_name"] for line in storage.metrics_file.read_bytes().splitlines()]
+        assert names == [f"d{age}" for age in range(90, -1, -1)]
+
+    def test_cleanup_without_old_metrics_keeps_file(self, tmp_path):
+        """Testa que a limpeza não reescreve o arquivo sem métricas antigas"""
+        storage = MetricsStorage(storage_dir=tmp_path)
+        storage.save_sync_metrics(SyncMetrics(mapping_name="novo", schema_slug="s",
+                                              start_time=get_current_timestamp()))
+        storage.flush()
+        before = storage.metrics_file.stat().st_ino
+
+        storage.cleanup_old_metrics(days=90)
+
+        assert storage.metrics_file.stat().st_ino == before
+        assert not storage.metrics_file.with_suffix(".tmp").exists()
+
+
+class TestIterLinesReversed:
+    """Testes para a leitura reversa de linhas"""
+
+    def test_lines_across_blocks(self, tmp_path):
+        """Testa linhas que atravessam o limite entre blocos"""
+        path = tmp_path / "data.jsonl"
+        path.write_bytes(b"".join(b"linha %d\n" % i for i in range(50)))
+
+        with open(path, "rb") as f:
+            lines = [line for line in _iter_lines_reversed(f, block_size=7) if line]
+
+        assert lines == [b"linha %d" % i for i in reversed(range(50))]
+
+
+class TestGlobalInstances:
+    """Testes para as instâncias globais"""
+
+    def test_collector_created_once_under_concurrency(self, monkeypatch):
+        """Testa que acessos simultâneos recebem a mesma instância"""
+        monkeypatch.setattr(metrics_module, "_metrics_collector", None)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(get_metrics_collector()))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(collector) for collector in results}) == 1
+        assert get_metrics_collector() is results[0]
+
+
+class TestFormatMetricsReport:
+    """Testes para a formatação do relatório de métricas"""
+
+    def test_report_layout(self):
+        """Testa o texto gerado para sistema e sincronizações recentes"""
+        report = format_metrics_report({
+            "system": {"cpu_percent": 12.34, "memory_percent": 50.0, "memory_used_mb": 2048.4,
+                       "disk_usage_percent": 70.0, "disk_free_gb": 10.25},
+            "recent_syncs": [{"success": True, "mapping_name": "clientes",
+                              "records_extracted": 10, "duration": None}],
+        })
+
+        assert report == (
+            "=== RELATÓRIO DE MÉTRICAS ===\n"
+            "\n"
+            "Sistema:\n"
+            "  CPU: 12.3%\n"
+            "  Memória: 50.0% (2048 MB)\n"
+            "  Disco: 70.0% (10.2 GB livres)\n"
+            "\n"
+            "Sincronizações Recentes:\n"
+            "  ✓ clientes - 10 registros (N/A)\n"
+        )
+
+    def test_empty_report(self):
+        """Testa o relatório sem dados"""
+        assert format_metrics_report({}) == "=== RELATÓRIO DE MÉTRICAS ===\n"
@@ -0,0 +1,77 @@
+"""
+Testes unitários para o módulo sync.serialization
+"""
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+
+from sync import serialization
+from sync.serialization import dumps_indented, dumps_line, dumps_record, json_default, loads
+
+
+class TestSerialization:
+    """Testes para a serialização de registros"""
+
+    def test_dumps_record_special_types(self):
+        """Testa a serialização de tipos vindos dos drivers"""
+        record = {
+            "price": Decimal("1.50"),
+            "created_at": datetime(2024, 1, 2, 3, 4, 5),
+            "day": date(2024, 1, 2),
+            "raw": b"bin",
+            "uid": UUID("12345678-1234-5678-1234-567812345678"),
+            "name": "ação",
+        }
+
+        line = dumps_record(record)
+
+        assert isinstance(line, bytes)
+        assert b"\n" not in line
+        assert json.loads(line) == {
+            "price": 1.5,
+            "created_at": "2024-01-02T03:04:05",
+            "day": "2024-01-02",
+            "raw": "bin",
+            "uid": "12345678-1234-5678-1234-567812345678",
+            "name": "ação",
+        }
+
+    def test_loads_roundtrip(self):
+        """Testa a leitura de volta de uma linha serializada"""
+        assert loads(dumps_record({"id": 1, "tags": ["a", "b"]})) == {"id": 1, "tags": ["a", "b"]}
+
+    def test_stdlib_fallback_matches(self, monkeypatch):
+        """Testa que o fallback para json gera a mesma linha compacta"""
+        record = {"id": 1, "price": Decimal("2.5"), "name": "ação", "at": datetime(2024, 1, 2)}
+        expected = dumps_record(record)
+
+        monkeypatch.setattr(serialization, "ORJSON_AVAILABLE", False)
+
+        assert dumps_record(record) == expected
+
+    def test_dumps_line_appends_newline(self, monkeypatch):
+        """Testa a linha JSONL completa com orjson e com o fallback"""
+        record = {"id": 1, "name": "ação"}
+        expected = dumps_record(record) + b"\n"
+
+        assert dumps_line(record) == expected
+        monkeypatch.setattr(serialization, "ORJSON_AVAILABLE", False)
+        assert dumps_line(record) == expected
+
+    def test_dumps_indented_matches_fallback(self, monkeypatch):
+        """Testa o JSON indentado com orjson e com o fallback"""
+        data = {"2024-03-10": {"syncs_count": 2, "name": "ação"}}
+        expected = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+        assert dumps_indented(data) == expected
+        monkeypatch.setattr(serialization, "ORJSON_AVAILABLE", False)
+        assert dumps_indented(data) == expected
+
+    def test_json_default_rejects_unknown_types(self):
+        """Testa que tipos desconhecidos continuam gerando erro"""
+        with pytest.raises(TypeError):
+            json_default(object())